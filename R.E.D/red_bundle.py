@@ -1,16 +1,23 @@
 #!/usr/bin/env python3
+import atexit
 import importlib
-import importlib.abc
 import importlib.util
 import io
+import marshal
 import os
 import sys
-import zipfile
-import base64
+
+# base64, hashlib and zipfile are imported lazily (a warm start served from the
+# sidecar code cache never needs them); importlib.abc is avoided because it pulls
+# in importlib.resources, which costs more than everything else at startup.
 
 _BUNDLE_CACHE = None
+_BUNDLE_ZIP = None
+_BUNDLE_DIGEST = None
 _BUNDLE_MODULE_MAP = None
 _BUNDLE_FILE_MAP = None
+_BUNDLE_CODE = {}
+_BUNDLE_CODE_DIRTY = False
 _BUNDLE_B64 = ""
 _BUNDLE_BUILDING = False
 
@@ -21,12 +28,66 @@ def _read_bundle_bytes() -> bytes:
         return _BUNDLE_CACHE
     if not _BUNDLE_B64:
         raise RuntimeError("bundle payload not found")
+    import base64
+
     _BUNDLE_CACHE = base64.b64decode(_BUNDLE_B64.encode("ascii"))
     return _BUNDLE_CACHE
 
 
-def _open_bundle_zip() -> zipfile.ZipFile:
-    return zipfile.ZipFile(io.BytesIO(_read_bundle_bytes()), "r")
+def _open_bundle_zip():
+    global _BUNDLE_ZIP
+    if _BUNDLE_ZIP is None:
+        import zipfile
+
+        _BUNDLE_ZIP = zipfile.ZipFile(io.BytesIO(_read_bundle_bytes()), "r")
+    return _BUNDLE_ZIP
+
+
+def _bundle_digest() -> bytes:
+    global _BUNDLE_DIGEST
+    if _BUNDLE_DIGEST is None:
+        import hashlib
+
+        _BUNDLE_DIGEST = hashlib.sha256(_BUNDLE_B64.encode("ascii")).digest()
+    return _BUNDLE_DIGEST
+
+
+def _sidecar_path() -> str:
+    base = os.path.splitext(os.path.basename(os.path.abspath(__file__)))[0]
+    name = "%s.%s.bundle" % (base, sys.implementation.cache_tag)
+    return os.path.join(_script_dir(), "__pycache__", name)
+
+
+def _load_sidecar() -> bool:
+    global _BUNDLE_MODULE_MAP, _BUNDLE_FILE_MAP
+    header = importlib.util.MAGIC_NUMBER + _bundle_digest()
+    try:
+        with open(_sidecar_path(), "rb") as f:
+            if f.read(len(header)) != header:
+                return False
+            cached = marshal.loads(f.read())
+    except (OSError, ValueError, EOFError, TypeError):
+        return False
+    _BUNDLE_MODULE_MAP = cached["modules"]
+    _BUNDLE_FILE_MAP = cached["files"]
+    _BUNDLE_CODE.update(cached["code"])
+    return True
+
+
+def _save_sidecar(path: str) -> None:
+    temp_path = "%s.%d.tmp" % (path, os.getpid())
+    cached = {"modules": _BUNDLE_MODULE_MAP, "files": _BUNDLE_FILE_MAP, "code": _BUNDLE_CODE}
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temp_path, "wb") as f:
+            f.write(importlib.util.MAGIC_NUMBER + _bundle_digest())
+            f.write(marshal.dumps(cached))
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
 
 
 def _build_bundle_maps():
@@ -39,19 +100,25 @@ def _build_bundle_maps():
     module_map = {}
     file_map = {}
     try:
-        with _open_bundle_zip() as zf:
-            for name in zf.namelist():
-                if not name.lower().endswith(".py"):
-                    continue
-                base = name.split("/")[-1]
-                mod_name = base[:-3]
-                file_map[base] = name
-                if mod_name.isidentifier():
-                    module_map[mod_name] = name
+        if _load_sidecar():
+            return
+        for name in _open_bundle_zip().namelist():
+            if not name.lower().endswith(".py"):
+                continue
+            base = name.split("/")[-1]
+            mod_name = base[:-3]
+            file_map[base] = name
+            if mod_name.isidentifier():
+                module_map[mod_name] = name
     finally:
         _BUNDLE_BUILDING = False
-    _BUNDLE_MODULE_MAP = module_map
-    _BUNDLE_FILE_MAP = file_map
+    if _BUNDLE_MODULE_MAP is None:
+        _BUNDLE_MODULE_MAP = module_map
+        _BUNDLE_FILE_MAP = file_map
+
+
+def _get_zip_source(zip_name: str) -> str:
+    return _open_bundle_zip().read(zip_name).decode("utf8", errors="replace")
 
 
 def _get_module_source(name: str) -> str:
@@ -59,9 +126,7 @@ def _get_module_source(name: str) -> str:
     zip_name = _BUNDLE_MODULE_MAP.get(name)
     if not zip_name:
         raise ModuleNotFoundError("module not in bundle: %s" % name)
-    with _open_bundle_zip() as zf:
-        data = zf.read(zip_name)
-    return data.decode("utf8", errors="replace")
+    return _get_zip_source(zip_name)
 
 
 def _get_file_source(filename: str) -> str:
@@ -69,12 +134,23 @@ def _get_file_source(filename: str) -> str:
     zip_name = _BUNDLE_FILE_MAP.get(filename)
     if not zip_name:
         raise FileNotFoundError("file not in bundle: %s" % filename)
-    with _open_bundle_zip() as zf:
-        data = zf.read(zip_name)
-    return data.decode("utf8", errors="replace")
+    return _get_zip_source(zip_name)
+
 
+def _get_bundle_code(label: str, get_source, name: str):
+    global _BUNDLE_CODE_DIRTY
+    code = _BUNDLE_CODE.get(label)
+    if code is None:
+        code = compile(get_source(name), label, "exec")
+        if not _BUNDLE_CODE_DIRTY:
+            # written once at exit so a cold start does not rewrite it per module
+            _BUNDLE_CODE_DIRTY = True
+            atexit.register(_save_sidecar, _sidecar_path())
+        _BUNDLE_CODE[label] = code
+    return code
 
-class _BundleLoader(importlib.abc.Loader):
+
+class _BundleLoader:
     def __init__(self, fullname: str):
         self._fullname = fullname
 
@@ -82,16 +158,17 @@ class _BundleLoader(importlib.abc.Loader):
         return None
 
     def exec_module(self, module):
-        source = _get_module_source(self._fullname)
-        code = compile(source, "<bundle:%s>" % self._fullname, "exec")
-        module.__file__ = "<bundle:%s>" % self._fullname
+        label = "<bundle:%s>" % self._fullname
+        code = _get_bundle_code(label, _get_module_source, self._fullname)
+        module.__file__ = label
         module.__package__ = ""
         exec(code, module.__dict__)
 
 
-class _BundleFinder(importlib.abc.MetaPathFinder):
+class _BundleFinder:
     def find_spec(self, fullname, path, target=None):
-        if _BUNDLE_BUILDING:
+        # bundle modules are all top level; submodule lookups are never ours
+        if path is not None or _BUNDLE_BUILDING:
             return None
         _build_bundle_maps()
         if fullname in _BUNDLE_MODULE_MAP:
@@ -124,8 +201,7 @@ def _run_bundle_file(filename: str, argv):
     prev_argv = sys.argv
     try:
         sys.argv = [filename] + list(argv)
-        source = _get_file_source(filename)
-        code = compile(source, "<bundle:%s>" % filename, "exec")
+        code = _get_bundle_code("<bundle:%s>" % filename, _get_file_source, filename)
         module_globals = {"__name__": "__main__", "__file__": filename}
         exec(code, module_globals)
     finally:
@@ -173,47 +249,76 @@ def _prompt_local_dir(label: str) -> str:
         return path
 
 
-def _batch_encrypt(folder_path: str) -> None:
-    inputs = []
-    for name in sorted(os.listdir(folder_path)):
-        path = os.path.join(folder_path, name)
-        if not os.path.isfile(path):
-            continue
-        ext = os.path.splitext(name)[1].lower()
-        if ext in (".py", ".pyc"):
-            inputs.append(path)
-
+def _run_batch(job: str, folder_path: str, workers: int = 0, timeout: float = 0) -> None:
+    _install_bundle_importer()
+    batch = importlib.import_module("batch")
+    inputs = batch.collect_inputs(folder_path, job)
     if not inputs:
-        print("[!] No .py/.pyc files found in that folder.")
+        if job == "encrypt":
+            print("[!] No .py/.pyc files found in that folder.")
+        else:
+            print("[!] No encrypted files found in that folder.")
         return
 
-    for path in inputs:
-        print("[i] encrypt: %s" % os.path.basename(path))
-        _run_module_main("encrypt", [path])
+    results = batch.run_batch(job, inputs, workers=workers, timeout=timeout)
+    report_path = os.path.join(folder_path, "%s_report.txt" % job)
+    print(batch.write_report(report_path, results))
+    print("[i] report: %s" % report_path)
 
 
-def _batch_decrypt(folder_path: str) -> None:
-    inputs = []
-    skip_ext = {".py", ".pyc", ".out"}
-    for name in sorted(os.listdir(folder_path)):
-        path = os.path.join(folder_path, name)
-        if not os.path.isfile(path):
-            continue
-        ext = os.path.splitext(name)[1].lower()
-        if ext in skip_ext:
-            continue
-        inputs.append(path)
+def _batch_encrypt(folder_path: str, workers: int = 0, timeout: float = 0) -> None:
+    _run_batch("encrypt", folder_path, workers=workers, timeout=timeout)
 
-    if not inputs:
-        print("[!] No encrypted files found in that folder.")
-        return
 
-    for path in inputs:
-        print("[i] decrypt: %s" % os.path.basename(path))
-        _run_module_main("decrypt", [path])
+def _batch_decrypt(folder_path: str, workers: int = 0, timeout: float = 0) -> None:
+    _run_batch("decrypt", folder_path, workers=workers, timeout=timeout)
+
+
+_BENCH_SCRIPT = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "sys.path.insert(0, sys.argv[1])\n"
+    "import red_bundle\n"
+    "red_bundle._install_bundle_importer()\n"
+    "import decrypt, encrypt, batch\n"
+    "print(time.perf_counter() - start)\n"
+)
+
+
+def _bench_startup(runs: int = 5) -> None:
+    import subprocess
+
+    def run_once() -> float:
+        out = subprocess.run(
+            [sys.executable, "-c", _BENCH_SCRIPT, _script_dir()], stdout=subprocess.PIPE, check=True
+        ).stdout
+        return float(out.decode("ascii").strip())
+
+    sidecar = _sidecar_path()
+    cold = []
+    warm = []
+    for _ in range(runs):
+        try:
+            os.remove(sidecar)
+        except OSError:
+            pass
+        cold.append(run_once())
+        warm.append(run_once())
+    cold.sort()
+    warm.sort()
+    print("[i] startup (import decrypt/encrypt/batch), median of %d runs" % runs)
+    print("[i] cold (no sidecar): %.1f ms" % (cold[runs // 2] * 1000))
+    print("[i] warm (sidecar):    %.1f ms" % (warm[runs // 2] * 1000))
 
 
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--bench-startup":
+        _bench_startup(int(sys.argv[2]) if len(sys.argv) > 2 else 5)
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == "--selftest":
+        _run_module_main("rotor_compat", sys.argv[2:])
+        _run_module_main("script_index", sys.argv[2:])
+        return
     _install_bundle_importer()
     while True:
         print("\nRAIC Menu")
@@ -244,7 +349,10 @@ def main():
 
 
 _BUNDLE_B64 = """
-UEsDBBQAAAAIADSJSFyf+3UCEI8AAKNqAwAbAAAANzg1XzE3NTI0NDY2ODc2NTE5ODgyMzkzLnB57L37d9s4kjD6+5wz/wPHPv1JmZblRzrdae96v1VkOdG2X2vJSfdkcngokZLYpkgNSdlR9537t9+qAkCCJPiUnPTuHZyZtEUSBaBQKBQK9djX1u7UW642jvW99mj5ge252svuj92TP/9pX7vdhAv4PdmE1tQzreiDiRFY2kn3B639/cnJ8fEL/PbcQji2Y5nazPeWp6IyfNY9fq21TWtmrJ2wo/XWc+34pXZydPJdRzs+Pn11dPrdqxcawvj4tt/Xeq7pe7aptY/hkx9Ovnvd0b5dzT34d+Jh/W+dEH8sHXyGPTE1aMZ/dXLy+viHF1rfMVxo4HX3qIsgB8uJZZrYKeia5hpL61Q7vA9gIIeuFVpQ/fDcm66XlhsGh0+e/3A4McLQsea+t3bN4HAONVaOsTn0LQe/DvAPfbr2fahxGHqeExyujHC6OAyt5eowmPr2KjzkiOquNn/+k71ceX6oIaCXZkf7zbEnHa2vY3862q+B5/75T9e3P+nvB3ej4c21fjG8HOjXvauBdqa13NWDLmBNPXdmz1t//pNvPdqPhmO7v1rTMAiNcB3AtxeGE1h//tOf/zR1jCDQ7thHbW+CX704/fOfNCi6bgdD1w5tqP4bICWqhi//E2HZ06UF82ayRzBpmh193xZgsNgzzfVC0U43BVn6EMu+drbDkoZ9efP27fD6rXZxf90fAw5H2gGQ48x2YYS2G9hAubyb2szzNc+fGy4Nn4g6CP31NFz71pfrcrqlt443gc453nxuA/GymV77MBtIHfK3by9v3vQudRixfjUYv7s5RyqBerrl+57fSgMeWaEWevIX+HMNqxfJsRVok7XthAe2G7Ut1umLPFC+YZt2EME5t4Op55vakzVZeN6DgFM0XiSqOY1Yh6/bSysIjLn1IkUyWPb29rIPU8iaAQNDPGnhwgg13wpWuCoUiAqsMMz0DMs5G/EpjifQIlRp7RSOXmSr9pzQ8l2Yp0dgKwwzWjuFEkU15bhCf6NAAUN+zzS1j3f2b+v1Gqn9k7bygb4/4yQYjqNxFAbq6kDzS+Bplqnz75BmEtC+gfn8RkBRA1E/BSagoMiziEpyBoSFfdHOdE6BLiwWsKkCaPtiFhEl0RTmfx99UqkD1ueptQq1Af0Hac0ItLze5E8j6+edRcQRLiyNkdk6QDKu1efk7A3u7m7ugNFJi+qUTynwtrb1Ig+lqVEVdHuFWwp0HnYLZ2JMH7QAdi831GaG7QDnhA3Y2SAxxIvHDgPLmdEHQRkz4KRQzAhUjMbyiaGb1mTNmMGBFhgzC2lgiuvCcDehvbRqLje+YS/CcAV7deE3a9/J/YR3VIdvcMEhuOD08NBk44DtfHlorOxD/llwePzy9fffv3794+uTH19/9/3rH344+eHw/ePDanX++un4/eBD79F6+bdg+vjriXnj344Xly/DnydrV5+6g+Obk4enH//r5Nfz2eVPI39kms5P7sn11es779Zqqbu3MjaOZ6AI8HsLNpwQprN1KnjAP/M5iW4aoQG12NC78B/LxX20zQHmENvCMkwQZKi5PmvuYLxZWdBmy1gBoqe02x1+Pnh6ejrAhg4i0GYrpz/Qbxcg8pnqvhuPb0cA3LVoR2i3JFy3cvqFILq+9Y+1FYTtvdub0XivI09dJx50RwwiBxTuPZ4bIHslqHMrFI/aRa1PHU/9RcUFKhbnKLkmJxtYGIE9d8uWH6ykxsvvyQ4XTLQGHmpMFyhHP99y83J2uNRS+6rrCpGhw4lgQT0JQs8HpB5ay7VjwCZzeHRosPPNIZLUIVBml59DuvMfX7rGIdaPzybBcnoIqO6Gn8Oc9iZ4TjH8DTZ3AOWDNfnJDi+AaN/wNz9c9b775cPnh7H/t/XR/EMOnDzoJofc0r6N2/pWa/3d/7srFjIQx8oLbKJRWi8HOLh/o+PW2R7nLntYA/+PkIQkwgHV6hPsM17QRRR37QDR1Y5wriJeUYhUvZXlxp93QFCZtF7gdj4rqImF6vCRAEJmwDMMM29ZR5j7dkvUYat7/0aNswecFvZkEMhGT7XQ+hwewknVdiM8l3cuMSres2x/Dw4KwJUIZgVoKARbuovkN5nZX2DthfbK8MNDCcGiJ2dMUhI/OxXgXlruPFwAZBSvYGbaOMg8KStn6/oyG1oLN7RWakPD3v7P2suKT8/Pd07f1wbX51n1wtdSFDBtDOpz2ipGZ0fHaqTwLmqtYIeG7UbxuAuMxJ7mTILQ6bC2LvHLdh6IjtZ7hGf+OzgV0JepuZfr4XlaX859IM+5HcDJWScQOsrofpu11oERwhto/uy4e9TR8F1wdnDc0ZYgCZ6dpPUSu8R901na14YknwR/yL71PR+VXCYwFO1QA9ZluxaQ0ipQTZS2pG0Rsd6Bc5lressOPUPV5dQDkR91kR3YgDvaHCY/2MAfoW9MLTwWdjSYZ4tXtlzgL8k2uBhX8AqbUr5AoGpg1MlcYC9N5atoKMq3aTlTqHCnyseAA3WXBVqUbwWmlLPAN4AOP2WJ/74Etm0Ei4yYXCRCF5xUE69eqkEWNBfYn7tL79EKuqQhs90UGvAaIP5Imq+0jimhIUcVtvwSCXi59FzcX4LQcMMAZId1aDsgM6U1Xhx714Obn/X76+FYH/V7l4OO9g7+vO3djfV3g9659PPNzfkv0s/Ru+HgUn4/+qk3HigGRWyrO59Sx7rUMTGI52ybD+/xpamHnh6uYOWt8K/HNJErO4n/0RFxQZctDPZDdLwcKm+e3TjoTEkNzMGaLgw98bC8M6RDEGRUEx7vxuDzyoEdwR8C0m7okmNYGQs0Y13b/Kwn5i4GqQA0CaA+u02xTVFD3TDv4VXv7if9+ubuqnfZYT/e3oxv+J/nveu3gzv+424w6ojPrwfi4974XfTFh94v+n/fD/s/1Rsiu8tKjvILdIu3VNCxYGq5ol9w+pJ+VhkgyKEgHXbvXTsaFf6dZR33Q2AWeDICcddZgbirgC6v4u7aTq5mQpN+2ftlcKf/7ebufHCXD2Ftw07QxRvJleFajoDxBh7c4gPA2aD/rqf3hlf6/VC/HA3HZcBmcOJILtO3FghkT1fW8gJeXRvp/aNs5TveFKQxwojgulZIv/XJRrdhk49+s0/54ZA9n659/g6YePzo0bOnFj2rR51YQ5dZASr79BM9WHhPeNztaNEXHe0SKFPvX/M/frqp11TcxUSDqccd7f3NsD/Q/6uXCx2g4sQIpNrda7w/cPrIqPwl0JugnOTjk442sqArJn9y7szh0dhbXVqPlvRZ9XY/2CD3ACGY9nqJJCYaTj8vg4g/3C6K7u4Fv0qLR5F6XA1Wf2GA5ANCfN+3jNDz74fX1pOAqHxZBne+toEwYNB9yw/tGeqKrSvDljqaeVEGkiugxH8TVHHFnp3Do/IRTyYbwB78e2eZtx4cXs4lSJkXpfO7MMLue6TKq7k/Mh8EIOlRlsvdOkaImg0Q73M3YLJR6NK/TDspENfrD+5Q5Bi/K+CNs3m8RN0ZHOHyv13xznSN1SqYOXgE5VV74kGdysm9q3eh92+ubi8H4wHsTm+Ho/FdD4/kFSACZl2JK/fZzwoVYdugK4Agng3fmvlWsABeaCx1vsfa7ozsUejHBA64bgFzJ14Msqw9XcAqSHL4nnh8H2buzmQgxtq0PXamZmwMpiXaJeCpIJkyCNPp0nZtuXa/fwVPqGqa1K6tEI1k8K4tf0ddehPbsTiv6vqrqYl3nrjaIwSupjqzM+lo/cvh4Brk3fH9m1JYd6vpFVXr+fMIYaPQ72hvPA822CHuVOc2qhEubaUskYQ3NK8M15jHNBo9KK06gGkKNxfAyzx/E0mQ8sMs9t4QdRxGJ5l8buDYKOAkaJ9pT3CHLJaT5LrdVCUB679h/VzewAFFf9Mbjy8H+viXWxDwrgcf3gwHMBW9twP94ub+bvxO/qDelhsdsZNNgwR01+uPQZ6CZq7P4Vg0fPtu3Mk8/zA8H78TIlPyU/kZfVarY6IjsmxcS4hKAVjnLNNyACvcChfrkMNAQXhVDZodWksBBf8uGcUjydddVIEHRBJIEd23V+fpdWl9tqbYH5AF8ZOaAPvIdq7gr9SiSj/PLgxaN3Cchx2MIOMfS/ZxPjIsXqmLYk6fqJ7pImXJW35eDimSTkaWAwe7jNDCHpfDuUTZma32keU/xqjIvCiHBWs1F5zqXTlEg7ABkzYB9HYBVH8dhN7yzvMiosK/h7CjNQAmdSgi0cTTXJh8xnX4B9U8QhpjT3v4sFCgTVbvDj6PkJTk6vFBP/OqjNTp32jHwR/VFgd9emv4YaIuPqhWH7+8tacPxsRJLyvFq+ow+7AkfUMGxZ5UgzClb7usyigEqfsW9t9ouSQf1wI5Wi0sH+R4hwFJDVn9tqwBcQdhB3hzoXNDwEhWorfn7OXIytoI5vX4wdpMPMM3u1feo/UT/3EVi1GpxzUUG9EWDoydY9pbEj7H/gMMPUJ04mluA2vXhu5eJpnjZQlPnMLWFGttx8D/oA14lD+MxN7GNDolu1miBh2laNuJp6q4Pj8zGf50YT9Gi5P/1Dk76EQPYL7KRKcEwG4KUiSgs8dlxBedEA1Tojb8+eTD8SbnAgSka0ehA3/LzdC1iEgqiRxJekJyQetYoBiZgvijRvA+WAY8e2P4bJ+VwKbeNIL+bg2oh2OjBduvO5U7nXpTA3oAe7mFwN8ARa/g//J5PfW4GYpJRohlKulRI3g3axQ8FrblmBJI6WkjqL25524kePS7EaS3vrdeSZDodyNIaBprO7KySHrWZIp7Yc+WmSX9bjapD7bjZGhceloKdWItjEfb87v/tUZpCF4JQETLozVwBHx1X467CBQceoMwC+vcCBZN0DWiSxcCkdph+NNms+rN19ZbeyYjLnrWCOKV5T31PVvupHjUbC34Sy/LwKSnzXppyKsCfjUc63RhwNlp7ViJ4UZPG7G+9WyWZnv8UbPVsQAocHCUqYY/agSvH/oODVECGD1rJkdFZ22Efyt+jFJ7YfJFs74bS3ne8WczooQDVh/VgDJJimeNIA5Da3kvTsQS1MTzZmMW52N54OJZdXaGAnOWm43XfoNlTbKz6II+BeKJBIo3vL20OCGeN5su02RqvywfSb7Z6VCITFMrOfmiWXMLhMGss0gEWVku7JzvSOMrCyHy82ZoCx/ert3EFo0PmsFS9HC73hEq+6TH9Nw0isXzbc917Cg7Nvy5FSYZR/S4IWpD354AL8tSZPKN6tqce8Fqc2ddeoPIPu0yYfSN43lmfC+XeFgVkCXrjgL6pcN71HMWHwgzWo6kGip+kh3ylR1MFXAFfm3XWqJzbPe9bVreLTOtFHdz8SMFBLwux/MEXjbi35m7EHzoe6hIDizd8+d68FB0d2Q9wpTprofXnXEfBvj0Gh9u8MhLP9953sNJeqSjweWgPyZ1vn4/Qm07PdDOtOOSD3v9/s39NX55kv8lXsrdXMdAX5Z+ej647P0CX36X/2XvfnwDn/dvrnrX5wN0eX1V8nHU/vcFg7qOvvohSw+xL7NGYpOpoZueY4WeG2hw6nRShyXpzhjNn7MK7oB8cowAdjehTyBFJcy/HYQB80yezRygtEOCrxlcX0OWLTI45uGtv0FgV3OmvxyF60nK2VsuaDqs6whK19vomZfnKYHvujppdzf6EkTYM+33f6bHIyDC2tSfyN5Ah+8diyB3NH1i2upuYPGtEHZ07dpzM8tQhsu6YJvYCQ53jfYpSP22WbX7H6HOJxgDq5VuDy2mLdgpQ1+2b+5orYkB7ACvRJkyudWh7r7Q7ID+UDQu2zmnakPzirnKJxLpQnble4/AXYIMRrSJNUO7XgMO8b0SOomuc78ajTzPXKa/V7dPnHKjL7ylIM+/wp4awH/++vCEf+U1v68hvjR2Ta0daKYH8wDQFqTNc8Vi1bIXZTGE3hTdHQLNI58Hw9GwQXRPXaIhRsQIptytNujWXjK5JBxTUU3qlcjvLE08CqIdwQ7kCF9m5hV4qj35dmjRQHmwCuYVjAZC5JCwtPEn+4Ccf5NQiRJtvCR3eE2dQVb6PaDTMbkgot95ujmFe9EKPtLJifEswh3Zsbd0XdSPvmmRjXuXua9wd/6cpYP9gMHpsDCBsMw21NHDzcrqoPOLDlDX/M9wkkdzxc7jITo+CbvxbvTHOpy63lP7RRekUebN3n6B/lV/K3AAi7zeEWmt7q+e7bYje/Uue6tbwlmncCgFPnCwUplj4sdvAowygG7pf3fx/+hy1Q4DDgQgd3UdTf50PdFE1M2CRopxhiX2/BOkAnNtVHT8I2x1iaDbNJ6i8Vb3qMeCzk7bjEsKokE9+3h6/Pro6NOX6ODMBm7mFHUQGFO80HDNx7/+cpZZLCUdKccFdVe0UEivxXBqYoiaJSxlv0O+oeAosB6iv9WVYmajZTGVbimHT2YZ9QXGC4HDBooYLBiSF8ICW8PUWIwbTzbaFK0yKayKiPQgqsAGvIIXRZyaf6qLuvzQpmTaRdFOyDQUZBvt+POx9rSAlaet7M+Wo60c4FALzzFhzxT9gp0YzU/8jRoaD1O0MALi88z1CJY/r94q8hhm2676fV7f6aIU9reAonrwVmijMx4xqpVvrXBwpgZz6WbxKYrOIegRhDOUpPJ8L0swaW6At8LBIzWXdOZgx8p0j9FedJHTN0BpBp1AApYPh1vWUEQJxNKhNWS1QGeZaigc5tUByQ8tG0pmCAF1K4Bpj/11XmyZfAxyLDIUpZdEwEIOLe35gp/ikBgxsMs8Y5cvl2h5SHP7sZjNCHIN/v53a7kKN91wbrQKXJVTdWgNsToFA01V4oGgKjXFiOjvf083uXJVApgon5pNxwWcOJEtgAAdTQk7RFfDOaCbSdK5H8OymE1wMjNTVbIdwNJgkd26sEGawPsDnQUomACxwyI4O9OOq8gbyd7OcqJiyGUCK12xnYhSuE/TRiA1WdJDiUHjSWEJx5qYUUdsGcFWnx8sFTf5eA/g6OFMgLfcpS3M0mmdtI872rHwRe3eDn8eXOoXV2O99/ru9dvXb153WPy7EpmAoynVcoW+YknNZXRCkaAVLBEsTByoLIio3uTtD6giVFIsbVjr0Dtg2Ix2f1ob6d2tdJsQ0Q5biTYKObvn2yiqs88Bb6pONiF3EliYAY4ZwW+zYCChMT9rFfYKC3yPccbOkl2MQZQQE6CFQwAx+Ji2xRprDwusv4UFawog2WErgGUoi3VVyCRcgJz4ZOEBn8Ko0I+iYCZS5w130yb3MVcGhGTBn35s8Z2mRewf/2uaAf33IfxM//11NW99KsOz1CY5rCCXAvAZyagiGCyZul3DNGnmKoxdlH0Nb/bT8lIYM7vqoKpxPLk0kr1qtoGFc8wS0JzoEyzOniV//yWH51HgGLVgU2MyRJGOwq2PYwYTDjyfcK5gpYvpQgWEdvAfUQ9RDYFj+Hj6uvDcnC6VWbJcio/7WLiej/GHJtxNycrPsgyvzi6Ri9qx4DpRUEA67mn8OGiZeROZfbq7AIu5vR2yXlFIGctMBkj8eHqSrzcpnevsvOac0HPPx+rDumAxzPTcch9t33MxwBruxsTrA60dPGwmHqw63zdMG00hUdqZOSxgEN4fTCzUsoXTbmp4iZM7s9YFwvDW/jTuYO2Te/L0yzouoG5xCE52r+FZOCPrCDlnAXsw/FWI7royTg35hq/RdM92I9zQ6WNL6SYJo5Z400iayU6AmPnnlW0CHdqMqAzqo6izQvUz8OSsuCO9KTm9i9I6pPV4CDKQPP679HqtCE2nRd8NFhK8fW0YcQItEN4SQKQ+nM/taWXQnId0E6CljuYviQwsxqH01KBHjG9Fa7pqx3g8gsNEx8inRhNx7GYkYFSFeCgRmoCKV7FVlr9cqogPlQTsNB2S7lwlAKe4YkVpJK96XVFYxGhzNmkGmmad2gEqxTYgBcIQXDhR2iESZdVmxhgpmUWterJhA8eo41w3dRiJHg4q4ZTRveXyBaUvpeRVzNcToguRNAkuGajcfSSWsxKH8mhCq0tfBY2PElv4lxb1xMqmsAXsVoISTEzWYQVSqiyX5Uo/armMme5pvduhhuF1DaZStwN2pz/ZxN3tJ/yzulPkyiAG+qkjYkIUY9C5dzxM+OeaQtizO5apkRmj6AOQpxYPVcfbV32Ke3y5DJVoFo0YVGDK5SplNZSx8uajtJNYcJqUVfgi9+vZl4hSTQnAmVP+8HIar3TbiYFSB2TAUbAY5QJz1hJha5lVC8ug0sINip2pKm5HCdOW0o8NO+3/K5cq04sBTYvmcCta34bA61B1ESlXp9+vRbT/otT82UuRZ32aTOzjzIacSRFJPs+2l4BtVVyC4PtajGKS62Af++p6HGkct7TJPpcSJ0dAUOzJatEAo13acCp8sDYBCKoY4fxpYQEaQEDF6+GA2gF8tyPrQYB/CMdqHrkpvQySWhr7sy6g65joItzUFA7iyJ25rEq2loDvOnQYZOpbXMdo9xN1opBnIS7yq6IOR0KWyn4mgQMcblS5nWszKgpIjt7Simw0yZqBBZd2yNoaZgWENjRTDoAnwAHjM3pBWwqr0hR67IBmA5Zo2+wQsCr8g/MO7H+7yJYNSy3WWozk0rYaWDtJSWBCTyOlPY2LXBqQjaxdgUwNTbAqHJ2rX4PUwWPD8aWb+fhJafEpSmLFn6XotCJ7I8aWAMQWd/akp+LENSKr5zI4JWdRs7i9e/fB9Z6A9FYGnAiZOTnNtNa68wyztcctfNlxlG8qKzhdWSE3NCtVRDOgzdXQbJNASxyuGSJD+FjVu84bQqDN0Qh2tnbS/h0x8HPPbWFw5w0CpP2TBW3gIWJM2wdo6L4RCIWmSCB2aH0OLZcyKGJjTbbF+oFp5JL/BvjleoWTFCjmlZsHosBEjfGQFvnQJImXegSbiIfuhEAdZdySZEVOBawKrCoC0uW/t1HxJBTkiVaaicFYanOv7BAbScRY6shbmbpkLwqyE27FJEFV15VjkUhG1sUk6Ue14PMKNy4AHvSEmYaA3OIu4sYivfjYUi1htC3wkcjgv8LEMSQbQjQ1FB9Wtzxgo7z05qRwQvWy7a4tps4MLJIbvBms6OT4uYMfRqRh3ao4fCycQtBWkRke8iZLV1wCSPHZA0vx28Ryk5WYCaIthlGkT4xAy6cPBdkUGQIUsTI6lWMDOrLLvHu+ClcPCj6WBFuNnaW6IvhZ8vHO2FoS7Jfma5Va/2MzNlQZJA3kW0lmBNSKiht6baff1uIt0QInFxV+q5E0smNbLt32N+IjX5RnZCg9hyrraDQ4KQxJwiHFRGF+TVniwxkyHg3bwU1A24AAeqAFD/Yq0tCX6QOq9zKP38lc7YvfnlzL+9IBJyW6RCP2myC6ndyhZAT37Bni3A5oNthVRJRSfL1CfzbmrclzQQaSlgQTNaMDJorermVR/tSlSldiMvAia7bO4OoJuMrzxN7eHjs2iB6RWphECI8cdrC3yl6mfEGV6Q9Z4O0pMBO0rTjKflDvgCOQOPgc3rLYAiJQYqL3OZNa4YiRjlrA/06Hwsu0X2kvzdRCRTgp4V3rSTRVrFzCEqk7hGI/A7ebhVphIw3C9UTP1my+k3JuLKVazytVRkBaBnUXi4HLNPhtJt6DKJzDtCV+29GiiCH0u2jMIoEbD1kl1qzkHmMHgkjr3bWM4cQ98YBjrTzYGZH6ab3eDzXMVEFLsQm5l4s52UAlsCK6NFWsfXkxsCfAlfmf+aBr7Wv5/Uh1orTZSiuUQ8Fj08JD+kLK4azUtA30q668OhEC0CwH2c0DWHVhUn1WZesVWX6XU9braDFK3fqDr8J6q07sNO/ZkiVbPaQ2tNYr9Oopy4OeAsi86Cbkz2nas5nl434brWxMWGe5FEgVNrdC/lHeOJbsYhISA9tNRGyfRC+fZzFzRd5W7Vda1UlguLhDww/1RMPV13Wyv2eprnYVsKsu8USlL7DIy3seLfMa4/kfutApZQ0sSCFIJmTdLVXW00zSHDnVEP2sRMj8W7E9Fcj69bYpVhUmmzfQLQNfa9Oiil+AnKt2Prl30Zs/CEU3PnjzlUxH795qBUdMU/vGTB6KuNYxEXGLDm7cGUgM8UucyVnUnIPUqY0d0X9dg8Tsr3EFYiqxvAup0hN6tRNxEYjnTbF8efPmzS9av3c1uOtp/Zvr8d3N5eXgTrsY/vwlu4F3m0kqPdVaLLRWSyhwgP+gV7MhPkP+Y/gseVgrDXCMJx1vOl2zqzMW3n5qLFkEz9WGWYZEEwJc1OY+MtMpXqrwLMtxCwptByPXCDQaqeA1he85Tk6wpEjNQZXE9WxcSeUQE/WA7qWdjVLDUckiVZXxIdPvZEIAgbF6u9koxOhogrlLWGY2POpq0V4Qf36Wnjdirn2DwhF3o+/qdA4nLl6GiNH6e4KYRWBvEgFhNAo2d4Fq8vBa3uABydATLrKFU86nKOWidBS4jmcc5wENecAPLY+A0yU/fbnY9rOvO4kVWGMXzU51M6tER9nram5PzLMed2B5lgAgn7tyIDzA3whrY+TJkgB/qlI56J+qUIQ+YV2JUUyOOhr+ryCwhxKE74XGtiCsmW4HOo+ZeVbx6qP8i5RF3C5IEEsWjsToUTBLzmnFm6tc40+fuVumaY3c2Kj1Kj7XX35xBVWu/FCkEqxHuuIpYszZPpee7JOiAYp4RlnnmOkAWiExMQ+NCEwyHpr6mQwN6ZI3lal+2JIEIZvDGlZRXL4a4651A5vX6eK+btXVPAEgNgEr2vErbe7oDJvYryscRKTBV2sjYQqRFLjCTe37wXI9VLXe4rlonQgVx1YXmdZQl6tYJBaRTjHJRJ5UOdJqIRmlzkElsvLXOwANrs//GIegLznom4uLy+H1AAb+dnitjX4ZjQdXQFxDN7TmPm1WtgtHkTtm2qz1ncwx90ti4oarCSjBNc98GwcETxEa1yno7DNd2Isrw44lfzF5jjdGubdZ8oKcc5wIDu0lejfj6boNx0YTYhu43xrD6FPeSKB4l7lwK4X+7BMe9R2zrY4xZvrwejimEOyKO+zkt0DF14P+eHj9NhtcPvs1wmWAT6p0q16sajj1oEZHCFf5KjT6mqFKJ48NEEhzJFEudc7hK7SMq15HdCYI2d5CD9VoLoAyXft4Q6JzaOWjEhVQX0RmlEU11AgnGx5B3bzhoBD7QGSXaGkiekn4IX2AoNkADurGXG00gSWxP3Cm8Um75En1RCeEjoHsTxnEbrdbzwOa3TBjHCeML5geZvfXTKoPUcR9tM68TAqDObaUcIviK3pBl+JYUIhmDCz50uzOMd6lN9VNGzauTh7QnNHn0Kb6qYAo7LnySYaHxFhQpIwERoqDBIvxMa0Bi0BQImamO4V1imsUREdUP+XHvkRLVb3VIirti2C63MYqAldAm1iEbw/Fv+fhDDmIeNnVto0tVuTEMbITY0aL6mpxsqNqnMkiCZI9YNBGPmmY7WpifhIQknq7JR61OtrHYg+/6ucV9ZQNeBj7JHupfFppOnM5G1wehBKWK8JzuqbokCBAwXUFpFy2GzHWQm72e/GEinlrnWKctyAsDSMr9qbqFejYr9tUg0+ifnvZ+2Vwpx8dHVetj/HsEMIY2tRYJp/Sqo71aDlQ6dVR2ZfW5xV8d3wEJf/LfxZAqYFmw1zahdsJVZDxXLFGIaJP6iK6V6lRgWJAXTUc/0ilAMm1dkQ1h7gPVBz9VEN6PcR/Ohqh9JAhNodZpHhdVY4AMiYmMyFBn+vUOIiOJia1gDG8p+qRNMYiC3FxkISnnLudfGwwiBKvFCxGsEz+uJYkJjEf4qRqubMWSJROoCZXsceIL5ZNRI3ELsTCOMs4TH4WLS76TvyqozmLsNvjjdC027HDezFSRck5J/C/atSVjgzizwq1U4cugaQKNTFDu84xwhkH1mwLENXkiPwbgDoEnpwCbjiRDD9QPBvFxr85G38OAtiKl54UrPWRFfIhCeV4pPIvtVbHEocK6C69Ryvokher7QYoWIm/1VXF266uo4e9rn9s8a1ieN7CDE7SCPiaibaXTnp7yeOg+Y1c964Ghc3QLoQNcTzcFl6B5Dd0OXg/uFS3xLaujnZcHagY9tXNOet+PgEX1OaKBHWvIg62/bp4myUtINrTPNAyEE2LqEEsoWKKqQMTJ78cKiOROnBprssBc5Io1CbjCscTvNjRaDfn2sI8m423sJoxRAu/MxaaR00oF5XLmC//PIVktgJsebnay/zkYVgKlJ5ZdaZq6+Zsslpfs/hkyn20K2HYBDYnQBWbwWBOUOpaHCQAAwxGB6V1uMAMdIzx78jwJW5TSkzKHgBvveG3p9HDekqslOULD/Sj/jq6qGVImy4M17UcnLN0H7qJL+r0iMxdEpTOgZRaGwC2b2Db9W2Tq7ajDqYmqXAfw6JmYXjX4JO2gC6Y5AYOAD7ZmivJoEh3g5FN7ZU2Ov+Jgexocy+OCQEdl0HmgyE5yHNTPALVKJt6gi+3NlLBqYD/PosvySzVZF884AYEpAHab5Q4ZeDwenHhPUUTot0PmzqBj9DtRACJbCihAbyGt8M4lmiNCSFDWYbCtV2kgRPTZyGJ8RrAyOZWfbUdG80NTyCJcUUwLQcbmOzAiXuDifg00gmS5bKFVEfVZ9m9j4kWkfyB6XfpUq8lkquUHH3YYSEMMZRQkk7bXAnElUG16V4NtOaxGQtQeY/B0iTEC8KREN9gOXDAMrehNqqf9fLf8IvKswJxowlYtMSn6t2EPqIWSvMRwjbCYE1WsLO1g0eWegdfzoMpzSqAwksTzZiFeGUbQ3Xyt1ZR1EyYwyhCXQXLpaKx8yi3lcddg/OLzlfn/RnEJai0AcGPfcNlFoPcuTo9SQS45IqkiFf2HS+wItZfwqRNy4k4eoNLFdYi3XHGwwiKozAlHGJ8q8t9qoNuyrm61KVafH8mPi3qP/8YzTUxs6s1bYsnpF4LeHyTN8A0HevKQPWs9vs/a96gXnnug7U5WKWMr3J2lBIpE+2uVIJjVWBqsYdZcyleVAWr3FVQwaV63rivfMGpestfbX+Gj48d8fJ2NglTtIR/TLGGq46+rbGFWOqiLrIPi4ZS6aqOL7Ao4bH6qzgf8sq3XUqHnLfA8pV8yV/75JW0SVns0CiSH6oPlQlU3A3eD9/3LvEcY6PwYf+WkSF4oJEcXlp4Zq7a+I2iPUpFTz3KhjapOvPq1i7YzgibRtyEWmyqYBH4/FZ9KiO3L9eH5K83vf5Pb+9u7q/PScN4STowfdQb/tfwpx4mJvzVtpa24eq/AZcNFrYefNfKhTC6+FmCgrWD2WcdmYSTqqS/643e6efDi4v7EX7ILVimhjPFaEmYiGJhBIt2a2x9PkoTC6s8Hvx8XFLzOLfmSUnNE3XNy8HdrT66urkZvysC4Fj+arT0vDBjByuDuR2QYVsxlJWVXSxX47tL/afBLycIDCD8zsZ6KiGmo7FRSM9O0kle5W6eZgeo/pz6c5oZxz8xok9W/0aWeBTeCQ+F/Iw1wb9fnGr7F3DWDkgeIEWxN9OYY1122XMHyDPt4x5eR+pLazmBEzTaNO51tD08ZoWb4fnSWOHP4Cm0gYUhUPzpeJiRZ7OnuM+V2MneeDAaa73u8anWgz14E6CbnpsawZ6CARaEVZ6xsSa07PyWAZWmiIO3VshQIG7i8D0qIExMSIcvhudwTnMtYf2qeWuMyR1YXdhabczqXS2e7N7d2nVZ9gmy9WQ6125XNSRREp+2X1BCZd/ixqK67c68Ng3wY2Jwn/gUf2zF34beg+VGbxhC4rdzCScvtH3Xe2IxUk2PYsVGxqnoqTKb/d9q472AqQtQYEmMIm+4JPWvbbzM5J2HH61P2v7cfrTYDDHipD/vhzlGmLIDjzFB/YQ+9731SoDlpCC9ifQh2r61ni+0JwuP5WQ3QG58deS5HPkblwwikq2ayBL4FLZGD1ZVsM6hIG6vxBZcaMirrt1iVrb/Ga+NlljZ2v6va3RSxjQjGK3DDoFmcy6W2cKG08eqfZQbUFlG6sSwg6m+nPs6HFLckEjyyXZN70kHHuBYjCCLr3AIkAUwusZqhQle1ktLZ5G8vj3T2uJ8z1506sBCsRBn1TUV8OKXVWBy02GWphzzi+mzVZAko+Q7wH9BMvN9xiOBQ+a8l9ueTjGDM2KZ8Muq2ibl9hQLpcPIw86Lt52aWWWbjFFr+ff/EidPDl16UXQgBQ4sfclve63VytBX9ryKJpIfCXSd6zd1vaPlm/xikT6V7gHf6v3L4eB6rPfe4D5D97A5gRJo3Mze4ckmUdz30OZS99x2q8Wa75rr5Spo/95yjLkeLvCgivlTuVFUgVKiJYCZa59dWkCVk4p1WASU0CZjreOjf+aeo1RY5zCgVRjDURHOEyuLkbgPews0K1BReAuuqM5ConE5AM2H0r1TfdcqzgJehb5FiwVhYUjrwxMyrRwjhNPWsmtOQ89zujZeE8wwUiQnQzvQUZ3kGMBfeHC33BmgtHDZ75XXnjVQVxCtrgJGVPKWNkItg2Va5l/yNufKOUHYuuGrDjYidgBnfu3kB/+0QIYDoh2GnW8vvBUL6t40PYg8nr6BPpw8SgOXFURXVANrqOyI8XbBzY1g9QcoqTIpZeY5Dl2V5SFTgoVCh2NRNPppuKZrJCfhmwpkWAqETfvHo08ADM3esDZdatF1GnrEAqYxgyXQ0wbD3qM8AFvbA9604a3bh4HW713n9BZaMO2gvccQ2k2K43iC1u5vL29654PzvPGq3ET31eDOUuJ+9lDDniSf/SdGwvQ9WCwgtuueP9eDh7SKL3sYOkmehorPJpe9971x705D/x/VONk1pFnR3Z0LuHyFBxt3WmBYxD+OoBZ8qupx/92g/5P25nzYV3ZcqpInuMmpmiimMn2Ys1B4b6PvsbMfX35/BAditLTuaD989+p1uWFvXl+CNR6ELhn1MAnoRYqIisaBPFnmsY4Bp4CJEWIwnuikBPtckdNaYAnhst0a6IRe/e5m3BsPb67JXU4fvAdBQ6XZyz6JYnRIvsU8TseMHB7UwWAwcyBIDxMbfQlzRxqlCyI6T4RDQKMlfnUeR7gotCRKZkYZ/vyJs1gZgghucsAMoijOSbie5Cmoo1gbWNO1l+gkhsBMro6ggBk5W12zCBu1o2o0jGGRDsAhCc7RyujEMTWqGAxLsTjkIzx/WgFaerqrBLPI5RdSgAw9MIVBeF5Imctq3P4ky+zLO6TSemEgQMcGscmY+5aFZ2B9ErpysAvVvMuSIK1v9i/whyASAJljKVv+VXpHBIe3/GTGj6wmRI7PjpY0esay2HPM6pJHkajLir9CE3ZU2pBuF/3lg7D73+OBfnnT713qb3rj8eVAH/9yOyigb3458nuO94V43ZKahWOH9EtRUY0BUrawimzoVQa8ny90Nrxi2+udn6Pbc79/Bai/mvva+EYm6BKBLXUyx2SPAlDe/dMymB/Bd3syhLj1U21P+5ZuRNQtlMuPCL+CpM/H3UOrrgVw3PvQdoIGgzcEAH1NEM5SIOugIdUZNS5SDe4aIW9hBb337KnVjBZoAT5ifU4PMrwiXBynkZHoiBoVycaqYSLPyl2BCuszTxUQafYaIEQBBKO/U9oFbgrRw6d5uEmc5u4GPQpSQMctxtG00eDu/eAuryujRx+TZHa0vmOPiUlmeGSWFT/6uFfokw0xowRjyp1Amj/eWjxb/MEL+LmnDenxnuhJ/BV/UmkCS+ZPjlKl2F8Q96Q4vIDDpedvulGGxBdd7sHKFIvtCHFDU8S3h2my812DoW8naRou6IiaovMrVELOSa6ck9xcUdCptwPnjvkljjkDPx5d+lWlcbzcapLTh5/6XRAcAP16+gMNFtrd8M39eIDrn50hqyx93kN0i8oJqVLUdGCFeFrQXW/b9iVIylgoeT3gUcx1OIw9WputsZCElh95RNWV0e2gT+FGrt7ebY0OzPiJK51tULVmhUuRN7eDa308vBroqENo1A1OsRjGgI7XYl3W6s7guvcGt4CLn7Xbm5vLRh0RGpfZZ33leU7dLtzd3Fxpw+uLm0aN+x4sUryzbTgRw/NtkG8XR5ZREeI6QC81HuRALCyauka0mA/uLPcQougWAwOAdcOfLjCdX5PeZKGAMMv+iow2SVrgr5mjZ4t3O0+jAez8h5x9Mdtg4a6Y+bzSXvJD3l0JJXVK7IkVtxdEAa9N+0v+wL/DgWcaigeZflVpQN9Vn1FMuCOPoLr4w0WyWuLPq5xpzvSicJbTX1fCyavmOElLC/XmpIxWgpSUtZsRK5nv28ubN71L/RxWfZVFL7PeO/h7iJYz+ZP7fXpy4/rq6Yzel5lQ0IAi5agSr3N7WoOP0feYGYGp2FSBcJPWGwVIh5G/zpXqsZkSOR4+qUTArythiU87hrx0uDtz/YmXa+fwPOh1dUKQ4eWob+IvKiHj+ypnYbxkQGRkFAIg1uWigYl8qirVp1/UkAdbVf1Qa5pTKMQooBSIj8lpjSY+BeNMY2FMR/joFp5UU3jnYSbbQC49JL+rjLsGmJtz+aQBwqKqZzyGwLkdIBmPLHy6Ha4i2DmqLf56K8zsly4YIYcWmAQQoAI2KOoWc8LI/qG8pxWnOhqPlNG+aN0bOQufiXNrn6npCnZAQoDUWGr954V62WJksaFd0QZYNLYEhOKRJT59/rE1n68ClzUxlu3mp5hEMzslsLPpIpdw5MHjnY9q+SEFMikki5DaYkkMrP2ieE3KX+5w9xLuLoElbumXVhCg7Y21tMPQMiupzXGm+T6BAC1uX9BFGHm4TvC7mTC1xuqIsFzmJtdiBtpR0NYBGcxW7P9+ZgA8OKMemUcUdl/9dCLUAcUX4i3rUZ/Hui2Qe2F6W6da31uO+EM45JHWN/VRabw6BGzYIMJZbiCuPAHsB8tYee4bw+/TiUlAn2IEL/nrSvDJVIlC9gHkd+ul4fZWK8vw+eEUAfNPqoOjmyEG8Y0xfUBjQ7zYl8HRJ5Ug2q6+tKYLg6PUciw8QeOg7SB6WQmSt8ZAC8HCthw+3ht8MqIHvHPyN5WAmnB8WjBovbnnbgAO9AueVqtuYJ1MdXpaqT55DSyBphiMt/iTCEI8DyqBCVZoNaw/Gs7aChioO2vq2c619cQxk/ik2tgYPaKJg244Dh9l2LOXgmTFF45DX1WCit4v8w0c8+doS8GpAs0Hk6sh/qwS1F/Xy5W+ND6zCBwAlZbCCC28/gte3a84FpLfVSPgQLf+sbZXur8OFvrEcyPw5+jZRRPOPggX8AnQX7WZt3h4cI4C+HMdEFgxYfiyEqgnYijMGitv1UrfVII5dbwQvW5zAYoPqi3dcGH5QS4s9rpav0Dg9L352tLn9iwUtI4P3sLviJfCV/S+Esyl5T3Bhj4nrQuDeAWP+hiN+wXf7dnL6uAwqQcQy+d8mIkvqi3Ipe/5eLu88vjAe/7SS20jBj6qPs+mbzy56AsC//cfeEeNlYCWfF1x+MDQiSeQkhQDTOgsxYhAA7xnuUyjPis+rtYWfaqDmLPUAyBI3XnMbYR/yz7D0H2Vl+lkPZvJqwt+SsRbGdUUWQj+8cPpWjA+/kuQhPxFNeaEIxeRgdWLK/6k2gILfUfesTGHDWEzWlvRB1WFCsKhDaJcEdj4gwYwJemqAHB1qYp9vliRCJ0Dl7+t3NuZ/dkqRoH0RWWoGC9jbsk7SXbCpE8qbvyhr0dScJSNKsVn8CPgRQ9WNUmHodT6XIjT6KMaIH2LnBrxLjjIASt/Um0RGCAmCKm6Dz8iXLIXJUD2OR4jizPTCkHs5fiEp318CjDZ82pyE9qX21M73JBnwpR3bgir+z6I54Zkp/SnlRqYecAYI4tiNvIFHCSmYXR/mfikEtCN8SSkpfHax60PhBCOSDyiwvvK275E4wTwjbUwHm06Swig9FU1GjdNGoVuzWbx1Jgmu+BLkXry26pS44NlrXTTg/1zZvtyx0lrLHPo9LfVyItMIFD+hp0NI3SRDyA/GMErkNMjX28ahvL7qmc4354vSNoXTOHh7ZokGX6Mi95X5TDGdEHG1MhHCs/FqW+rbbVTGKzMEnJgS99VP8173gOefCIhLI1s6nTyw2oLEGZenzje9MHiizszhfInVckQYwDmEB9/WxXS1JBJOSIB+VUlUAvsB4gkTlJx0fccxw48IR/LX1Xv4TKhwWG3NGN6InCY+KwAcLEVSVabWdFzCMuzXZmWXRc0UUtGxrPMYFYb3ff7g9EoV5lXL1V6qrExHAStVqDx5Ny5jaTqWS9UvnxY0GUg+McafUkcSguIuuQ2BuvAVU+puE2Tu5Rifu7NIcZNw/TJtkuP6OKiUG+p+YZt2oG2b7d4uFHHQg9b5nY1secs0gV5LuQEZ9iHQejkpSlcQk/jzEKGguaioNAd9M6i8FjwOfp8wukv93ogobF9xnakCC/M1yXA0C1kB4N/JCxm8AGtFfwjXkPRI2bg4Ln49wz+XPtWsPcJMIZpxjzAKnaKYjpTq/i4q13YPrxlbq8wMyALelbeJJbEdl56E9uxutyXJ2EFJBx5kg/3LdTjhxtN9Bwdb3MC2ilaiOyGBPT4wf40nqq1a/9jjfFkimaAu2/DvGNgGt82GcIsbUb4sVkcL/FxDn6QAiyDqrqWZfKAjqaH3r9rd7ogmNG66WhDWgLYCk0RfBtYsIzQYVt4NbPWXfQ8hKVisTlUN8/se5i7HLM7zBhWVcLACiTZpYWhJ21c2qb1uauNPAzQgqKXBp9RvtO4ex6GSgTWxeIiu5Y290BIoA/Q/N+CEzoa3jEcBhqGuUlULh9OdaOyFjPIaXXS6GgeziC6HaHQOKdaO0arbZ7gHpNu6kVeWIkW2RfytD/bwInvMvaOj2G97x8fE2pziYPVQDKDOh+x0qeOFrMGEKctE5DBDzFBTqyhFjtHongMYH5v4R9wDvd800LJ9OPrI/Q4hn9PPuXIBP/U9gNPBPuZAJ/UCGROe9WCTUT7wS0GJhS0yaYNiC0/1pPM4+vWjZutEHmnyLeaAYsnvo50VD30hLxRnSXX1j7wlEBb4qkEt/CcgB0VmsJSsEfQ6xRSMGVjtocYDIvFn1oHnB2GGsjNwEoLQJdGrciIUCx0BYWz5HINbZCwHrikWLxrlyMjI6uw0KIY9OP/ViHKypWKB5+VHRlcFkmjquS4x4KMYmiLqUGR2iabZOgNhsDTqgDlCBqqbRY5GnvOQ0AXbH77TxZtLAvj0VKLZ0V+7RVn4uRUG9/9oo3GvbuxRj6/3Ekgl1AKlkPWO1fpSVyFY0AjPEhR2s63Fkx5vDcLbWNsOrjwTJAlkC/85S+5gWq2O8lAW67X0fJHgV3AlVrWixTgPIPb7FPFsSf6KH1Uori6FzyW3P2wq/Z6Z5GKFS9S4BSHsbzYK+nn+1Lk7Dk56nZB5gTxiHntcltx+ZGQky/xzYBeJEEmvPhnwHIwdpvkxA9/wTx566kyKW2cGHwG/OA0FicwTAGsPTqRw/xqQJQgID9NbIsnKWbTnIUoTaZIqaD13/Xuev0xHq8Hl4P+GKAiPFqUKgeRRkeTSmDyzx851bktF+nVutwzNukpKyApl21Hux58eDMcYFrstwP94ub+bvxO/qC4WW8ZbAIWU7wbqauZlcn98Np6Em2r3qn0BYnQ8ge+5VCkzvshnTCNRw/YBkw36t8o7hFwYcWRHs/9axt5/scWhlmn1XU/xCwXo8eoB/gzte7wUc91PXhAa0v66M1c+tHDCCe8yqc8VlwlzhbtJWsWHXCKA8ekJ2s7h8ekGWIBfMwPocYvT2kfhWmZGIE91dAunHl5gyStDvGBstLSWGnsUKTZZkA5Orw15kUxAvU2alMeLgpdIw0Z8JiKPSkilpZEruGxYt5gn6/mzAP9WePF8CMgXsFz17biFjIhNBmP03MjU8mFh+lgnn3l7WRCSXY0iiVJbkClmUHSw/sIdTHCE6vdIHwoOmdnJ0ap44ypUIrBgeGFNMvwnQ0t4PQINbxDRN1BgPWUJFqD/OJ261FeFPHjD0d1X5saEtFUUnjKIYIoiXacIIqdHnloymwd3sGqiqjmip6oIQXUEstWrtHJKGJikDm3HglFjsicifmy81NlSzqb45O8b1Bkqgl2HgVAPcpNDN0ybQMkFpMSdBd8tlkb7sTAm9GTVwWfzTD7RvztcdG3K2Mjf1rU+gzEZOnbIqiB9Rmh5b0m26bvXuW95inIX738Me8LPanoyl+QBSow+vcV/fs9/fsd/fuS/v2B/n2N/x7Tl8dH9C97+yP9TXCOqdYxwTkmOMdU95jVpS9PqO4JfX9C0E4IzgnVPaG6J1T3hOqeUN0Tqvvy6FPBzR6gauqsQTrFQzQZBQWk+MO+42h/zNXz5WKWnQWE9Q6zuWKrAnBwRIioWhVrFVVI6DyPT/IGup1WU/GoWJGnYq8fbN/iLBoOzp9XNEzUr9wPKac2PwdPPC8E/qQKZq3U8xk5eQXkj1H163OuWlBF1esL+7MW2Tzxe8gWbszo193iGheMhwjne0wIxD4EloX38yiGem5LBZcHZ+RbAtaHXQZTt/H8SZlcPEppQo7FaPDIla3IzA8O+q7XyttrWdppNDtNVmjTn65XkixsBDWZMmtO95ssQx4fMklPhZnCuACDBksVZZeoz3XkFyxMmBA9y48IITciTV/ldri8nGguv5ZIfxthIOeUxRdaco5QplFMXanOq/URUwd90nqmCWsPIWgpwHSuJamjkl8mSE13w/EQTvGn2mBpi2yJIpcVeesEqew9qIaGc/hfNWaDqzgx5x9WFWPBZlkyRTeZLov7CuWnlcs4GuVAKPI2UnRIDUW4PSUyb6l61jhTFmv9Q+/uenj99jSvG8lM9ir9YfEsY5JAZFJGOucEznLI0pZEU5zBqAqNtWa7zxNe6BHk/4wyp2GvsDcFU85XU27miyzUKvnNed+K+qSJ6+1Myp9dzrmqB80mfBivV+G3p87lUJgjR15hHAz9qKiKkqt0yWGJKXwpYk7BpZQCRVfSIDR0KHzeiZB7vv0MkNKedV2kjtQGvbvLX7T2xJph9m/mqovjUkCPjrZCnrhEeFewBNDyDxeqQ/pF0iFmq/OtOsrqLtUt2bYxnzdvMtkI3j8mO8FiUqOiHNXFKN3lig+1hACebmPhrURs4qLtn32NeaN1H8TjlWe7oYjuUl4vrlK5KSlvXnEGhrgK3hzhhh1QbOTcjSmusFr7IPsH0LmK1fLfJPkCWdEbc1Trz3ChoPB/4M0O8L+B1l7hejv4D9jwJuJP/NLOi8bAGhjjTb0d8GwL7IRALbEbH+EglJwj7dE2KMU1jNB/sDaFeV0JK8nOF09VRXyItNxIbNoU1tvc822VeJPoCKPN+HO0k2sx/zxU8EcXTPiDuYvAHziR+F/0asP/btbWg9HKiQSIBZcXb2ODNxHKpisp5aKl9FHA+1QQhTBZV7GwElByoipiqcXsb5R8jinXlGw/v4Uou4PoO+s6pl2BhVglq3JqxWgYhZ6ABHTsdfFWCo9R6FIHjL3w1MSPfBneUWnmkrymPNT8Lmgmbn2LuU9cRKg+KJm6qNWa0xXNlMhyihihOYRJsGf2lPay4hljmbTyCaiAT20xbO4+yBYqV78LZJ+x/ISFSHhrcTZmir0Zox3AkNGCTpCEx+T8mBbKSFfUrHbvlGI3lJVAQOgAwynHXApCEyQqqLYhOmNiInmiLZOQxnK9R/T1HIhUjCSF0iIzrzJQdXHL0k3KyzLGaEejsARl+qcETqkG4c+I4JSvy1KmRGDrjs0wzUhI40PjGuCSIV3BDoDXT7QdoEbReqowhkge7ELDbdFS3U77Fvr+NOv3HdWlnYxtYswmAyvX6j+myjH85mOwg2b976MpHq4rYb5NozCrTAFfF7ydeJeMBlV3DEJYb0g9gnQimb/CBKTOBxXISBp5nRzwYowwT1GbW0zUU+Vx5s1SauR1xzF1LMPXEywkqCJi9LGelpAFa0gUuxPlG4pkxTtm6IVGXYTg/kj12EaI2oGkpFxldoP1sp2/1bFIN7kRuipIAeKwWHVAJChCJX7o5Uk5afruh/BiEhxWFJ32tTs2RLrpR8mBnGleaAfSyZhfqbFTOLVS5Sws7+uJUTaWOGmRYfcayknCXYPET6awqLGt8/HkHUeL9r+ZbwULNtWR1Fy68VElNtUkKsPkHGC/3cTd3YvCPjPjuHrdFWqQpMqpKmkmWQ91nKtvtLaQQQv1LcUDkq8LrjBdNJ8VgzVBF4VImCxvJxryTegqkeVBR1VOt4xu9+U+rjbcGiupAcIc7+T3gdmenRyzeCylcvLUW23qhZtjOkpu7MXVlB1KAF8yPcISjczPkkpTvhDcTZQNT9wVh5628tn1TvKuupivkCAO7egMTpvyl3W0v/714Skvk1lyDmS2RHQj+oPzyrxtopmFAQgD2mKwmBQywj9lhUS0dR3vCT3f8dTZwjnKvKl+Q1t2AVx68JY+kvDXZA2T4i4+VlbZVjw3XDhI8b6ptan+CzpS+swGuAp7zENAfl9BSiKZ1rdY6neTUWQlaUcIbRjWy9IM34p1XilwOKWl518+hgJdeTHKGw5D3puw/xEIjI2J29Tz7EuIeEohunbZPX1TnAsgfE81Hg3bwUi1z4rr+j2X0SxqPy+GSfLeNDs5XlNdxu+MmKztqvilLSehL8g/eGWflF6ck96MefxEcg2ajiiv8ioYSaRAdVPa1eo35WoFvaygfmYricHd3c3dKfcOpHABBTek9W5uSyIIJDxVFh66xvC74okHLL3LL6rf4I+U743ilbohxYc1JkfZg3hqnvPaXNV0+e05ln1kUg76cjHRKfLP8YGBYGwP8lHlDvzM8Ig0PUySUsPkF9+KTj2XuX3+UUCAyyRlo8SzupDc9GqiW6mEU91dKEG9OjdPQCaTh7ZGdhsJimCysYgQmXefV9s9Kf00+yRx3RvA1mQKewzqU7ZCykQz6fRBAMjng6TadAbx6HWxC8gIP+OeDSWkyFy6bC/QyflYBw6kL+GowEmzAvUFpAxBW3390XPWS+FQBD8q1ScTaxpYlDKZzhvVGg+9Ve3KSoxShmoJbzWY4ygz60X3yioSwosLZq6DtuYN949HBoFvDCw1qhpcBgnRt2gIEv3ojvqDa+ZiqV/evHnzS3WMRGNB8kDGS/Wfc5uQxtDEtmoH2VwSpqNb5KbdLk+KOhGHGTSD0CQHc2In8B6tn6wNbQRXtMiukk/KAIQ+umJTHggyUIBf/bykEJmh18mWnOsoVph2u2Q/YEZ6KbUaM+p3FM7WdYT3jGEZiad3lnmLD+tJ70lYDUT4oSSlZ/qhtTEg2Isqiz83dEJSkLNnFGOMb3drNzpYFe6Kl3e358/rE1nBxA8LqcWY77cw2mLGWh2uxiLnY57rzgiY0RfaeeF/KZD8kvkjt0Daif4KHnIdvdU9/bgssbHJMZapt0OvVyay0YQGtQEYJp2kyDUDp1w3IeDNFcYGDx3N5FcSSf1vZGuCXzRcVShfRBS4/ZLCdaBcUsWcTeaIghuOzIc899fRwnvKxrO4H6YvM7J1VdEU8lo59zDKibEOvQMWKIO7fR1gmETKwCpajrtCAXI6cHSDzUh7sh1HQ/c1xnBzUVAcUONu0Dv/BRodpdsC8QVWmeUz6C3lKFQtXFzefNDOb64H2Sq50VTk6CNyMBX5eTYmSiKAiWO488rBS/73hAkphiqigMAEdmk5IRGLsDD0s2RW9zBR9rB3qVFIpJd7RVSgjJmRiPNRIoBk6spBQerWTUcQqVs/FW6kUfMUm6RRTTmQyQt1BNd/ye5KCP+S3Ytl913J1JX31yqbdaNopjzEAnx8fFIM8nkiiqZDhZZG+FQF+EzElti7s39br9caBoHQelO68tlT1orDS+RnMZPiS2h5sBW1KMSEVhBjIoovoeUHmIiCS2j50SWSkSW0/NASibASWn5ciWRMCS03qAQFlNDUESUwmoSWE06CQkloubEk9qQ4EnuFcSSiGnLwAajyUfufF1BCK4ooEQ00G1kCMaTt4Sj2KLREXlx5UVQxJvZy4kvsFceXyFbDGjkfJ+NKlFwmsLX4SblkS+JOlCMxXeRIFQrkNQkzWxo/NlsFhfD8YI4nQhxnB3uceYwxb89d9NWk6Lvs1EMqTNd7Kj0i7o2ZZzVehS9XFNzwDQNBwrK/Rg6fFzSy+DKH24+qY2vKI6h0b7P3wUPb6dworqURbBPRWPGWVhth11C2IsMxNmyMvqHtfYv7jdxFpaBeNE/yLHdKQg8qgSvOuH3L57a8Fh4D7oc5Z2F+FlFt8vv7TJtYfQcnYLCBZySIfOjp5fF7yw6Y93jrlKlV0P/QWwKuomw7wDRbVIPFtowSLKIZ+D9VTcno1lkQ2BqjgsOfROsjql51kKwxptgTMss/VemHKYiGop9x1ZJloBpkGrlpkCow7Dic6LEKMsu3SJ8SaBWoTHjZpjiviu10g+nxp8dWFY1Bam7a6YbKNDSpszzpaLIH+lwdjVCwyPoZ8UylmYkYDa6OfwBa5yAmi2tSvlPm6mZq6C+U9b+6bqdYV8ajJKpRRCa8sL0Rk+eIEtd6Am/V7mTuSQstwtgEVJsrFZXxDWgDjI9V/K/sd6nLfDalkqAU3eLHAPF5zl6X/AhdqIUcVW2ULDCtQl/b9Kopo5JRqXW3uNipbmQhYmORlfo/1jZKPSJwGJoyynZiLG6EUhEcAVLezFmfAe3MBRsOODDmIHX/oRb6gE0izPTtBA9JUtnwS1rcCV2/vMzlF3khL8V1V/r7P8TdV+x2XiW6RVyDx4WiSAg7vjQrbh4DwVoHUqgqbiiW7z0sCl3zcasyNzmMmvd0VIlf1jW6rqtlw58JKFAaSyDubzSx5aEEsMg7QYZeU/fQZfaGcqkZplhxEfhYneo/PpBbcFlDeTeOLEJIqSuUNCzFpSQDopR75D6URK34kqRSzcggNfIqE5oEjCHs2PppNsIaDaP1P5k7YrLL1Q6ay/uouBuFF+41nXn6TP6CnfL2/UCInQca2+/kBflHJJO8j4rRV2xo0GQyS/a4EvaECb9ZbxwPY2ruuFfqb/e1C8+fWnKCOvS29Fx4gBbxLMIpieVlAhKWYmWT46/qmC9hyTOUUF7j5JsfYalhEsw6miNY7ay3kWVH3tRQ0FwUhAGMEVC2KLZGmUw79UwrNnUXYWnLZf2cKzAYdHndZdbvtGFVdnVWqWa6w1LVPNTdrV0iWMo5CJQdzDbi+FwQkIe7UTO/sIYUXpGR7SB/RvFppNZpKzZJRr8ItOR9M7i4uRsISuPcoc7p8o9mr0yz/2UMlnlTu7JYzk8ckTaBqJg/IjM13ZXhhwE3qeimrCiitDnJx+WT19BCowYCsgYc9THArflZ9aCrMP+ItGfZV+VI2MbGpAYmhAlKYwoQ4JjdiS4sWvjQFUYp5UOvbxaTgdDINEapMGMefoyd8Vjw5UHW87kb47l1ktA2vdMRLRWB1YuzgGDJXu8UfJu59yn4VnUhVNoAsx4huX+NMXlmacUqfvBCswCMysakECO13NvjaBXaxfDnU+3cAtLicyXkBxFdYcajT4cL31vPF9rcR3egXAnE80KWR/JUu6TJZBpw4TFEZy1gu/Qq0rayZACLTWBPYbNx0dQ9twVmEktNBBrrKnZR41GBnyyKrrHyApt2LztkMTGswo6TUtBELFgmlywQD4URFoplIizy9niGhe262vB6OObpJulxmbpHeXUZL4GS2hkllBQ52TI7lF+TToU4y5FuWeRKzY8rLkrpITsKjHJhuyZeGEwltqRz6wOR06zM8DoFm5z+l2sntFeOhbMe2EA8dIfIwis8UTQAeUg8Sgcpw4vhl88wFnkY+ox85SopfrGUf7GvXVGkDe34VItCHLAJJPEFTkkYJXwTLbDEUNtLLwg1dqtVMo3VB4yF9eBMvW/Ry2pwosHgpUTEDfEJeouSCIHDzM3ooSqCLBR8hjMPQhVLxc7QlWfzUtDtRGe7cVeh34wi4jDGdTqPJa4v5H8JfjcFvR5o6LgEXUZ6/DgaASOi2t3Hkj3ISlZGoqHEm+3aAKlbd3bfhHJtV9P95/RWOivdEthP2gXBxTuUkqnuJqeleh/qrJ2eE3hsP9BM20c9WKZDdbHJ9aMKZGZWvWohNSTDAhLMQXQTKsknwh02siMybE6C1UlOqT5gh8GK85ffS6bFYLSZUimwFir0r8aOe3KqDRnlEso76AK/BlFzEwkw9kNk1ojSimZ6RbHvRcldDlsj6Fr0NZpKyr+Ngh2XrwLL8KeLClJddXxh2Qdq3JAojiJeQgQRPWE9KEwOIJfqogiWXYkjWApFEjGI2twIBetYxmXLTACLInU22Gihtxys3F32CPqr62QuoeuNdnEsrD46F7BkpAC3G0GFv/CNrjeDjXHv2IkfkSK1hGMRHhrJVw1HgaVgQ2Dj2g3o5C6wLeQdSiCpzuZuAxiNMsEuBJeNZ6GG7JEuE+CdD9Wq5+wlrE/Ve5A/3oE8yuyWQo93zCcvDQoOGnh+eCr0cyIRODn/rynMJZ1O8Y86J5NtNxYs+ciizmKXqJukS031ssa2gqUei8eyr90HzJkArRDEDsNdv4A4EhuPb83g6O9Oa64U6WiXVDYLGYiYU9amereHpCz8XZ6PdgH9ixyN7mkxqOdZIAvJsQ7Z5XCV4lhS9bo9imIkUfjrNF/BG/BdSKrRYX6nQuTICterKHdfJ4ls0jXtWnZMKqMHpP+FDjiOHZAKd7m0TBsYJUjeFMsu0SM7YCJvZUEVwyNz5TZTAUlRF5CppRXeZbrjdKnH1pxVaj02PmI7q9rcNINqQ44L4QCOci48C7oR6ZNWJC5jA3rUQCMp1Fl103DayGgaCCFFogDdOkjDlzpdr6GGsyDuPyYeanNF49vhn8PkmxYgkj9odtCIQQs4u5piLDHUnU03lvIpF4hvPOFY8tCD9rcRYJ0NbBcoUsFtgqatWQaeFnCz8Nxcy4C8kqZWaQIEvUaPtqbYCFJEs9tMQwSt2xz1olRgShG2I0w/N1MaziRWiNezfW/5br003D71Re5Kh1/ZanbN+a9/AMAiWXHMub9W1BURXifTWWHNk3q+JVHxzPPSpDRVskB/CAxeXqy6CaDtdKcbkhkmURPNbKFFkRAQgdvlNiBKBHynu4Eo5WsujfW6C66GqWNeKQ4bV9QYO9MgxnZz9I/4D1/pT4bvgowszjRon8Kay0s2lOisE2x/FxCZGfa9tWMyLX2+eUGVySv+Qo3hykf/AtyKww+Pzy5OiQx0hX5z1obRiCwMoVarM1GtLsumocM4czNGiVLd4oMruIKNC6eo0J7yg5R8uBPadtxjXE96M7e8pRWqPHaTrdGBbgHyAvrPTclinBl9LI0VQX20g7XhYH7yBbybrMNkO+WebrITJLsai3lRFTZXmA9BlIRNMnY77iGeVRFRyYGYFFZwYTxaCqR1yxvscyuIzOQA5aHdMub8sEzLrACq0gC/inEJ+eXUuHzEklirdOcY8T+8YhO3QyIoq7axaklj1dxm5FJZj5K0D5IIiBx/ayFNbYsDICWfb+muGF7sCsMRZx/JfCFqRhoW89N5LkMIfqPJdpNDyUO2wdm8vqSbtVVOuBOM6t1pYknbLOGBixnfpnhaI9GN9VENsMytTVUKSaTPbd3SdE5n0Zwx1ZTeHAW6yAJzF2hKAto5emQnLBWK0uPYVnfOUL6N9jwzwZFQx4W51DBSgid9U0X0FOWPwK1HSiZN8gmzUGVs+FFonysKRHEDnIFZaY0NTpvjcJQyHvosRhmKFSTtIjXJZUqONKkt5wurukwrzAuoUlSSJ+bt1E8AYEuNU+G6E4ff1HJ7bmUTp1SekPTQtyZr2zF3oARn+ObwGiOc1985n74juOFXwjZzpJfImxxftkQ1A9oY06x6+2jXmGbxkRrTtXrbY+twV2JvvOWlGXZys2Nvq2521b4qTWwulzxk4PG1iVongwilQkQMHlupOvjqe3eZjoEfziW1RcCuwosr5ioNtuvN2Q5LqS4nSiPQv7m8HI6GN9fkvzTsXQ7/1hvjzwNAzwLd+XgksxhL6GJEUSyNsquBLzkoUudgl/SZ50uXaOgOHx/zYrP7dvSXvobXHaQrf6NTYOWzIzQL/qzjI9sKzl4d7Uwh9AF6SGajaREegx9MQ2aJfHnTO++giYIrDqrwyn4kxp69ya6gyiFtms0MI6KVOLM/Y+J1zGv9lNcrIZ1i93De/7ILC5eeP696V52cpFMYiKVdMhPSw3v0aeRRPShxKWq2grryhTTtp1p/7fvoHkkPNdgBrSUwxbaNiTRcw8GgFRW5lEQ+p9qV8dlerpcafyC8Guf2I66jdU7YiHQp/4qlsa6KW9wYSK8UZSjtMK4qtIQBw8MX1xRybUjNieS1lka4qFZBfeW4xOiYlMcj5iGJPB7t6qJBxGYxFO/1uf5heD5+18k8fjcYvn03rhCHW5S3dzf3t3oMZnjdv7w/H3T4i6sBvNLf9C4vq4HcqdTxHGpeoZt8VvUl5eeKeIH274klvIUWBP0UJUEorSDATpPQwXcg7Rvz8BsThaO23J1vtePEnlRHL4KlvsYDS41LvSpjv+gNLwfnp1kcWI/lqXl3O7rK2vf41itPD49JsuWde3BeFTjmCI839Mi7PRSuegkTPtrihAt0Rc2OFYQ6gIXlWBxdTC7y6S8lIrWsR32ui37WOg/W15VLnU/2o5voRZ3z+5a399Vv7muxODHQWs7Q115MLxsL5gZEE24pH6yMJ1criGym7Eu8e76saBKLRZokVrX7aGE0kDZI0K+OtL9q14Obn/V7OFroI1hFsEVV1QLUvh5LLEgWBoGWDSZMEaiqKHRGGz8HU9nzH4vqRobC86XBPvP6UYyCX+coe9MWU1mT9XIiToNrZtm3qw04B+Q32vERHEm1o1Ny2vHmeAkPW+7xEYbqrq6FV5WifQ8PfSIOh+LchxhDUm1/0z2edbT43xdwPksLBc17iEVMcvdzJ/57I/39W+IgvLXYIUoz8UOUBmKIKIXTkryTlnWmmJuReV0xPjLDDfobU5zgOpgPdwpHJHKTcjdPxgbdpGB+ZFw167Fi3dJJLYpvyZve+n4P2cAOhTs1W0n5yfCrPfy0LikV4KUXBOuliH1De0HkTV7V1K4ehdH+yxpZklt5B3Aq9aE6pJxRPYOYsQWHllcvDR7Ij13tVGaZDVTIJQcnJmr/RbuNVyJTVGY1ZBgecb16Bv/4WPiIGhWRe9DChbR2tU1LhP8l6Sr1aeg7teT3qn1PRyDqe8u+hLpatv9FZ4bmttRb2dcUWZHH44wtyPvNQu8AeBHTJ3VKyZh7Ry3Ul7CiVuRwAOJhh6cKREppdEenJDgBvRs93PL2Lq0LYCajUYu2m5iFbexXvvKxTg41wpZWYHZ9a1Y3uhPn24rZSVBBer0F9Q4WuUu3G5h0yz7bIuaVmrLSzTRBjtT9bCPNvbarkmq607veWIYzjHlIdkKPhmObsVO+5PH0K17diLD2YYvvN3glXpnAtsKdRDpZOEA71HPu9ZX9oEuva05VWZN20KM9txEfzF1wXQG2UTAXLEXk1WOzlggQsQOHVVEUwxF00k5py3fh6pYa3CBDtzGV/qXpkGpZNqTLMx0m+9kZi2RBg9PkFxptVSYDZxjGXDLmigda/27QGw+068EH6aK5poxUiC4RdySnBX6x+ywyu2jCtJfAPSmgaBtDF5uGb2osahOTJBsIbU+2CWeQM/XVH2vfWAWYXsk3THtdUfBYWGQ7mgXLrg5lsOzTind1obWKQB91vyfZxfhMz0WbbQy8C6LzcoKmZLYfHHoT+GPqUKhNdNKBz3Y9Rcw8WEUW7Zfn2pQPFdVp3HO6YgeSAm4Geptmr8OH3pHws+sBeu7MnuO+LdzUV9CFpQV9qEgRqGcKHI+SCXx/FE0cPTHcOUvfZVpz36oam21lmCaLcH7UPTo6rlYJ6mAaZsOf2y6rqcjlrmzNC3Qyq1h5Ds411n21SyTHux0c/m/Z2Np8jHWpBUH0cKRXNNC2POomsGCqRjhTbbwz6SIjMNygHU1pVc1YAuZo6XnhgsVib6ewu2PqHVmSNkmb2Q40hJTTfsIrSnpjor8eamPwUe3hMJAYJV9t6KD9Pw0tHeIm0Pp+ld/CbhHGbc5nwNVgzVd32ZIPZkLCZZaipAkebdxpLUE3Hn4KyvNoHfO7f2nByebm0fIdY7XVCGRAdWzn6zNqOAJaPvfZqOkykIMKZAS2+5ZAvqNdpiEqsoDaB6rL153iJn9Q94gp3hs7PKeMsk3HlYXV/v6PMjJK5/7LrsbGoLWPv97oYFd65/n2b56LeL61/DHIx1uQpApc+xikzOcdYJ5ZTWW5BJhhZNYgBSeMzC2eLEnJ//hM9kbaaDy4ReU8yB3SYEIvc4EcbEBMXVYU+JPn/S4IMimLaJq+ivNRqNRAEUkpwYshdCXrvd3LJ9yYDM4IXl3zD1ghOPVpJau0Ui4A6G0TK6jEApGhtOsZXhTek1lhctSnCsMCMiXgdgDcBIBu/3frgZIm55NTbRSi5XNClxorUQMtgL+BbsqjN4hSdPNUUxNeopfmmuuaVyGFM4W4+MKK5eSEvDwV2kelZ8FWO4pQ8zVcIDvQURbqnyIPGPh3+L43xqvkUSKFjoQQw6WEOk+G84COtkwMrKy+rPbVM6j56mT9S5dCpW7Gh6sq36gf1qasL6wTjSLeiLI7j7Iv5+4Eh8rr8wp+XH+cHpf1pMgzagKH5zXaV1dwzyMfMLJeI579e2vqhpj4LSeXmihF/mPeynL1tV3p9qe60YLc0Y/Uy0/at2daRc3brvws0iGqlSkZE1G3eFrG3e5LN66Duerm2sz2gzByvaKrw5SNZpwnOFgZFQVf2KNU6D4DdKPniOpdbCzabMchemY2YvvfmDxz6tk3QTL28hnjXzXNOhX9reE+hIXHnQnoxhPns1PT4zwdrlnAqQ5l17JmokfDER3a0EfwkAyChKfgASYPxJQuUZwtQ+uyL5Dw7cm6qru8MP+aeECZaabVA+6cibFtu1YQoJoU85Vxd0zmOsKMlqpuouXp1ZhPFL7fyiFKHsEWpqJMrvo/iqDjHSJlYRudsYqumXsAS72vZQefyq65wn8zclhK3NjX60C80chm17Rt4V8VNq7tEEDbHjbMwgdFR6B6sfDSZW9v745Y9WztTplPE14N4FwH6pmu5EKaLjHyJN8xzHZfxw+82aW8TMp1Wacosse5kg4+ciKoy9xFSfqwiyghiP//95UWWFPPNYEdkar4qHvcxGC9QZVGdjnKmd6FFQdG1VIbb0gN/SVjfKw+I+L5sLFRC102ACtcW+zmLH3XwIyYm8HWqa7OQOoRyCaxb7Ywn9mXQs5KzhXkvraF903x0qkhUqeLUrT2rbkdIIekHVsP7SXwkEIO2tHoKvbRcM5glXU0rBKcoV+NZ1pnJ8+6vxF7z5v8ZoydZRLJUCdzkcnGUmnE2Pe127ubWzjW4vUsSFLng/Ggj8fZU1LHpzdo39hMDWZmJrLVcbGKd7OOUYxc0jjDSafNmU4p+As2aNTYkKVsRHyUZ1xrWUAac8udbvTQcixUfOhNN3Us9WvQ7M/wklfMPsu209iM0fJ92FQB6yiifPzUDEizAPGiNHRUzQHTMBiZXErCSGRaYo+bt9e8ZjB18xQG5Kyw9llMoybbgigs882OlQiqssXU84RqqzhmRJM47nKJ10XXWK0s12y3io/7OBWJwzf0Rvrd1M1SFN+wgU1Get9268oOKOlWFE6jadLhdGlek9/T8og70e0qz5SHiZyQjsjmD0/xidDYPIdxl+7pxKl9i1FInlyJ4AIU20GEhN6a4pJJlBqHUlAV1Ub1MbElbSMISeOo0tC/ayd1lGZ5ZV9jZ0gmWeABRTuI6YRde8fhU1CM3L7NGiKfYl/draSnKuyqYktm1VyCT3QlzWNklpKM0UGzFIdWZxN6ciS8qb8O/9lODMHCbEUwkVnTgCTpkpOPolZsEFX538kebmXykmMo/YsPVCnPxQcuyOMfT2Kwf0tWKFEOlNoxRuSy9S78r9WkHNO/CL5yV4o2Pk0WHVGU/zqbG57lPksnMegVyJyfW9XjL+VB3WSgbnYA9bcM1N+2hLrVYSC6E0okzIMZfTI2siU4C7t1fzkeXqG3HBxKPLys3qZtFqrVnTpr9KGYRum5o3w+M8fzattoqcr99fngjinY9PG7u8Ho3c3lOczDwaujrZgso5J/V8N/Ftabq2jbBR9OXBcwc+1P2uAKhja47v9yKt0dXPTutInleE9C7djenH3TPZm96PBTbe/tW0DDaPg+JhW0DSCNAGGtU3uA22oKtqsdGDOLOMKro+6R9m2Be+LQRVIOLKGLZTksWHIsAMKC1u2gM6pYdMQMO7yzHcZvvira9mOWcTfo37wf3AEdXa2d0F7B8YhFFBJMILn4d7DssWx/9mHDiGPIjCRRj6tnnA3lpeEejts3l07Siclyd6ZAEQVOczLctiCqHYgwWJTM5B6XhdwqJ4FtRAdRdjjLaL1tAVcTLIgp6bZvgFAOPI/AtVsDfTy4HNze3I1bHW2H6N8hJl6eahe+Zf1maY/A7qd2uKGASY5F2ezRwSH0ViLl/O4JXzS6S6KPBqII5Hm0nSQmyg4n4LtTke/EtAPSKc194xG7T6YmVlNrHFXZDa/EUpzHPTfROB+aHkyNLdJbq0oq83iioTbs6DtieliUjO+cTZ4ZzR7uF4ohb9+NHeTtVZXqoaOKyg4Xxiu2EyPrQWt4flhoev2dLqodeGm7+k45UQS0zaXLgxyx8o/Fkr7X2kKoe1ExRS7LxLqLPlC4qBbK0hS5lO88XNGOaeG4TNnhF4CO/YA7FcYovL7ZlVCJJVdpVXBE+w+g2t1Qz+5YNRZhYR9Md4AYUara7u5wHFii/GCkvJNNZ1gWtEOepW23raZDYcdmyFvmbysraT/XLXK9lRXlxsYC9frqTHBaW3g3fGOSI2btM/9uR/FMlJbJUAnUwKW1HfA8uRSS2RZpGctKmsq2S+FYVpSEdmcdWOrsjv8/oTLDNDWjINt55OeCqNjBxaBcCukOXeupF89CevsUF8BIDtcImS5tV+JeupAwSeq+Esns+ZdahN027xTunoII+N3ULs4N6aJchCzWQQ4NwqQwLTCuQd7ZHXVMbS1A/dghySmHPMpqJIXPXjLUO/VmWyW1eqBChb672880b+UqeiY8MyO/5OhEF76uFh5TWbhzi7kxCuck6BqatG2tgNrZxfBx92jXF8PbXgpvc0931/ul3xuNtfObD9cfenfnO7Y8jxtCg3dEIiyzOeUmZMbu8F+Yc21CdyqwJNKGlNs0SbGImGHzE7SrGRPvUdKpdbS5x17QbVfzlvhQ9ADb05nu8TO7CdO+1V4dAcGcHB29iLuEsSZBsPTW8B9MqU7pkzyPnm/fDVRCUydsl3figHXiAHrBuvHW00zLWok+YKYuI5wu6IwNmPENewvEJ9CRd4uVwtn211nS6MvaJARt3+K2q+ESJQ0K3CeLu2zBHfJZ2MoYGGXLpbiOE+uNb28Bin3MSX1pB0HVaH6qsrBD2EECaKhWggdVETMUdfJM+7gdb23Xob5ODbqBjylaqR357TxHR1/iui3s3MFx/Anr0yWlTzN8y3jOnh2X9+xVumdXtnnA+P3WHWvotINlCx8ZzxfrR7dNGGIbxsGIiKgEKeQFhj+y3DWIEhj2J03R256iEostmLrSYQJfTTY6tLhldi0s8cB2AwswswNIR0RGIEejWRFMwfYQU/5MXYkpywGhkl/BKS3+rvWCLPK071+9evlqB2P8A/eoy8PK6hfDSzgsbwf5q541EJPxSiIldvTz49GnUyYkwRt8vj0GJ8CMKwaJUpVthABpmBiqYw2ywKnWXmBkOcqt2QHp018aTgcEZYM0ah2ccA/EY2/y6xaTVAXFiScaRWGHk5/nOZax5WUFP77REIFTSg0df0q1fEwtsy/ZDraTpmULU7k33NSUJPMt18C+dusYUznmnRGKE5tjPVpOri3blnZXho+eljRCMdhcq7lvtaPuCZ19lni88GazwAr5WYzVfiYD89i5+dOz6Va4UP1uOE4oqk8jvJDOrBNhjP+kyY/UaW1JpmCpKkXtuKIgmB3o3EqxVS9RrKrswESd8noI7YPNrLT4TXB0phFC1bYtpc2juRLC2Wi9NzfvB4klxfMVGSb9x/Se3CfD35KEsz1I2N/ydtFGO7rniMzXtmuZ2fzHGvGTl93vv/K+LOyuE13biZlnX8awZNatHTwLblPjgePQjtTZ+7A8fdl+f0dmBzFXP3lVYAf9jCakgp9eDUcjaP8+HuKpNshMD1PtMT6KOiyJo3IzdDGkXbDNHbndYIG90EF9qpPwwtAo3D2M41tchTu6XJEmNbnWv/LsnmqX9oxFTEtOIl39MXuv55vPHc1liqUwmYb1/UB7QAVrJi5Ae+UDZiYw8zc/7WCKpeklFD2j6dNuxSksFYhEkmwl5MYOKYhkJKLIgB6IZReSddTF55eVtrrhkN0VbKUMwShk6wscaSMTNLclFbjWU5GbS1Lw/dqOLlG88Yvhz6ciEY50Z4wRKiVjee3N4OLmbhDtVFtfX+7K00WkYxgwnyVVkmk7SvgMvMpeGhhqz/68g/VUK5whGubKgQWPOokwgC//IFazIh+AoAgFPqUoeLs3XWZWUzFCd2nBnIa9K4uwneH9ZYR3kX5u4pmbHdsBF7g6xH4Hz+FZIblPPNssY5G8J55rxrHkjS2g/OKCHzyDmWPKOyTd1h+Oqr9jvg+RJxPIxL9Zvhf5YwmVg7b0tjOQEOVfflm8sBvzKNn9AVOhSlll3e3iZ4mSRri0rgVfiR49C2eRYno+h2Gx3MIOrYnV5nPY0g76ji5QtARtB89rB2STM/VBMpkaNfLkqMq2sidl7ko4qyIvWCZsmbbUAha4rnIxfcu5+6pKeksckSzzy6qM/uCnx/7N9Xh4fX9zP9Kubq6H45u74fXbU+0nUlxwq0uhg2bZK466LzHJNJwrWQY03zLXU4p6sNzOUgmjhbA4CoFCDxvlWg+0p4XlYl8kUXvuwfOdaEN3GD3o5S6NRLc6tsdBPbcNWiItLra2KMQlgg+EPTEwjFb3V89223GzTVdSs1rqXWJp2NtspfLQI1UAuzyAJZNMJMUa2+bivFFyqZJub5VZSpR6X6tDNj9ni8K+llznsxHwDaKHle9Nrbr+ziW5JZ53ULdkm3tlQdPndoABujTfm6yDkOVhWfKguMSZtJltOaZ2iEbcpFMBIcYIqma2F6WZukkKIQ1CdLAJukvss26yTncTI+BULj/785/qt5mKSSuDA1ak+9YjbByOzgJwIB4bS7oy6K4CcJR8uhn4faGTYzut7Qah4aJth+Gjxotoms2wbbJJbtaO7vn2nEgZOpwcEyNwvekIWJB+xAfCaQeWM+tofzXg/3992OZ4gYC6Ogkk+sy3gL8SVREydNuUzGxYk638b7eP182T7MVYTI2zKfKUM4E5YCKEbj8tqD7g8svOJmd7xTQeDerO3w6OCrtzsldKjWtXKTeW0PL/1hAhtBk52yK8nBEw74NdrEBaK+qmolUZr6e6be5gktiE1BUl+B4jkywP+Gl9BmoNhNvd/VAL2bbjUUhibQZCBHS0Jg3w3VmdSCGZQqEBCiTOkYTsPblAEZYbohZzO5ahwFQy94TcVv0mLCeVno4UgGJUyexcLZ3aeo4BJWKes2bq0xYTU5mcDyd2FLLhZKi152vUVjfYd3PndxeUI0uNWZxAI6gF4lTfWGbMAu5KYBHxxnJiGmIjPtV+b5BQp+pgfM+xnmtEMuycYdVrj5yY7od1j1byQf1mNnNsSoSN/lDA0TD/rVXbn77ZEXTKkqB560B5Kbz0QKIDGbKuXQAJc7zyLtMc9qPuOhsR0FTVbziUbIR9QKOUWM3Fri+Skge58WoLMUXKwKKwqGgON0oov7WLZSb4mZkN3BeYFNhoFlPY1vdD8gCohW4C/lfSjUa92tpYPZp20xLK6u39GiJnL9FNmBY76BEt8VmjayrxuiteNs6MJpdkunpBzVeM+aiTTZ4Pev3x8H1vPDj/i3YnMAFcrkEGXFXZpQnRq20SnOzIv0GOOkLO9wcsVLqlbet1VjJ52LZi/maoqv0LC/u3m1n72jOmvA7YRcbVLE4HmcAqz6tfF0yHKQxPRCbcRgJTlSuvArFDuvo6ieOjHDS9+ypBNElYlqkUp7Q2R0fwolVbGbev9e7HNwej/t1gcD16dzOOscpdj5gsiRlfa+KZBLepsQpBsqIFQBfuAax2kLYWXtiIYzcXprj2HcOufP/dlgprx5saTnRr5cEJ0EMVNYzs4NHwbTLQY7eE6BrvWkFIYd5AGm/W8E4SbyKtN028uUMVG+vGVkJd09nrM2LUYhrk6R18C+/Std7tsBnoGCBejOC9SOswgNVpzK1Da7l2UDQ6PDqEReADoRwi6zmcesuua4WYWqE7//GlaxzObMcKDvmzw2A5PWRSfgy9u3LnrS+LMx6tj6/jBL66YnGzDmJySj65jREpSYCsDbQVS7SylViu7Hc7NXsNt3/Sa/Hxy4cL9mi342Awn2scWwl6iY1sFPWIyV+ciIA84qSC24hb24QRa7ogPmCoNgNDBywtCo+CyxaXyMTSnnw7DK2GHeIZvxN7pI7Atzra7OC2im0f3pY+x1xn5wVdJE44t9HQ0jS760OcTIEXOFHMyBEPHGYkuO5k3chlFznPtj1r3eEdhrTTIbq3g0luHahRTM8aqk4meDoPtNkOJtBewr5J8jlspLMuXsZsG/95W2Sy9Cke5j2Yer6pPVmThec9MJQQA1ivUETeEsEMqr4mnVHr0FjZh/xZcHj88vX3379+/ePrkx9ff/f96x9+OPnh8P3jw2p1/vrp+P3gQ+/Revm3YPr464l549+OF5cvw58na1efuoPjm5OHpx//6+TX89nlTyN/ZJrOT+7J9dXrO+/WaihPiDLB8zN6TEGHD6B8sCY/2eGF5y/f8Dc/XPW+++XD54ex/7f10fzDlu1t21uTerr1oAHMtzTilvZtjINvtdbf/b+7u4KOKmq0yscr2igZJxqzHeDi+DfNhS3obG/KvtrDlnfZ+mV08MPDy5put2Zrx8HgijFbPd1lk38EdOJq3vs3WtTsgUoI33uOfo03K+uUcb9DaGPH8xlz1R11G/uWnbCDgx30ebvaC9gwLB/dbH/ffjNKzE7rVGuxUCyGHx5KpCMwcMYkCvFzB5HIovYvLXceLqAH/193z7bcNrLcr+BI5RKVpbi62N5d1VGlKIqSmMOLQlL22bhcKIgcUliTABcAdbFrX/MByUNe8hP5hXzK+ZJ0zwUYgAOABIaSN6haL4VLT89MT0/fphvtbECbFZyIsiH7BXyv8lXSQeI66Dm9D4LFzL6rXQ+HNwPorcNODlT2xmyzxcjKsjZZbAoEid+XxA8qeze9AZ7zkLbbKiXrqiCd0tmNgcE4PpYgoQ1PSSBuva4gAzK4QKTmB1awhEVyhpl6UXdXPnm7TYF8gAd7YjtLJGKVnXFN+S5Scb+l8p4xoSWzQZMYc2WikhjGajSuWEbTdV434zilx9HMfU1KTMl+DyK2xuMaSUJLZIFn7b3oMQ1uOjisvfOp3SChm+kwIWzg2lAZGmLHed7pOs6jyYOFrgQdXiyZLoRBOEEa0NK2I2ZG92S8nMVM0cI6ps0BswE1ZLhp1I4umSg27fxZqWtjj2G/ieV6ed6zRq/dbg1avS4oMUzBSZZSM6bEnaNH9i/fc7+KmfW4Ka9EuggOgZ1o3/xz6bzMFMS6uevU2P9YTt8VBNntzdvZ/AtRM065aDDeDw/L0peKbJxbLh63a1yRQApvoDW5SxaUiIXoxsdFflTQYYYI0tLe9MdXaOAQmQv8UzyKLRlTHIZ3xWOKyYM51VN+urxtnWWDisUix9ArK6TxcZbCCAEyjMHTHh1rLdC/rkD/Who6kwDKDm7hAxxFV+EFmWD4bSwfcYUlJUsszoJjIyVaPj6pHVJRwp3ZY9EkrVl1fPLCbnUWvzXDNALxEloVUC2fUL1cOnYAlAGMDkaAlb0pMwz8+DxGmWJ8brya1Z37ZAT3Fj1C76PoiOcIaRa9UmN+b80mPp4uTeZzOTrkrOsdLRFRY/VmsOdHtO+AT6mG2aCtNBuy0ChzMl+PL6zViIq5qnmooKt3bj0bY3sygU6AvEXreZYj/6iNMlEk5bi3ApUoA8y5+0RjuMYgW5dUaWUaKGlOTBBySWiU+TQiqRmAL4zKI1YxxmznC89dEG/2zHIyltgKioYx6ItYevl9BLNhjeJDS8+lSYUx/Fg4q+UYj9bsC/LVomG0EuxoP8+suQHsjrK6ISvcxPAsLL4lF1SpIwmKAfxxbvlfePxSGHxSPFIJLy0ngcM4oUT/VxLF0V5oyVqVbKqmaKgSTXRpS2xuL6+22rWrl+3PFueJMdkzaa3qs8K+mrCN18uuJOQEL7GQsJ0XXUedbXas86K92d4c0X3g/9kaKipoYC1qzLKZqEDuP/sBmbPoJpZ3h6Z5xmRKBRG0aKXlUrnf9MoItLDdeGxaCxtj9EuK6bRoONOAGHZjPJapAaZWYAxBHaB6d7+BFqoDkqQqlQgaKcso9KRGySorz2lNV9LRMH9MWjsrPFVTUmOxkFniJx0QS1aKw2sLGWCKJBsRF1arYdzyFMfL8O051m5Cg8iDbRnhbIVnpvHwyWiG+VgxPDnUTgrzSQoFJ+q10xylLgfKj2BAtGzxCeg1DltDTVC8dJpgEjA1mWLEpUOkEZcGdqGHVfzpZaxBgOmFPDIhHsH0dj6WYKcmG4/QlMZ2YOAJMY+uXELGRY/Rr7roFEbK5K2XHAvoX1muFD8nK5z5n7kRehx3P1BvCM17HHdE7GOYhzCblyD0NGRYqlhDhFoAWlSSjpbn2ZsxolBamdJ5VkvCnyd3bbjLGUu3IHoihjfctGi/KOMtEq9XAv0c1LtCp6FxVmK7LXzmjPOgOmxl9t0yIPTcO7qWrCL45w67WK3oPIkJBCJEySqS7CWt2aH3TG2iM5hgx8JcGqfCmTMn/n2kFhaZ4uJSBCinMkbcyxSxMmbJXdn0ccbJ70vMVAobdkE+Vf7AdMk4Gby2G5FCkdxuVApeoXvQElIwY82UslAH11C6JuEULw6oTDf5OWmsqqmkSeg9rOESWX9eRJqOOYFoMXXs27mHoc7M+Ax95MmyPFa2zi9fL5xPII7U2RaF+ZUyLJHn/HC/ih1lMr7ulo4OpfAAbIhW4+aif/nGdEn9pStz8yWA3l/J4+Y6/DgskeQGl9qPvjObTUSGW/S94RU1tF3PG14qO3vYQ31+t9Vuafa6Zfdla/Oj0+MmrvVITpsDJNGjbbqo8MokOG0OqtVO6XVPZfdkW3Oj0TVFO7Ats2gZCJtYKQqHzolLn7Vaz26DEq85cajHaQ8j3+1gr7q3XMBoEPjhERodR39NPBCRtRFZlvQICOmshZbqmsB2ygY0f88knWeUogGRkpoNSlBw7473yxx11HDMMd+UItQYhm+51D3Ks13H27EC1VfGOjqvyY56bXqmTVduxUzEWX6aqBJZiG2RgyelKyutU1FpM6ixMmxRSakDo987vx0MDXrC/oBPGF87YUG5zZoazaz5gqXWpCHU3/ZGTrB3ahxuePCdl1M1xdFoBISZKMkYgNGYBpAKgMHSTJHSLZqn9sECpUe6yQV9J7y3ITKbvU3TSmGCUZa4YEZMobhXJN4MUg2owV8L5tJGzU+AF3YB+L8zZeUUJrYjJrJQBu2YMa1axmT0/Z4/2zXaNiDgThTjB7O3OUAOxuRgzoxPxXhs5R2aL95xywU942LBVJ8a//s/cJONaMmk1mghOaTWEWxkF9hrgIn6xmwICsI8QZAnIdqDe5xYCtCooBhGD+UQG2vXF9x/mWHnmGGN9mr/eY4nR+3RqTFHnx/WLd4c9OeXIDccgeWCEUeVIsp+o2Qap5yCW3M5eVmg4NPKAsmjL8isjB8k/IseeZGbwhQByoYOpOEp11TxL+9tmA7iw7oTFlJqG8XboEBBF0qaR2PjXTIaQRrQskdMSn6fYOM1ybotp5rPOuOwTyVsZgr//4lNrdVttG8vmuZlqz1s9kvE4L3GwsCRi9YG9WOFf346LFtgmZshFq7t4MKTQB8V4NLyxYvqhcU9pIZgysMSTtUSlovSZ2iLKcYFJBU2FtjhapEA4QLyMNMLWOEmM3C5PF4o0WpMxfhE9YvPmB/t6CWd5S9SKcYfOabtOCvpAPQ6pUsFPcI4gGCDv0JkS6WLfun0whrCBl5KxcGrcHgs1oM3bFgwFsvCCOo9NcwIRZsVYy9FCnGV/VOor5fZE1JhljYxlzcvi9oY0alQHU7WV6qdhJeAqLt8ktQ1AVFXxdAEeYQGofL0IV+2z0xKEssXHYGJYNYmvpFqCvpfpfvQrIVdEwhp8ofJttGb618HrcZArr3EyJpX7zw1aMs876ZARFO39UCJaijQ9ek6PDyU2xKxruqsgH1Hdemr8ItXaKeEKRYEVhPol3XkyFeSvCIDKVJX+JdGF1UeifFOCst7iIKmTqvcCO7UJJ4uToRXSicth6bAx9Jb0VyGHaVIfGfL56I1qJ+3MYVb/UNr+KsREBRhLM+ePRsgddsz4SSwfVbO63tcTMmNlDyYPhCV9YAFe3W6X/GC/VKGXxFJaQY0NIveQ4b0b81+T2/Dapq74k3yibwwKhgjBggAVrEJZF6ezQuW5l1JBsPHwBzbPvoxdQhwySsWPCJtz9ua8pBBi/k9K55MLe3KY5vTxDz/yadRxaWxSWzvZXh1eACD91CMsGDXMjbfGdPmysjS8zDJs6CM71fYUfDnacSfqcqDeybOQoWx1/Cx7qUcreBEQzplLrzoiXrWls2OnqJ1SHNv8MreFkBkX2Jhnkcg69rxBAl7MnOtoCLGd4tSF11Betdy+XiibeQuD0f9Y73fbXWvTlc1qm5vaFzSLLm2o1K5S8UpaSxKmt0/djaL6lr0gBDdK8qE0OBV1NBF07JyHlguHWvJEpDMJrbK4bTkQcWrbMkrngl1oS//qbADukVd2OIq07XSTpiXt0GnZIstOBMp2WELQuNriZ71ikN9LgG16OpWhT0lA54KBjaGJ5Mm3ACTGsLF3Ry1eDBXOFDFIxYKW98ZylY4BKYu8WJXnKxmLWAuDT4QG+Zql68A09ZyihLo/mA0ruv9emPY7JuDIfrfr5utq+shPDisHZdiSUp34dmZcaRzM2RBlZ+Nf/z3f/IdXToKLw2broPwZaa0Tw6IIys3KAmyBL7cKsAsvaVGPa45oqOysqo9Cpv595ZLaHv2oqSd6JefQ0tRYGEFq7GYlG2a9oUe0G8eNLvcQJQwCJWKkZevtUwIJZKUyVfMBJTiJ1v1pcVl7i1YjBStSEYjSgIv48iZrsz7n22W0zVKR5NSmWcY8pLcM2YaYmi8TnKRXTw5MpX36wN6Ol4kEiwDWTpsH60lP9S0ki42zDtTLqcWXiyQhiaSF7kG3msRO+bWUyUGvJopfpRTiV5Y/vgvyapwYNzSnB2CAlhSfi6XIM3GBuGls9hTeyVKr4AdYsnKNnACrtwRo3511W8OBq0PTcO6c5cBG8ri4eOY4ASb8Ofoi7tbYoL8U8SAPBDH8Gf29D4Q+dOrrLHCInmkN/01pLxyWT1CLg6iPcwqtbUcGAGZERpeROd3uTBanU7zolUfNtu/vmZwjEMeTWZhWAnwFsNRLrQbL9xYsXYWzh/Il00Tet286fWx1iRHoGQLWesXA9+UD98Yx4f4xqHu7ajRrnduPoMAL6w1eLCOaxn/+Pf/kBZ2RVJHxXiXseqmVRAsWzFG1T12JE8QNpC5XEIweCWliW+AX4nn0tMJjyiqPwCnGKFAdQASpTMGmQD17dI+F62JIF86iGzLAWQUvNwTEYRFgFRG1uwDnxJtwrtepxfWJzqjnaglMdbXiLS3hhRKK/dQJw8dPYdM6Sldre487Jxkd6IN2bBVgVDojEgFHleNCo23p4jsM5LEr/6qhVfKl3KI0UWv1bOFJarD1HSBTkferrGC/BzlEzq6d1J2LzqULxTDhEEkIUVVws6HwUyBrvBH1XbzoHN4y7kM1bshjMyrpUotrTrGxEu0BLou8FiCJLcd7SdDenqnRXpSiRa9v4XyEvSRCUZbkZkKK0WuAxLPkoSqjvGh2f/VmNBK6g5qJweorYAwclg7PPbxrLBx/XWfBrtawegelCleOqAgIW1SwlZ5pCdW0vjwWEdN482/UC/QuWUXTV8SJybsuPFmDHyx3xq2GvW2yH/BK5Kr6LrKEShKUeXzSiT6oS23RKhxGkL9AiK9cKkd4tGyg7/EmYtQ97u9jxs6kUqV4C16wocd9NJWi1UZ9VQ6JkCvLx/dN6V8+Hod2njpdWrjpde4aM/nZGxbAaGw4rC35tsM20wxtEhIlbO1ZNlZYljoSu3d7DT7V81u49fPEncJTV2w2fFNHH4tPIqVYCv0UErUbx3ZhkyAVzbjkNwhgV3UoUSOJGxwQ8Q3e1tGbYAJCJAfj5jo4S79MOk4bmO1Wm1TJ9Gu0V867Osc8aW02PI9iSsFZPBdo42swuA1tJl/yRo/G88EtGSPwI5nVO6WgTGGzSHAcrNzGEHbwXxVPglR33B+gL/jvpwmlauevTGOCgvlMrX1aZd23wCxx6qHJ3qOKFDHBSoJNDeX6yAhAh4K7Dbs/gY0QxsDJKT8nRbwQXdBHHNpx2inMOlsSDZyCdhw1DitrA/lBUlAnv6P0rwmSqDB9CJdGCxH1tkb2OPDACv4iwbOFMi5ouhJgTweDFfJtlUtoJSslfmdPk8kcpQb3qzZTZSN7SyLoyLLokzsskxuzJNgO0YOxpsGKxfTxdbRvbK+z366a+DiMtDuOvFg+gxrggoXI7oZppOPJf9HW15e7eDvhCLSnxahEzV9jAnuQ2OTbUq2Ywfr0sRmtFCUBtR3adQYNM6xNxBvTP/ukKeAUYH6uw0mdnVgik2mPOxneBmD0T0ZLzEFhUCftkE7YVsz+yvd9Q36cpoEunp3E5KQcbpk2TBoaU6Gl4ROHi2sRwObzn38r13jhkrKd25wb9SpFEv3itC2MgBtYkSVo3vrgRg0sZjpkMc7m5i/gy40XdrjBD1ImUtAOodhJ37tHATLxsyGv3kjvHPJ+3FIyac1dfOYS20NvBJ92hxY0oiV+Ju9kLglv48pi6zFYvYMs/Vozsnc9Z7R+YzCS8Uns4nKUMMH6tH1Zgo7E3/qYZ5Fhd2Ix5TFTU22L9o3cXEpgE74hykUvvBsVNiH9wS69GCPCIoeNBEj6xNoXwsLvTlVgxbiAHXk8aBD5kYHmqvRS7X0WApKlupmGdgzv+ZPnoCHiE4OJk+dqVc1zpezGQnYX+tAwU7OJDiIxUz57eodedwAG2RpMJqs7co+lhrhdkf+MBsCxYTDEFjEoGTgJsO5oyNgRgjJQxIDmD1Wit7V2MxT2AvXRb8yCons7pq9EzDYjTWg5BEcJqNaeATlDeBpmFQUQ0CDBF0r3kBCzwdpzR6tZ/PZnNtOCkjpDTXIDHWrOPIOcvGZbvzToPoj/JryGZoBDFil/UDSk4DRqlNpng94QitUCATGz441h/3f8qZ+JWVEqmmdUjeewdKy+VbXxXPYI8sbm+gNJ0+mH4C+O/eZAumClDvyLP8etq00CSHl+8xgZESZViKjo7uYWQHu0rBaQWrhD27a9eFlr98xW70BO3gT7+McRKacPurBju0nJuPuMRQvmh9ajabZaQ7rbY0oZKyfTUFBT9SfpMBnFM9ZVuwLrC0Vsa0UUsj4/Kjc58drfJ7HOfFiIR1mQEb3OGzt3keYvo7Z6V00zUFzOGx1rwb0KI1MbXQpchqtGt/+2GeHbTisGKIUsgnrm/h7VSNT4cQFFr6NKpKMW46KxVcvrczGglQYFgbDgh52BjkD1gfVGcK2Tt/4XOagsSS88Rz9i00LLbbOMEx2tSJD2nxHiyUVwbXGi7/FW7OnwKxxdJ6CpUcy/XhctmFi94jKzDWWnzYLpI+KDLuVN2kgDligI8Aos/drHBLo5XnhmqyHitGMI1MRjSTm5oqS5YXto1V3QFBarqWJ0UDfaY9W5XdJUXlgxrEFCP5+7Qb+PYe5ARLjwxrdSYWQSNJIRU/x+R39lN1LBQAf+s9+jb1bG9zbZDY+n7nu+LYVSsDyzUKYLFAFul8GHBmc/kUaWkKIthlaPllYDsbicSm62bium/VWx7xtme1Ba5iLjx3A0uRf429VxkplN6R0l91m7+/mbbc1NAeNeru57hiwlZDIlSlgqv2oq4c3PrYuhtdV3vH4q/I9+tq6s0xkKvPpXyY8x9HJppYYweLejDyvdtW5ICPXswI31HbIExnhfN89K7S9XXnIuM71BV2csIgIkIozInH6AZaBigd9hyr3z6Y9BnEBGl1RQOVeSwxJLstKUcqjgxgCzHydQ7Ji46otiIf/N/3xl6gHtCITMB1gQHxh2s7ErYpVekemtpM3fyiiIrsJ2a41fvRw0NLHILSFMGchzNgd8fwaQGgs/cCd9103Wh7yTS0Q8XcLurlqkYDlsEA+Dl1INULANC1haOgOcIa5iFdIeS/zo+OUr2qMqSJi2QBOVgDMYf+1UG/AXSH9Y/paysdLO/07RkkrHwqemvUlHnle+Q5uZiBpLVZRtBaKD3CCaiauesCB7r3qiiAKnxYm1AIpYzCyZuQGC9XftvaqEgZUdFN4sdJBdcljA/p1Y0+J60SwsK+bA7vEoNAB/iPjhXO/MSw2SKjHPBJrAdN1Z3lMaNsvB3iPkev5cjIpjeReRPod4vvWlHyAvQkkxiTk481BXy8QbHkUL7zlVFdH+zi1Q3ehoXsMYJtMgnM3AD6nAWQHGQIaiKcr418AGO5nxONyWllobGEEiQVbDFbL+Q0EbT3EEcE6uSgPjUastEDuuSD+KAnupMgcjEkXlrwu8h2MPEKcjuV90QWRVuPG7B1KgIq6FAmbVyg/rViKwifUZoQSVvC8IJWEwFW7qneazApwdduuX5mD2/6H1od6O03NXN17UA0D3a5S4R27Ws6sacTXlB1TKN4Zxp/8NjdvDsYRv127RawCkVJ0KyV0RFSIY1zFdQLPnXUsW9ojqQCSRjnrQr5ckllsE9cBdHXv0AI2uWdqAdpwR18WdqATbpcEj673pW3FNj4m9pVF96PlOaA0qNFVL3jZcoCr2benDvP22qMKC+tBG2HCTnxyfGenGWVS6LsiMOXsjraTuqrUyCowWYyyjNU61poQa5feg/2QzgdUGMNw0q+g58pSKFp4q+CqAzUnkpFIGSXyFHhWeuG/7HHpu9MlubInKHr1N5Gu80FfuEsQV3FLBElntPa+mA94gCG0KdKwHqjrSyz5cKl8dm6tLSjnQ2RLkMLtEPdRJdymlK1SbJfMwVahRJTvSFuT8K0RErrtmMzInVpwKR2fT5XVzjZ42ICyw3pwR6UwWrX7aM5OX7oXzfrwelC8az3n2nXV6+I1utPvXd0207oTMhmB/AUBXNfjHq9MjGtx4Ub9Q7N71Uwj1JXuZ67q76bDGT2++dCsZhADPDabF63h/nc2IlI4206va970m2a7V78wGtfNxt92FB/sqs/vYRgctWmmO4rn/vQInu4gksapsWP8gK5EZgPNRAw/VLwBt48FPBZmnYDKbqr6EAeuinaE2ydx4LDcVeCV/tdEAyeKV/yRgwdJMfxNgpUNaqd+QUt+4wzB/82P/frNTbNvDHvGoNHsNlXzJUMXZnST287pIbfQkl5rs6cf2Z+xPtZMEDbtybMpICxtZZ/MWaJDySZzOtjqtobGZb/XMS5ajaHoqME7quwftFnD8E4TLfXm2B4FlW/otZZQ3TsVw83MlMypgQu9knyTVY7cX/dkwJ741J5bU+JDQ5VoJdDjEcpm9yvJD6vGp8/7yJ+OWK3ST5/XRgE4FPcJZHQzekmk61wbPh6xWlAwWQ1Ib4VFONdsYG4tTFrpPRU4fwPPiv6Rt0YoCfV7vU6re9kzOs3hde/COFaRzmgJSxl9NmdxB5BqGcIqfov8IPwm4gXiVj4feJuBRA3/oZ4xaEZ4j1IweSdjIn24ilP0MB+7d3kj23OMGxYtZjRw02x2L5Q7BLw8tv3Kzu0C3yVjo+1Oa8FTsKMM3dhdN9h7F//J3K/EAX4lVvhPFmZ5zak2EsrpMM4icM0Eo1NNnSxhwP6MoZujmQsMaGlX9hLh0retLnlUxcPtDvu/msPr1sC86Q2AECoHR0fvQWj/+eioahz9fPj2fcY8slgja27O2JE9+UTwTnQieKcqN5IHL/vwQSw+kjXKHG9R01UD4xTP4hgYlcPq0eHhPyVCEKqHoOVFhxfCowsHaWcXdqNgkprke2UV0sRfq8Eq3FWb6aal04/hDXi4kQi5SzXz9E3+2mg0h/3KtNyVN+OYRlgKDOV3FdHvivB3F1VGnBHkA7Qf9JAh/BPyBVUMvG8+EvIFzXALEtjsBEf0CQtNU7yUUT5RXrcxpBgroUcAVKtQcDtAWmJvnjKDXD47C6EpWGYWp8yHrNQ1EOn0pFj8hbMzgykLuGeZzS4GwHR7Q7P599ZgmBHppVyB/r37COtuUcEdFOO8MA7FHleOfjk5OeJlsVNC8Wja5TSEbj5egLTZ615pROj4XQmEWl3zEmOBskL0JipCXu9g2bqdOH53mN0J1pHcs8Ebj93bEmNHf17etrMCil9k8N7+8iqDd5IzZ/mDh6IlLFJz0KwPB+Zlrw/7Vr2jb228LbU26M9280OzDTg2u1e926trXbi9P/z56H1p5Bq9zk1z2Bq2QISDYWx2btv1IUhu2pD85fi4DLtjK6TXP29daMXpRA9OdPwyEJu43p0NQqm/umvzR9KahtdykvDQ2iQhxDPjIC/p9WYDc/L28KccdsYGJ5cRzMgkoFIn9DvC+MAI0J9Xwwd5yZQ2x/xd1fi2h6BBf2XtsAMd1pgeMcAn5r279PBgjR0sMfvtqBIiCupsSYq4qHfXWuWFGPrMntsBjIZC/AsfAfGoNI7Co4r7ws/7/EhtBRo4S7yAf8JtGmGGf4eY7O+XHcx/6YFcMWx1QKlsdVoapa/jdznsKFM1RHPAbSvtcNQan6aoknilFcrKGqrmv5qD20Yj+0D2+rLM+/ShyZyyRh+236YuLH4qiEW7NxgyVFI3sM132J/TkaGqZLQYE6bPNbSYdEJpUAVVTWlrf5xCa7nft20/3eghf03wW4eQsUmHkPYYIFJLAjy0gySTjxn3anHt8yyuIgutWnGyfM3z6MkX1vjQ2DU8yx5jylZnzG1UxmTpjJBD+7SuE+jytkPGNN+puzDcSZRgAR0TcxLcuysmAjQAdMj8YjlfPFfG7ijjuLuryNiFLeDpLtCX+0sHI2kQ2hih7WSqyPxDxTSm536c2DN2tgldRJ9S3Ft4Mmpse8wLBj/oGbgq/Zb+RH+s69cerdmXtP7KoMR3+FkII2dHnCxnMxGXD03hr9pvru1UQrwEpJw9MeqwiLALQad8KVAW6LKv8/conBJ8X8XYNsizMffxtFdlhyaL/sup8e2PnXCXztnVuN1kxfyLBOr/vrQ8dUSDOC9kIvZVAxNG+s8+zryCWinh7Aybg6Hx7pQWEL17DsgIjUsuelUa5iWOnVhWxsfW8Lp3O6RFtweDZue8/Ws2VQcqH2Q6QQfomwRMa+ccjQrrx76xO3aJj4ngMPAtd9wClXcyszxmcBKNhIEZUfxTRAT/E60qeppsVuWzDN6GkN+fGrc+MUyaDdc0aybdfkwTKcgykIr/OWc4Vc6Q9OHktCDaS+l5ZmrZYI6nPlYwzvggN1Ot3J/5Ikt5WaeeqWwjZYNsXPKckiORut0Zq6ykazWRD94ajYjvG2JkVC1ltpLfQmIa1R6h4H1IZj8JMuPU5Tr8YHwOcak0klziYpCLkxY/sv8nIKyfVIQljbJITqCP1lZa1E5rKy3k0lokQrG9badPaGCo0ZhZgFrL+Y0WUUyQWkLQCQEk3U74EDY3WXwa0L3OCIjPc7XS9DwJ+LuJBgBGErTYM+UOcdyB+my/FeKFDiTUI/BN3G1R1yDOFGRJzCng0/TSfICZIihnpUi+qADiP6wBAF6KA4nA+CPPXgQruMQXCH+KMVUT6A/bR7mZxad/VPbwmf8jf7P2m0+dUXuyKpGAgq/Q4BS/Ij+RPuD9kZ/ypAxRf7CRQ9HKCr1yCPBGvNeY7EGARdeT6DabefiMTqVN6Y/V4uMN8AlhabQV8yO9BEjGX6NTxV4Ro85fSE4Ce4kHmCuQOV2lOlkbkfu/8m1Ij9L4VPa+Hf5R+3YE/x3/sRcJlbx7ValL1RD3BCEF1vRPQj2AKQLHEJlcwqEvJVYM8QDmyoqJycrsVqjeiKOuP/JT+j+OUI/+MQ6JH35dPJvSd+HPH4y92kIc+3We/NSX4NleDKO55fn3Iv9RfGY+NPuDVq8br+eDqMGdeJZUoEU+b1ginE2ahCmdq8Q+weFI0638Kv4RHt6v0ACtdJ68M6DjJmbWmJAAcw0iI5e+oiajFZzlkdsA6ZXPVuwb7KQ96KCw0JQgxcNad/GlRd8nXs1zA9erjcnIe14Eqn7zj7/O7Dt8zZ0vYM34GW+GzZiY0N3zaeoRTLeX/gknEL6aFO+pJkXhDOBr5nBlFXEyk5dausYbQZFZVHwJOosvOTsW553y/IfMpnvzN5OjZF622k2zW+80VcTAUTk4yuw2jK+MUAqHS29U2SZm/kkADoWNNGaFeP4fUEsDBBQAAAAIAOqCR1zf/qymzgIAAL8IAAAUAAAAYnVsa19kZWNyeXB0X3Rlc3QucHnVVsGK2zAQvQfyD6rLgs0Gp0uhlAUfStmFQg8LPRUKwrHHu2psSUhyE1P6752xJSdx7J4KpbrIkvVm3jzNjP361ba1ZrsTcgvyB9Ode1Hy7XolGq2MY8qOjw4aXYka1qtxq4TCdNqNa90V3O8pM+7awgjtuIFSGCgc4derEirW5ELGyf16xXAYpRzL0GGqc/eSflf4LiwQKPMGYs6JAOfJhkUOrIuSAVurZ04Hp3iyiUc9JWRAfFJ3HIF2LzSHIzn+GaW6i/A0TkU/q9b1s4dDSQd+EXmCaqMKsBZKxL7x1tqCtk4bVS7qYTWsSUKOweBeUDNt9iU9x9pAJY5ZZHJR3PFdW+95YDlKirgLidOnrx8fpF/ESXBzECiF0iDjIAyGccBYQBaqFPI5i1pXvY8SllvSzt9AzxidIMEBQ1TthhFNkt8yIUnfQ17ve2mTM2AA00E6N4ImZ2hwZHI8v2yra+FwKyZEcg0QFQHSWh0AwyTz4eJmrNMolHRCthAUuTAmids0VcagFyhgMnDdIcrDb6eJcQ2hq0LYJYaSa8H6TAKHhBlo9QYoK5O5uE4JeZuxu+v3znQLapW5y9HzpE7TVkq9j/s8GgLALDK7KEkN5GWczIgExwK0Yw/9JJSk/MK9Bbd9dcxzpYGJmR4M5kUcPX749Pme3dhvMmI3Xs0Z9xOUdfkzZH0UDIxRJiMLgw1ktWDgT6mzLOGp5MJVUsnthhKrFkC9CJ4t3cECo1O5h0ZG8Z858on2n1wIsv1L16H2mLVek5SbVvIWG1yjuxrexV6Uja/c+a6CFnJZjjUHR2GdjT1iQaXQ5eeFgtrCP5UX9UAJqN0MIp8k4UQAyl7ziw5CXwnbNk1uqMFFT6GRIIVyw74M8Q6LRzRBTwOzeOw5myDLpg8zuTDuCZ65SU5fUSHd1Rv8dagY59TzOGcZcuKcfhY4j7y2w6/DevUbUEsDBBQAAAAIAGuGSFwC06IanwgAAFEiAAAKAAAAZGVjcnlwdC5wee1aUY/jthF+P+D+A6P0EGnX1t3mgKIw4ADXdg/tQ5PDJn1odx2VlmibtUQKJHW7zq/vDElJlCzbuwlaFG38sEdRM8PhzDfD4ei+/OJto9XbNRdvmfhM6oPZSfH+9Ste1VIZQtW2pkqzbkLqbqj6Wb1rDC/7x2ZdK5kz3RPrQz82rKo3vAT2bqo+5FnBcnWojVQ9U654bTLFCq5YbpD+9auCbUjGhG4Uy2Rj6sZkNTW7GEXgYEG0UTMSvLIzCZl/Q9ZSlovXrwj8+Ab2kuLrlD1xbXQccCSeCH+KmUYJ8oNqmJvMqSh4QQ0jy07EPyUXcc/TToPeglZsIJpIRaI0mnVEui65YU8mbifWVDPL1m4pSe7frcg1sNWHyK2SnNpFp124B+eftJKfWU8wsFFyZsN+4iMtNTv2gYMMCMn3dMt03A7GBs+rAgx2D0AAVVneGLouQYdoXoEtoprX+A8X2tCyxOH8rxHuuYRd9TIHCvUwS1UjYlhgRvIdy/dLq2qSOrpcFuCqJXkX6A70WQNvqvpQst9ews6M0MbIzCu3sLuCvbhVRts06hAYfqNkRfqF0opyQTy6Ae8wDXGQuWBoefzrXApERcnXqHX78pGbHZE1EyGmwFqPYDKGW+Viu4was/kdTigllV5GitUlzVmUEKpxc4GCI5k6Ldhn0ZTltEgrwFOMhHSCer3TNnAzbQpYNvacyewUESjcEU3Ix9/Qap3nrNPAVYxWSxidgzN7ylltSPwXWTQl+1aaj7IRxS3aakb+bI1vH0INIM5CCBCIoZMBEEe9wxHITwXXUTLej1frFBIHIBziz6O7F1fZjWRdYGuMs5ESIwxGqwCjkJC8CMw6BBB6JHGk/NlYDmThlAxS3dl82G59NVwLTP/SQJ+ATmvuMwfHVD70WPk9ZORbO+RSDGFx5hCxKGnfb5nR/KfR1r850vUIrcGkT8DHM4O05gIEPP3+35zW+oV+TWv/F2mtd/jz0toEEn95WhsqMcLgr2ntfy2tZZ8+3H1/m93e3X13l93dgnsUS32o+IJbRT9C8nvQ1/H9h/nf6fynbPXweJV8wnuLyxWEGnSHYFSR+398tYrvf4S/1wmOCcJPNTmawNJtNppBGD0U18mDvvoN1NtJkGF3VGf2RpS5LBRfumcME+epPKeenee4wAQxMi9iveTCgnySwHt1ZE2IGZPvYuRMQXVex0fxfNKBHkLffW+TyvF96fJhlUN+MhmiO0MNTpiSC/OftKRVitjLwosNbE1YM8whoUknPSGk6elBeDsGJqqMxt3F0ZfRKXfgQcNFGEzDDVwvyc1kBNrXz/NgeF/SVHADcf5fiH2LHTC5ewk5kxYOTsmLgOovqTsqttaDAX4Fe8zaVe59Gg8BYd8Fgm1UAe0zom2Qc+37cWRD4e7PHFljrMzaDLV09OlWyaaOb6D6CJ+/Hj2/H8Gw21NKAXaiwNN9Q97o+IqqrZ6Rq6v9I46SxYOIyJtej0tyjhEZWWNTDtn4DsDHK2Y9ET9EXdGjSN1n6wWoEWTiN/ohSkCJY8FvSDy0yUi3i1sGqSOa3v/Do4oBGBYXxOFD0gIJ3OllPSMCXlTlToSAn00fFTfMgb/Tbtgy8TpNXhnQDxkQcPGLLg5eN5ArmMKQGd2HRzdewOmoshzVjt0GdFOacQi6yHBrYSj6VQP7YLMR6yJs1vXbsM00U9VpBCMUcq74aUWMkzGQKWZ7ah3FQIxTJijEWrJR4Rs+jNfQuVTYaDw+LSfWxB8WKA46yHVUrpzg8tZtoRzbZWeBsJk3dcffNyA97yCzOmka7hzxnh2WJa3WBSWAzmpBYvzn/t1qZg9B+3CzAhgo9hlcx5YYeYF6mdclO62MrQrtkiB2uuvZm3666YlgmlypTb5mB9FhoYMw86vdLFYjf02Uzh3n1GHeYyigOzqjeoT6iW+lCEopvPrErXTrbgUmaXv36Qe1bSomjK2IVZChC+Y67FD6LqM/uvY7ketNo3O4HRW+/06MJCmA+C12n2cDk8EJYzBplFTrZbfeHX38AW7Bf2Jl/bGlCfgYZBoJee72iVZ1CSfnILnDaeFunsR/D4BVMTnikBX2dvxSejKfg9PncEtD5/8MbiHnXYr8GewY33Mf38A+G3TwnbtSWhQZ9X6KIy4AopAKd2DCpXvyzojOsc3n4Cbca8fqwG7dRxBaF9lPcD+H2dt4zO3aIFIdSAxYpRA3C+J2tJFlwVRyQWxofJBNcwdXDSJZBjc31i2o97zuGikUyS6IDh1zXjRSkrZLUnGt4aRuXd92SC4stmesnmMaOr8SkuGlh6mKFRy/MqXoEi8bSzIIbb+Ey+w4F/eFh+jOOJsCdGpnumyNOXeUoXqWMEPViqPi91+svLuQc4M9JSzQsCbs+WYEob7ExolrdwUpzHVTuIGSNNQQo3F53EHxz3StbRMjUM1z48cx19BZPuMLWsjfnQ3+BHAaWBNJ/yhVr11nsYAcOx8TBuwpQgMCUUX32AYMKaCwQ6ZM7sODDmsEd5BZfdpH0GfwhTEU0xvCfRjMO/wdhqJeLCnqwFRQQ0HQ6DtsCnVNvY9tIRtiIFLrKLEXMHuz8XdAPHidqdvvvmm1L3Ac14pt+BOUuJTnN1mrv+zxO1C5lTRWOAiPQYHdVddrVztvwga2q5Vj3GC/2/YDNEZY+EE6/fS3P9wK/9DeK/u3fuQ6t/3C3onhlQCxY70iZF90B2oFF6LlmdLc1jHOseNSEoUP6slBRYrr9xJH5UgQ8B0N2VD4azsUgW5cu9LNLcGK6Fz8T1yd+MmOgtvUVKHUasdXpGUtyPQFUk/q08fzMHhbN02kPljrUUnD2oTXe/ScPwf90W6R568xBo1dAI+FDCNgWgS+8YmqFSRHLd+hG3xtrCqjGAtCi28FHkn+8ukzlP2PGuAzG3NZhs3oKMuw6syyyAt1NejrV/8CUEsDBBQAAAAIAGuGSFwPBFg4kQQAAB8NAAAKAAAAZW5jcnlwdC5weZVWW2vkNhR+D+Q/nLgseOjEadOHwhQXyrJLn8pS9qVsg9HYxxl1bMlIcibz73t0szSTadIMJNblXD9950jf3dzNWt1tubhD8QTT0eyk+On6io+TVAaYepyY0rgsSL0M9W42fEjTeTsp2aLOJI5pbHCcej6QpWVpOrYNilYdJyNVUmoVn0wzC4UdV9gaq3F91WEPTc9F1/gY70t8xnY2bDvgBrRRK7j91X4311dAP95TrNXEzK7imm11Jr4CJrplF5+5NifbwYL9KTSzEpA2/VZY9ghUhx1vdyf2pYKiyOJu5ThR7hT6fRnCdzGvQctZtbRBkYSVg1T7hjK/lFQ7dlDDt2BiDcXtWND/6Rg9FCcWH2K0eh4MKaYjqtQsSrK2hvbQ1dElzXbY7uvPbNC4WnD0+pVPupUdwk0NP7xEyaaco5MCge+haHNAUOhZofVZLqm7XP+QAtMJOl17WEKa8wOz4/yoaHtke8sZv7cGJ9jIff1VzTad6H1kXJRR1dFbETiR6tVv6nEeUZgvbqdMHjr03ORS1MUnT1yopuMd/bXAhZEgt/2sW2awCzwu1km/l2pkxqBq2oFpXS8e/2SHr/hsfsdh+hxlMj2kk5WP5PKZjdOAevO3KNJuAaFqIdQSRQPj0dYajd4h2sLtrZzNLSEI9H2HJikGSsLHzd0XP/z5zq/ReSHZCvmsctQr1nUNC3CXBRfTTIDBjnCo/czCa6vJhle8putCz9X9NJyCI9Lb+jb1cwO+B0l1hJK4w6gQNuBD6+XQoVq9YTYAQ2aDel2kJe8pYpc6iKUK+JLm4tFm/4aXPeJ0a1ssGWWtZ6imqLExxP3FkxWzREU1UqEQTaGiNKNtMqipEIIL97FOdOlqx5WkTdxXtCsYXbmVpV4vlGlSyYt1UtwG/u3mIYBpNXs5i24DH3QBHzJXa7A0q+kyqbQhxNUq2bGL5MiU92FxyyhowUa05W97XgxHTwM3tFTGBStpBfMIV3matg6SPs2cdJzTlWK/F7Q9cYK6A0mGKR3qYtrL5o0w6Z0ayuEOpCRDMY5/JDWzpLpOCCynZnkRwom3cDXuOzsuJ4U9f64LxXj7Y7OwjG7m4DY29XZAJuapsX2iBndDLKzoLdbVIA/ULldQk5Kr1/y8k8EEmN/G4bL+qbqvkPrsCeAwCZOMFYGJ8aZNG4l6p2uuxVkyRkcLHX8hefnE6c5LPY7QnzUCg9D3Xdt5afCMtWcSq9PpCyKfoXbpCbGGV8i4fhdzL4HnfV9E7wSrEBn0jP53xWvl+p+ZnrLL3teRHBpfaxvjrA1s8eSa+N/9YqmyCPJJTcWqySrKPmPyhrk8Xm3XzB+z1Ze/Pn6Kk/JcuurQjRobZxmBXi+RpNDSa6J++S6uZiGmfSkndA0gGCnUtljRW411ZTzVA6fsoljqqsWBJIFp6DOE++qgqE+WyfUSTQSfP8BBSYOxU2dGV1lLsCRy9WkvncaimbkJL2c1GoWYQc0fhb206NCk0vHdFgzmHLnwgI84nr0JFY7yKaEcnoFkrnFH2jSu3zSNfRQ2TWw6/ol4ffUvUEsDBBQAAAAIAJy2RlykunTrsgEAAHwDAAAHAAAAZ3JlcC5weX2TTYvbMBCG74H8h6lKQC5GofRSAj4sSyi9dEtzLQjVHtvqxpIYyd3sv6/GdkKyhJUONvPxeN5X1scP2zHS9o91W3T/ILym3rsv65UdgqcEhrpgKOIl4OPllXKUd4MtDMY6WezWK8hr6iCoLt3qgbpxQJd+ThnZYKzJhmS9q8QBDdU9WAdzUH+C1h4xiuKapkzTaLNgpAgmJSQnSujxGCoRZ8gSBknY4QniGHhSbIozLBNiHmxhTg+mRlmwEq6YO6v8VLUfQp5EcoFa0CUnvn/78fRr//hw2C/Y1hOQ96kE3ViK5ayANfmoXszxWQolzvacG5wZkEum2qscL9uC82kqUTEZSvHFpl6KxaIb1nnV3iXrRrzN5Ln7LMdPCnr11+eDmkdleHFbnOj1Dpg/DT6gk4woQVD2HV3tG+u6Soyp/coBIk+xErZznlAUYCK0d2hn+bY5lXC0bvIAXT5YMgllW8Lne+qunJmOSM1HLpnwXv3kAVn+aTZxt2l2myhgA4uUyxCKYsrWSvHbiaJ4YwueagwJng571viu9bzziFqzu1pDVYHQmq+H1mLpnC/LevUfUEsDBBQAAAAIAJy2RlyiP1FjbAEAAAQDAAAKAAAAaW5zdGFsbC5weYVSy07DMBC8V8o/LOGSSFF84ARSDv0AJA7cLTfeNqaxHdlOgb9nHbumCAmSQ7KPmZ2x9/6Ord6xgzIMzQWWzzBZ81DtlF6sCyDcaRHOY0lYX379tAY1V7v4SjyCFso07VO1A3o2lIOhMPR7d1o1mvCyVRqJfnRqCcqaoX62F4QUgzLBwt5IZ5UEsSwgRRAglavbW+peSMlF5mzqBK47mHBehhzCUc0IRKeJ/2/4eogTCnwLwQhdYNTryU5Gb5+I900b/ceOg/BIHTXzchROsuyBRf1stLo3GJB6+tPjgxEsavMs55jXY51o3hHPPE4f6LBpUJj6N0snG+k7yM547CK5UUGf1BZ7YZz+x29tvwgSRaAkhsxR5Khj4VOeEs210gLO5LwMTiTUq8UZKfbNN2EH+KF84PY8vLoVs+a0SX28pSYJ2kR2Pw3cslwL0VS8pVtY27ZpKUkx57HKOQx0MZzHFeW8zjuaFrbafQFQSwMEFAAAAAgAnLZGXGNSBjqMBAAA0AoAABAAAABweWNfZGVjcnlwdG9yLnB5hVZNb+M2EL0HyH/gqlhAxgqOqG8Z8GFR5NBD0xx2D8VmISgWHWtrSwIlNzEW/e99j7JsWUlaBwpFzrz3hsMZQr98uNm3+uaxrG5U9bdoDt2mrvzrq3LX1LoTuX5qct2q00Ldnl53MGzy7WneHE4r/Ftt87YV93/+elut9KHpam3Xjz/Uqpstrq8EfoVaiywrq7LLMrtV2/Vg4I/zed2s6kJlqifIdnkjluLn2Yk/uRB+4ghvIYLIET5msSOChYgwCxdCeo6QLlZDjPCNYJVwTiRGetMOvxRDCrMPKrjHrnMp4wEbBDAC64PaIxYgD1IhOD1quRgjzMHpJfCH3QdZwsCAT+DnUxvx+sAn6UQkgLMHkQDOHgIO4OwBHMDZAziEXcIewi5hD2GX3CfsknYEA+4QsXjYX8hYwolGGMMHAYYI0CcXdu1hHoE7AmfEJGEAdQiuCNQxuCJQB0hOBG4f+4zALbG/CHRTiQjUEXxiUIXAxDwcSMTMGQZSgToGVYIIYlDFiD4GVcx1wBNEEiOyAOsJIgvlRCMhN8AJ44RWwnyCPAF5zHWQRxxB7iP+hOSIIeG5gDwBuQ//1KQUC6nJ6fREUmaYR5EyxTzQNKAfwkp54iyfFBIpXSAhJTkTvkA0TemSsAIpw1xIlzrudDvSpZApUhdKqcsXKKWsS5dKIQvWpVTEF6MV8I1ivnmjGstBSqMWTTWkkTaNYNQowh6QbBmwcYcMlv0gmSywkcggSO5yA54hpx97QnrJVIYtItkLks2RmoYz3cEg2R9SEs3OSEnI1pC+6UcTFnfA9pAscWyNULL5pp2njQl/LjNPPpPiMu7AnCpBbCX84xvJA2NlhhlMQKhLaECo55+p/3n7KirUxVX0zi317S91+L4Q+C/WtTZjWb13pU2VmsPKi7ONygulofFoPby4/sPLGo9b4MnxuOPH4m1LuLlQhwjX5VaZW9URfK3ynRrfr6u66lTVQaBuVGUPLo6w9KM1m2vI27Oze6cPi8u87wA93fjzbZ0XrX0kHeHUy0o1nbg1Q1lXE5LXtAP1/xG/RS7ylmtvMDa6rDrb+vbhu1Ba13ohPraW+CjaTttAzGavIVp1e12Ju7pSZyPOJhtShSCfVJd3oNghbav6ZLEwrfdds+9wmNaI+8hJ1TET091s85WyrYcHgm+smTNKbrHfNS1F3qnE2bgA3jj/skIoZsERfVxmsuTexjWhVbvfsiSMzmUlnTlG+ynXoqq7I26S9n6vb6fOMbNzCfYEr3hHsU7IRxZWcDtv8m4zf8xbQ3+ZXPFJWGwq60zxXHabvu5HRMj7M0qfRbQuJnrrYv6sy65P6GWHfhrvZdZ/+vAcdnlZ2UN2zTcUu3n4npp/1k/7HRD3xmIXql3p0lTx0qqr3aH+UYJ4OE3R1fV2qKSebJ4XRZYfWWzrt7v7r1+yu8+/36KANmrbLC1zZKb5/xP5x9cvr6B9Wi6wALRs+Z7CDCRph1tCDV95cLr46Jva5xd1RYr5OXjH6MxHMR1TWvJbkeeZZWK5FFaWMcFZZh0z3Kf7+upfUEsDBBQAAAAIAJy2RlxVN8ekjAQAAMQKAAAQAAAAcHljX2VuY3J5cHRvci5weY1WTW/jNhC9B8h/4KpYQEYFRdS3DPiwKHLoodscdg9FEgiKRcfa2pJAyU2Mov+971H+kJWkqAOFImfee8PhDKGfPt3sOn3zVNU3qv5LtPt+3dTB9VW1bRvdi0I/t4Xu1Gmh6U6vWxjWxeY0b/enFf4tN0XXibs/frmtl3rf9o22m6cfatnP5tdXAr9SrUSeV3XV57ndqc3qaOCPc7dpl02pcjUQ5NuiFQvx99mJPzkXQeoIfy7C2BEBZokjwrmIMYvmQvqOkB5WI4zwjWGVcE4lRnrTDr8MQwZzACq4J55zKeMDG4YwAhuA2icWIB9SETh9ankYY8zB6afwhz0AWcrAgE/hF1Ab8QbAp9lEJISzD5EQzj4CDuHsAxzC2Qc4gl3CHsEuYY9gl9wn7JJ2BAPuCLH42F/EWKKJRpTABwFGCDAgF3btYx6DOwZnzCRhAHUErhjUCbhiUIdITgzuAPuMwS2xvxh0U4kY1DF8ElBFwCQ8HEgkzBkGUoE6AVWKCBJQJYg+AVXCdcBTRJIgshDrKSKL5EQjJTfAKeOEVsp8gjwFecJ1kMccQR4g/pTkiCHluYA8BXkA/8ykFAuZyen0RDJmmEeRMcU80CykH8LKeOIsnwwSGV0gISU5U75ANMvokrICKcNcSI863nQ70qOQKVIPSpnHFyhlrEuPShEL1qNUzBejFfKNYoF5oxrLQUqjFk81pJE2jWDUKMIekGwZsHGHDJb9IJkssJHIIEjucQO+Iacfe0L66VSGLSLZC5LNkZmGM93BINkfUhLNzshIyNaQgelHExZ3wPaQLHFsjVCyBaadp40Jfy4zTwGT4jHu0JwqQWwl/OMbyUNjZYYZTEioR2hIqB+cqf95/yoq1cVV9MEtdf+n2j/OBf6LVaPNWNUfXWlTpXa/9JN8rYpSaWg8WQ+vXvDwusLjlXgKPN74sXjbEm4u1GOEq2qjzK3qCL7WxVaN79dlU/eq7iHQtKq2jy6OsPSTNXM15O3Z2b3X+/ll3reAnm58d9MUZWcfSO/T+eMIq16Xqu3FrRmqpp4QvaU+0v8f8vcERNFx7R3WVld1b1v3nx6F0rrRc/G5s8Rn0fXaBmI2ewvRqt/pWnxtanU24ozyY8oQ6LPqix4UW6Rv2ZwsFqbNrm93PQ7VGnEfOKk6ZmLa202xVLb18EDwjTVzRkkud9u2o8gHlTQbF8I7dVDVCMUsOGKIy0wW3Nu4NrTqdhuWhtG5rKgzx2g/1UrUTX/ATdI+7PX91Dlmdi7FgeAN7yjWCfnIwkru3Lbo1+5T0Rn6y+SKn4XlAmCdKV6qfj3U/4gIeX9BC7CIVuVEb1W6L7rqB+ZD3LPhc4c53xZVbR8zab6b2MHHbyj3i37ebYG4Mxa7VN1SV6ZiF1ZTb/fNjwoJOZ6c6Jtmc6yagcwtyjIvDiy29evXu+/f8q9ffrtFsazVpl1Y5nhMw/8n8vfv395AhxRcYAHo2OYDhRlI0h1vBnX8soPTxYfe1O5e1BAp3HPwjtFxRzEdUlrx+5Bnl+disRBWnjPBeW4dMjyk+/rqX1BLAwQUAAAACAAWuEZcQgFcRMoKAABtLgAADAAAAHB5bWFyc2hhbC5web1abW/byBH+HiD/Yc/FFdRVUazEcd0gSZsXuRDOJwe20zY1AoGSVjIbihRIKpHu2v/emdn3F9JOcnf6YJOzs7PPzO7Ozj7SH757uK2rh7OseMiLT2yzb27K4vH9e9l6U1YNy0r9WDfVdt7cv7esyjVbpE06z9O65jWT7VokVZr9JitWqvVlse+zNxkauH/v6v3b0XTy7uyMPWezg8MDJTmfjEgyUZLTl2eXQnSqRFcX74TkSkkur87fjq9GFyS9VNLR2dn47eX4kqQDJR1PrkiQWYLjIxKN9aBn5y+F1lKJXp//9PZs9C8S7pTw1Xjy8uK9pb7yWuxee9V2dj75O0lyg/9iLGW1BWt0MRm9IWnjal6MTkl8oUPyDoYhUaJHGV8KTNdK8mb8Wkh+MU69Eb3mSvJuMtbCrRH+ODn/54SEf9VIRsLYMx20i/N/jyZK/OIAp1n2nL56fzWSdg9Rfv8erRNGS+Dp/XsMPhtaOKbtrCxW46JJsqLpBSp/s9aaUH9dLvj57D983kjleTlNq9W83BbNUwZGtLTIy3ma166wBnMf6+xn7oqXebryNOcw0FM22ze8tmRF3YAerHEzTLrmnuhTWkWky4pzaPGkc57noXSZ5RxNhEP5elXd5FnBi9JFnxdlk840fmsqfoLBbtI855UM4CKrN2kzv3lKu/aa9i/8+QCT+Mv/sCMp8SWbTrMia6bTpOb5ss8+V1nDl9ti3mflZp1unk/KgqspxA+qDaakBra0uq9AnUFB/C8rb9TFdr2RI+5s6021t960OeXNNWQlnux6H3Rfo8x3c75p2I98P6qqsvLMLAFCs4FoMmlisK7KpOdpkSZ4A8CdcQcr3iTNphdqZ0vqELGDn1nF049uE89rHtGu0qzm7B9pvuUEPznYFms5qeks56yk7XHgQcCxrViYAH+e5rAFj49UIy2kHnvwguGE+vMptBM7nI6cvXjBHj+KDHCr+RRCuWN/ZIe701MjRYPP2YkRzO6mNr+b2iKqZq3chHZQkqR9NuszWOuLXs/zrr6Bc+9u0XNtqoH7TMTtpCcF3hC4BaYFmIvtA9uuPlxNd2c70A7Fja0tBsPMyjI3vuCbPRis4V1s19nj47ltb7ZwFQdd6PQPMePoGi2+BGjrptyAlSoWGMTKsppBJmSXoDcGvbTJysJD8xX7KXBAVSYtcXeGNxOg0AduwZmQbeqsvtN8q/pHj+1mRhfJSFo2INRYoodMjRM4afzcqE5lByksdnflWx32tLcwHwydWdmztFjA3++eswfD25YGlW29iJJOW7svXGxgsd1esgunENzS0aIz1otBmN26pgvLQnspZasCjA+9dfuMHfp+CMUHQ1e8Q9nOnu5V1tQgvP5ghJ9voJ4Idq5QHaSbDS8WMhn9+RSyTzgCTePwSTznQ6mSCFs99gPhtCzgabrAw1RoxCZHZdBFGHpZHOrw43hB/Jd5mVqrkF47p4AKeXsOwHzFNxWe9bzAwi85SOt5lrXteZm/0fG616dsHVOrQ4cInHaH3gJ/5uV6k/Od8UgKOn2SV5CoVwOoLfJf37XIQNk6Xf3mMZTh0FGU75HDocrsnUkjdgZRXLtaShtEumuDGUkbNJyV6xFMgHFbZBQrDRL0OiHKm5sX/p2O+bZZngQhtzyovyDQgEXjl0ADB5otxN7Ap9dOB+gOe9cQY/aAnmtMINHCg24HqBE5eRGKxk9vYerOaitz4Ft37obL9u8BHYGYnAcvAfAFXNUMcHzrBI6cgIftI4d73iesegjhAJHUwTXHIAX92LFJbWSmqz7C+3/oJsLWbi4kZeS46e4Nc/e/JRW+aVtgu4FFF3TpSPKgS0VTCV1KRCz4CvpKO5g2VVrUMB1ruAaTs9QLn4J9Sr1kM9IQ7e1EPrQ3K3qiXUNRFR0QJG3RYUNSGN0wO2NnyI12I4LoCNeWWSvWOeHmrzD43lGBtzh6cm8VeKGwqAv/OsGbbQUbSo2EH2EeCTOwllZVuneq1rngy9SrqNbmUANiUhF9/X1ZKN5BYCDWQWhezz/0mX70tqyWQ/fCbULHYMi/+HWnAPgnp0TFTws7QaqPbedlQMR5L70Jz2pupTN46T6mR1+UhXk6v+nOwqgROf64WTvwHNadVfkzLxzkWtRdfyoK9ffwQkMyVaeSOLzgO33p/WZmEMrNBdJNYRCwhapFoeA3iyKpoVu3uMGYMaBUXpB926qm38hyMuwFG9Xn28Rtf3R+Stdb0xbSiXLduqziXPCJdyYTQ3JhBhGQkWaCY/6+Ysn3i94B+54l8z6bXx9+cPmfyqKYKCnBHdMaJy/9KIAF03yTdTbj9Q4s/JcloPjsGTtxYyiuhSeHh35eENfCB9A4hMbDYL/vXA/0JTniQO0CtK/7hnZDHQDeh79D+vuI/j72XEnRk5lwBB/n+Dg8pucFPj86ch1cSAeJlIB7bnDxpht2kgyx8+NHAN/hki2PkQuxm9oDIcnW20NxEg1Fn/E+g3226rMb1P+WCIhphCau/IPnJT4fHdLzip6FqRt8fnLsBvDmSwJ4fOQHMBYl3OvTYpvnwYaX2lRQBqlOl5ofaE1LG6FhxaRGDE9sTtS1ez4ZGbsedUrCptq22r2CtrhdpEu13cZWU3aXUIi2Gj7FxrhlYlW16aWjqGw7BGrEvMNcxodR3KceKUZrUoNDa0YGG2kqMjaO4jn1OLxTfTy5Qs3K5Yx8leMjo3R8FCA2Wcveo1Dzq20qE9tthB51uTOnJwd4gP/dnWqlWbpfYkEARewKlgdeRHyCz6AUB0iU2VNpIcnYD2z4pBfuTfUV7c7Qe7FwIrOpJ8dn6sQa1EydDbXoPJ+8jFiE8KTVwYI7tFMLSiL/zK7wGTiS2gzcr4QUTvvnHUi/eQRk3u40ggyachGR9al3S7wksagjFmHbSD7LirTat0xxx7Gmyiz60clgW2zgVp0cPFscwOkuvI+hsn+SoaHZENrwtU2th3B47M1eX0U4ACqQfn2A3d+Q+M60hdsiN6MrNExMdj1r1k88oyMNauVzn7okMRQuvCp4WJR3Y2hfwsEdQH01Ab1CPyrrRuZndfpFjcavgLbEsOLLrw6jBfa6aFmq+rc8XkBh3ACRTQffEc/t+dFkA0UOx2BKYlmDjBC+okTRhG/kBDeNA3EKIL/alomJCTalj0/QGgNfPjvXGkLSo5Nyak7KotcyUcjumvPLY11JqFlXG81CXofVu6BvsODzjuOPfK+AC2RuM5QJqJG5P5eyP5HfiAgCt8Pq4hqMolekGQRqEQ8F8sU6FD4zK4+ByDJVzGr7/EhetWM5K1a1XYU41fZmSbVFIyKY07ZWYkXbGhVr2tauONPWoSVj2tpf8qVd4Nr7aqa0PS6CKW0zIdeDoU0Tdx2pqe27YjmfnlRPoienmfNkOF2BCGfJHwmD3/dXfxUTq6nwzcoZ8LVl4CPjBZo6zF6LiK0lbC2mrAwbTa+KTrxjvoNpoS/7b8t3Sl+fXk2CXdsKgJHZ/R7zKapmh/n8baGasToAa0bVFPYuyal/Sbgj5iT8weIaOlq/jUyWAyJspap0Yy2/eOgZo+SIDsGWzNhUKhjCc1kakD5t13r/2XbqBFZ+w/GHrM531bMMt3VWDl6hdHyu1FyjZBFUe67HNbps+et/qREYl1ZVtKDdDQIIBjXnH5NDd3yUUwkC4v8DUEsDBBQAAAAIAJmCR1xfFSHAzgUAAHgYAAAPAAAAcm90b3JfY29tcGF0LnB5zVjdb9s2EH8PkP+B69BCauQPSf5ogyQYUKCPexi2pyA1ZIlOmFiSK9GpZQz723dH0RJJUZ6R+mFunUS63/3ueLw7nvTrL6NtWYyWLBvR7JVsKv6UZ+HlBUs3ecFJGvGn5oJXG5Y9Xl7gv3gdlSX5I+d58YVtnmhxfXlB4JPQFVksWMb4YuGUdL3yyAutrqXu8K+M5dl9yQuPLCtOywePZNt0USBPeU1YxsktmbmSDD9sRVjJspJHWUwd4PIIqKsI/MD9hSAEdfh7SLM4T6jzbh1xlvnv3BZN1yU9oix+oxkXV3lA4EKG0ksAtS6bkJLtKQCC6cwmWaRR+QLicUdIaQL378cewf8Pphz8UcQ9IAwT44LoawSrNOW09lkQPZCPxNFW9VHx0zVVk7erbvKScdj0slFWdU10lLziPp8ELimHuDjN7jU79hskC2dxSiGXEyUteb4onyCRnddovaUi21wyuMPfSkYIIfkAu7T7Ch8tE2vZHco+jcdjI49q6QClPkiVXS4o3xZZDfgvL+NFwl6dSLgHVdLnpqSEm05ERmTZrl6UpoU2zRMnXpceOZU7IgOCGsODT6Diwp60tpBZbsMJtS4s/Z5n9P9W3i8+eB7AN4TvBL5TgH7+PPXIdD7zyHw298hsDqDJLGy1VlAQS4hca8A0zNAi+SAyyRD5IHIcB37f3JDQJX8T/Pvujvih65Ir0HWlYkc1kKqBoho0qt+OqYZSNVRUw0Z1cEx1gqqwIkgJBy5a/clBv1d1Kq1OFa2p4rDzD/AedDUaSx/EtnArL5uCfvE7fQehvg0agH07PLDBQys0tEEnVujEBp12oFBG4hhwtOJqbyPKVkDtAaJGpg6UFeXrKN+OCnRUcMJpo3hdLIooS/K09Xq1ziO1xew8AqW+b4ygUUUK9/253/T/unmBjj+fY54GigQ7k5S0BJUgCAyCCmEzJAinBoMUtQx7wTA2GPYI+4QMs9BgkCI1aaG57cgNMc+JHbm6JeE4mH3WoJUFWtXQcDzXoHsLdC+hQditmzY9dv05UfUnwl6l5LRIsaJ3cOyIVQzH2LGcSlyDq/J6X18HIVxrxysoC46BGC+HkBp54eAdV1skIuGo9YeWcxaHqKH1gLXkoTybyr7jDmyV5Oa2E1FJ2jWDh+5hBDpkOh6MIsmdElrYe1LqdZxGL3TB5BwlHcpXKyjv1iujsvF8ecbzBSw8UkeZsQw/tfHuvmaFDXjGnXvWvJCYsreboE1m2qx17Fb1dTFzFlRsJ2e0vYxKHLN1czrk5Oi1a5Ee3gt2a/yaYVY84Zwvig3vPUOjvmb0MBOf2eaB1mZyA8W45VTLVoxKb66ytpFrO2FLEiRSKv3HE1tT6OhQgMxw9HvDKguZuTqA4bTt6/eeGyWq7+f3h2Nl04D61Nkp6kzmzGnJxZS5ddxnt3uMG1RUNPaxtoFHU6U7cPRkY03TkesJ2RE3TabvMVKT/GytaPlhfQ7tOi5THg+pdkToUJDRiASulUivj07X08HKpPRnsaW22j5HVXOabpp4aEG66i7/hMAKvve9/RUOTYG4UwufQATB3xvjBcEABu7erquYBU/FJOL4jc+m1DVc0g63+Ck6dKtN32HPMUibN0WYJTiXOpZofQNa0zNtbzad6jazBptHsuvU+iFBlKySQwhwHp4stVNWCULcG4QY/IlPCgJunkcG4ttJubg3HnqnsiyWx529PHnlsW3lmyKH3C7l0pOIR9f1475HaBYX1Yaz7BFu5fnaAyasyfpKxMd8fof0rjEEQpPl3Khla2cy22G+5fKVQ1QUUeWsaeagX64+5yredUcY5tXvGGi2TWkRcVozWKoJrKkdUVbD8vi7kZ8ykXRNyB2qX7MAXBsB5UK7O2TdAUkls0tuLip5oo3WPzX+hJ6JXzzQWgzIBaR5Qc+1CGHKtorzGJEraa1cXqCNjP6oj643vJtHD7rv/aUPiqB+mdcy3LZ/gif/AlBLAwQUAAAACACctkZc4xxEE/YBAAACBAAAEgAAAHNjcmlwdF9yZWRpcmVjdC5weX1Ty27bMBC8G/A/rBmgkRJHRvxoigAqkEMPPTTIoT2lLUGZlM1WIlWScuCgH98lRckyENQCZJIzO7vcHV3MFq01i0KqhVAHaI5ur9VqOpF1o40DZnYNM1YMB6+VLIaNPdphbbTThm513TA3nfiHixKoEQeB8bQ4OmETzhy7h7BO4eZjt7qfTgB/RVtCHk6YMewYuGkHVbKWDsFaquR2+WEOlVAJ8tOIl9qABKnAMLUTSaCnUTZKP8sf8DOH2816yJbF2pKoYoRrjepqCuqna7RKNb//Wz2zvKRcYZHk13K/ea93mu9XVpAx7O9Acv4q2Z/sDPA3J3+1zTeHu9l3crNcrce4qxHvM1zBGq4h6RWvB6BflSlyNrglM+LfF2SAHCJ3JyLulp5xFXjvwvsyJg7zxLTjuWZKvIR9EsuKnfON6akZF1tzbNx4fhH33vEwahlh7RuMN+xyPhx/chpLzdAQ/aCDT33FvWezB7Nra6HcU0ASLuzWyMZJrXISJgpO64qk4/iMcU5ZDEzI58enb1/p48OXT2QOe1E1OZGqaR2UshJ9JNIt5o0C4c9L2N5YIYL6iK46m51kz67f2Uw36O5TzByIKUiKbmU86R2PX15mHdety9CpJaZ9MdKJvmP+kfj1UcVqQSnkaC9KfbsoJbFfXfOmk39QSwMEFAAAAAgAnLZGXGQfa2r1AQAAAAQAABQAAABzY3JpcHRfdW5yZWRpcmVjdC5weX1Ty27bMBC8G/A/rBmgkRJHRvxoigAqkEMPPTTIoT2lLUGZlM1WIlWScuCgH98lRckyEFQCJHJn9sHd4cVs0VqzKKRaCHWA5uj2Wq2mE1k32jhgZtcwY8VgeK1kMWzs0Q5ro502dKvrhrnpxL9clECNOAj0p8XRCZtw5tg9hHUKNx+71f10AvgUbQl5sDBj2DFw0wHKYqAkmipZS4f8WqrkdvlhDpVQCfLSiJfagASpwDC1E0mgpzFTDPksf8DPHG43685shGuN6moKoU7HaJVqfv+3emZ5SbnCisiv5X7zXu8036+sIGPYF0xy/irZn+wM8Ccnf7XNN4e72Xdys1ytx7irEe8zXMEariHpI14PQL8qU+RscEtmxH8vyAA5RO5ORNwtPeMq8N6F72VMHOaJacdzzZR4CfsklhWb7RuD1DeGfU7w4sl8KCPsW3iInQm1NcfGjfE4Gm85DaVmOPt+pkGlvt5esdmD2bW1UO4pIAkXdmtk46RWOQnzBKd1RdKxf8Y4pyw6JuTz49O3r/Tx4csnMoe9qJqcSNW0DkpZid4T6RbzxgDh50PYXqnBg3qPrjqbncKenb4TmW5QyCefORBTkBTlz3jSixvvXWYd163LUKclpn0x0om+Y/6VePeoYrWgFHIUF6W+XZSS2K+uedPJP1BLAQIUABQAAAAIADSJSFyf+3UCEI8AAKNqAwAbAAAAAAAAAAAAAAAAAAAAAAA3ODVfMTc1MjQ0NjY4NzY1MTk4ODIzOTMucHlQSwECFAAUAAAACADqgkdc3/6sps4CAAC/CAAAFAAAAAAAAAAAAAAAAABJjwAAYnVsa19kZWNyeXB0X3Rlc3QucHlQSwECFAAUAAAACABrhkhcAtOiGp8IAABRIgAACgAAAAAAAAAAAAAAAABJkgAAZGVjcnlwdC5weVBLAQIUABQAAAAIAGuGSFwPBFg4kQQAAB8NAAAKAAAAAAAAAAAAAAAAABCbAABlbmNyeXB0LnB5UEsBAhQAFAAAAAgAnLZGXKS6dOuyAQAAfAMAAAcAAAAAAAAAAAAAAAAAyZ8AAGdyZXAucHlQSwECFAAUAAAACACctkZcoj9RY2wBAAAEAwAACgAAAAAAAAAAAAAAAACgoQAAaW5zdGFsbC5weVBLAQIUABQAAAAIAJy2RlxjUgY6jAQAANAKAAAQAAAAAAAAAAAAAAAAADSjAABweWNfZGVjcnlwdG9yLnB5UEsBAhQAFAAAAAgAnLZGXFU3x6SMBAAAxAoAABAAAAAAAAAAAAAAAAAA7qcAAHB5Y19lbmNyeXB0b3IucHlQSwECFAAUAAAACAAWuEZcQgFcRMoKAABtLgAADAAAAAAAAAAAAAAAAACorAAAcHltYXJzaGFsLnB5UEsBAhQAFAAAAAgAmYJHXF8VIcDOBQAAeBgAAA8AAAAAAAAAAAAAAAAAnLcAAHJvdG9yX2NvbXBhdC5weVBLAQIUABQAAAAIAJy2RlzjHEQT9gEAAAIEAAASAAAAAAAAAAAAAAAAAJe9AABzY3JpcHRfcmVkaXJlY3QucHlQSwECFAAUAAAACACctkZcZB9ravUBAAAABAAAFAAAAAAAAAAAAAAAAAC9vwAAc2NyaXB0X3VucmVkaXJlY3QucHlQSwUGAAAAAAwADADdAgAA5MEAAAAA
+UEsDBBQAAAAIADSJSFyf+3UCEI8AAKNqAwAbAAAANzg1XzE3NTI0NDY2ODc2NTE5ODgyMzkzLnB57L37d9s4kjD6+5wz/wPHPv1JmZblRzrdae96v1VkOdG2X2vJSfdkcngokZLYpkgNSdlR9537t9+qAkCCJPiUnPTuHZyZtEUSBaBQKBQK9djX1u7UW642jvW99mj5ge252svuj92TP/9pX7vdhAv4PdmE1tQzreiDiRFY2kn3B639/cnJ8fEL/PbcQji2Y5nazPeWp6IyfNY9fq21TWtmrJ2wo/XWc+34pXZydPJdRzs+Pn11dPrdqxcawvj4tt/Xeq7pe7aptY/hkx9Ovnvd0b5dzT34d+Jh/W+dEH8sHXyGPTE1aMZ/dXLy+viHF1rfMVxo4HX3qIsgB8uJZZrYKeia5hpL61Q7vA9gIIeuFVpQ/fDcm66XlhsGh0+e/3A4McLQsea+t3bN4HAONVaOsTn0LQe/DvAPfbr2fahxGHqeExyujHC6OAyt5eowmPr2KjzkiOquNn/+k71ceX6oIaCXZkf7zbEnHa2vY3862q+B5/75T9e3P+nvB3ej4c21fjG8HOjXvauBdqa13NWDLmBNPXdmz1t//pNvPdqPhmO7v1rTMAiNcB3AtxeGE1h//tOf/zR1jCDQ7thHbW+CX704/fOfNCi6bgdD1w5tqP4bICWqhi//E2HZ06UF82ayRzBpmh193xZgsNgzzfVC0U43BVn6EMu+drbDkoZ9efP27fD6rXZxf90fAw5H2gGQ48x2YYS2G9hAubyb2szzNc+fGy4Nn4g6CP31NFz71pfrcrqlt443gc453nxuA/GymV77MBtIHfK3by9v3vQudRixfjUYv7s5RyqBerrl+57fSgMeWaEWevIX+HMNqxfJsRVok7XthAe2G7Ut1umLPFC+YZt2EME5t4Op55vakzVZeN6DgFM0XiSqOY1Yh6/bSysIjLn1IkUyWPb29rIPU8iaAQNDPGnhwgg13wpWuCoUiAqsMMz0DMs5G/EpjifQIlRp7RSOXmSr9pzQ8l2Yp0dgKwwzWjuFEkU15bhCf6NAAUN+zzS1j3f2b+v1Gqn9k7bygb4/4yQYjqNxFAbq6kDzS+Bplqnz75BmEtC+gfn8RkBRA1E/BSagoMiziEpyBoSFfdHOdE6BLiwWsKkCaPtiFhEl0RTmfx99UqkD1ueptQq1Af0Hac0ItLze5E8j6+edRcQRLiyNkdk6QDKu1efk7A3u7m7ugNFJi+qUTynwtrb1Ig+lqVEVdHuFWwp0HnYLZ2JMH7QAdi831GaG7QDnhA3Y2SAxxIvHDgPLmdEHQRkz4KRQzAhUjMbyiaGb1mTNmMGBFhgzC2lgiuvCcDehvbRqLje+YS/CcAV7deE3a9/J/YR3VIdvcMEhuOD08NBk44DtfHlorOxD/llwePzy9fffv3794+uTH19/9/3rH344+eHw/ePDanX++un4/eBD79F6+bdg+vjriXnj344Xly/DnydrV5+6g+Obk4enH//r5Nfz2eVPI39kms5P7sn11es779Zqqbu3MjaOZ6AI8HsLNpwQprN1KnjAP/M5iW4aoQG12NC78B/LxX20zQHmENvCMkwQZKi5PmvuYLxZWdBmy1gBoqe02x1+Pnh6ejrAhg4i0GYrpz/Qbxcg8pnqvhuPb0cA3LVoR2i3JFy3cvqFILq+9Y+1FYTtvdub0XivI09dJx50RwwiBxTuPZ4bIHslqHMrFI/aRa1PHU/9RcUFKhbnKLkmJxtYGIE9d8uWH6ykxsvvyQ4XTLQGHmpMFyhHP99y83J2uNRS+6rrCpGhw4lgQT0JQs8HpB5ay7VjwCZzeHRosPPNIZLUIVBml59DuvMfX7rGIdaPzybBcnoIqO6Gn8Oc9iZ4TjH8DTZ3AOWDNfnJDi+AaN/wNz9c9b775cPnh7H/t/XR/EMOnDzoJofc0r6N2/pWa/3d/7srFjIQx8oLbKJRWi8HOLh/o+PW2R7nLntYA/+PkIQkwgHV6hPsM17QRRR37QDR1Y5wriJeUYhUvZXlxp93QFCZtF7gdj4rqImF6vCRAEJmwDMMM29ZR5j7dkvUYat7/0aNswecFvZkEMhGT7XQ+hwewknVdiM8l3cuMSres2x/Dw4KwJUIZgVoKARbuovkN5nZX2DthfbK8MNDCcGiJ2dMUhI/OxXgXlruPFwAZBSvYGbaOMg8KStn6/oyG1oLN7RWakPD3v7P2suKT8/Pd07f1wbX51n1wtdSFDBtDOpz2ipGZ0fHaqTwLmqtYIeG7UbxuAuMxJ7mTILQ6bC2LvHLdh6IjtZ7hGf+OzgV0JepuZfr4XlaX859IM+5HcDJWScQOsrofpu11oERwhto/uy4e9TR8F1wdnDc0ZYgCZ6dpPUSu8R901na14YknwR/yL71PR+VXCYwFO1QA9ZluxaQ0ipQTZS2pG0Rsd6Bc5lressOPUPV5dQDkR91kR3YgDvaHCY/2MAfoW9MLTwWdjSYZ4tXtlzgL8k2uBhX8AqbUr5AoGpg1MlcYC9N5atoKMq3aTlTqHCnyseAA3WXBVqUbwWmlLPAN4AOP2WJ/74Etm0Ei4yYXCRCF5xUE69eqkEWNBfYn7tL79EKuqQhs90UGvAaIP5Imq+0jimhIUcVtvwSCXi59FzcX4LQcMMAZId1aDsgM6U1Xhx714Obn/X76+FYH/V7l4OO9g7+vO3djfV3g9659PPNzfkv0s/Ru+HgUn4/+qk3HigGRWyrO59Sx7rUMTGI52ybD+/xpamHnh6uYOWt8K/HNJErO4n/0RFxQZctDPZDdLwcKm+e3TjoTEkNzMGaLgw98bC8M6RDEGRUEx7vxuDzyoEdwR8C0m7okmNYGQs0Y13b/Kwn5i4GqQA0CaA+u02xTVFD3TDv4VXv7if9+ubuqnfZYT/e3oxv+J/nveu3gzv+424w6ojPrwfi4974XfTFh94v+n/fD/s/1Rsiu8tKjvILdIu3VNCxYGq5ol9w+pJ+VhkgyKEgHXbvXTsaFf6dZR33Q2AWeDICcddZgbirgC6v4u7aTq5mQpN+2ftlcKf/7ebufHCXD2Ftw07QxRvJleFajoDxBh7c4gPA2aD/rqf3hlf6/VC/HA3HZcBmcOJILtO3FghkT1fW8gJeXRvp/aNs5TveFKQxwojgulZIv/XJRrdhk49+s0/54ZA9n659/g6YePzo0bOnFj2rR51YQ5dZASr79BM9WHhPeNztaNEXHe0SKFPvX/M/frqp11TcxUSDqccd7f3NsD/Q/6uXCx2g4sQIpNrda7w/cPrIqPwl0JugnOTjk442sqArJn9y7szh0dhbXVqPlvRZ9XY/2CD3ACGY9nqJJCYaTj8vg4g/3C6K7u4Fv0qLR5F6XA1Wf2GA5ANCfN+3jNDz74fX1pOAqHxZBne+toEwYNB9yw/tGeqKrSvDljqaeVEGkiugxH8TVHHFnp3Do/IRTyYbwB78e2eZtx4cXs4lSJkXpfO7MMLue6TKq7k/Mh8EIOlRlsvdOkaImg0Q73M3YLJR6NK/TDspENfrD+5Q5Bi/K+CNs3m8RN0ZHOHyv13xznSN1SqYOXgE5VV74kGdysm9q3eh92+ubi8H4wHsTm+Ho/FdD4/kFSACZl2JK/fZzwoVYdugK4Agng3fmvlWsABeaCx1vsfa7ozsUejHBA64bgFzJ14Msqw9XcAqSHL4nnh8H2buzmQgxtq0PXamZmwMpiXaJeCpIJkyCNPp0nZtuXa/fwVPqGqa1K6tEI1k8K4tf0ddehPbsTiv6vqrqYl3nrjaIwSupjqzM+lo/cvh4Brk3fH9m1JYd6vpFVXr+fMIYaPQ72hvPA822CHuVOc2qhEubaUskYQ3NK8M15jHNBo9KK06gGkKNxfAyzx/E0mQ8sMs9t4QdRxGJ5l8buDYKOAkaJ9pT3CHLJaT5LrdVCUB679h/VzewAFFf9Mbjy8H+viXWxDwrgcf3gwHMBW9twP94ub+bvxO/qDelhsdsZNNgwR01+uPQZ6CZq7P4Vg0fPtu3Mk8/zA8H78TIlPyU/kZfVarY6IjsmxcS4hKAVjnLNNyACvcChfrkMNAQXhVDZodWksBBf8uGcUjydddVIEHRBJIEd23V+fpdWl9tqbYH5AF8ZOaAPvIdq7gr9SiSj/PLgxaN3Cchx2MIOMfS/ZxPjIsXqmLYk6fqJ7pImXJW35eDimSTkaWAwe7jNDCHpfDuUTZma32keU/xqjIvCiHBWs1F5zqXTlEg7ABkzYB9HYBVH8dhN7yzvMiosK/h7CjNQAmdSgi0cTTXJh8xnX4B9U8QhpjT3v4sFCgTVbvDj6PkJTk6vFBP/OqjNTp32jHwR/VFgd9emv4YaIuPqhWH7+8tacPxsRJLyvFq+ow+7AkfUMGxZ5UgzClb7usyigEqfsW9t9ouSQf1wI5Wi0sH+R4hwFJDVn9tqwBcQdhB3hzoXNDwEhWorfn7OXIytoI5vX4wdpMPMM3u1feo/UT/3EVi1GpxzUUG9EWDoydY9pbEj7H/gMMPUJ04mluA2vXhu5eJpnjZQlPnMLWFGttx8D/oA14lD+MxN7GNDolu1miBh2laNuJp6q4Pj8zGf50YT9Gi5P/1Dk76EQPYL7KRKcEwG4KUiSgs8dlxBedEA1Tojb8+eTD8SbnAgSka0ehA3/LzdC1iEgqiRxJekJyQetYoBiZgvijRvA+WAY8e2P4bJ+VwKbeNIL+bg2oh2OjBduvO5U7nXpTA3oAe7mFwN8ARa/g//J5PfW4GYpJRohlKulRI3g3axQ8FrblmBJI6WkjqL25524kePS7EaS3vrdeSZDodyNIaBprO7KySHrWZIp7Yc+WmSX9bjapD7bjZGhceloKdWItjEfb87v/tUZpCF4JQETLozVwBHx1X467CBQceoMwC+vcCBZN0DWiSxcCkdph+NNms+rN19ZbeyYjLnrWCOKV5T31PVvupHjUbC34Sy/LwKSnzXppyKsCfjUc63RhwNlp7ViJ4UZPG7G+9WyWZnv8UbPVsQAocHCUqYY/agSvH/oODVECGD1rJkdFZ22Efyt+jFJ7YfJFs74bS3ne8WczooQDVh/VgDJJimeNIA5Da3kvTsQS1MTzZmMW52N54OJZdXaGAnOWm43XfoNlTbKz6II+BeKJBIo3vL20OCGeN5su02RqvywfSb7Z6VCITFMrOfmiWXMLhMGss0gEWVku7JzvSOMrCyHy82ZoCx/ert3EFo0PmsFS9HC73hEq+6TH9Nw0isXzbc917Cg7Nvy5FSYZR/S4IWpD354AL8tSZPKN6tqce8Fqc2ddeoPIPu0yYfSN43lmfC+XeFgVkCXrjgL6pcN71HMWHwgzWo6kGip+kh3ylR1MFXAFfm3XWqJzbPe9bVreLTOtFHdz8SMFBLwux/MEXjbi35m7EHzoe6hIDizd8+d68FB0d2Q9wpTprofXnXEfBvj0Gh9u8MhLP9953sNJeqSjweWgPyZ1vn4/Qm07PdDOtOOSD3v9/s39NX55kv8lXsrdXMdAX5Z+ej647P0CX36X/2XvfnwDn/dvrnrX5wN0eX1V8nHU/vcFg7qOvvohSw+xL7NGYpOpoZueY4WeG2hw6nRShyXpzhjNn7MK7oB8cowAdjehTyBFJcy/HYQB80yezRygtEOCrxlcX0OWLTI45uGtv0FgV3OmvxyF60nK2VsuaDqs6whK19vomZfnKYHvujppdzf6EkTYM+33f6bHIyDC2tSfyN5Ah+8diyB3NH1i2upuYPGtEHZ07dpzM8tQhsu6YJvYCQ53jfYpSP22WbX7H6HOJxgDq5VuDy2mLdgpQ1+2b+5orYkB7ACvRJkyudWh7r7Q7ID+UDQu2zmnakPzirnKJxLpQnble4/AXYIMRrSJNUO7XgMO8b0SOomuc78ajTzPXKa/V7dPnHKjL7ylIM+/wp4awH/++vCEf+U1v68hvjR2Ta0daKYH8wDQFqTNc8Vi1bIXZTGE3hTdHQLNI58Hw9GwQXRPXaIhRsQIptytNujWXjK5JBxTUU3qlcjvLE08CqIdwQ7kCF9m5hV4qj35dmjRQHmwCuYVjAZC5JCwtPEn+4Ccf5NQiRJtvCR3eE2dQVb6PaDTMbkgot95ujmFe9EKPtLJifEswh3Zsbd0XdSPvmmRjXuXua9wd/6cpYP9gMHpsDCBsMw21NHDzcrqoPOLDlDX/M9wkkdzxc7jITo+CbvxbvTHOpy63lP7RRekUebN3n6B/lV/K3AAi7zeEWmt7q+e7bYje/Uue6tbwlmncCgFPnCwUplj4sdvAowygG7pf3fx/+hy1Q4DDgQgd3UdTf50PdFE1M2CRopxhiX2/BOkAnNtVHT8I2x1iaDbNJ6i8Vb3qMeCzk7bjEsKokE9+3h6/Pro6NOX6ODMBm7mFHUQGFO80HDNx7/+cpZZLCUdKccFdVe0UEivxXBqYoiaJSxlv0O+oeAosB6iv9WVYmajZTGVbimHT2YZ9QXGC4HDBooYLBiSF8ICW8PUWIwbTzbaFK0yKayKiPQgqsAGvIIXRZyaf6qLuvzQpmTaRdFOyDQUZBvt+POx9rSAlaet7M+Wo60c4FALzzFhzxT9gp0YzU/8jRoaD1O0MALi88z1CJY/r94q8hhm2676fV7f6aIU9reAonrwVmijMx4xqpVvrXBwpgZz6WbxKYrOIegRhDOUpPJ8L0swaW6At8LBIzWXdOZgx8p0j9FedJHTN0BpBp1AApYPh1vWUEQJxNKhNWS1QGeZaigc5tUByQ8tG0pmCAF1K4Bpj/11XmyZfAxyLDIUpZdEwEIOLe35gp/ikBgxsMs8Y5cvl2h5SHP7sZjNCHIN/v53a7kKN91wbrQKXJVTdWgNsToFA01V4oGgKjXFiOjvf083uXJVApgon5pNxwWcOJEtgAAdTQk7RFfDOaCbSdK5H8OymE1wMjNTVbIdwNJgkd26sEGawPsDnQUomACxwyI4O9OOq8gbyd7OcqJiyGUCK12xnYhSuE/TRiA1WdJDiUHjSWEJx5qYUUdsGcFWnx8sFTf5eA/g6OFMgLfcpS3M0mmdtI872rHwRe3eDn8eXOoXV2O99/ru9dvXb153WPy7EpmAoynVcoW+YknNZXRCkaAVLBEsTByoLIio3uTtD6giVFIsbVjr0Dtg2Ix2f1ob6d2tdJsQ0Q5biTYKObvn2yiqs88Bb6pONiF3EliYAY4ZwW+zYCChMT9rFfYKC3yPccbOkl2MQZQQE6CFQwAx+Ji2xRprDwusv4UFawog2WErgGUoi3VVyCRcgJz4ZOEBn8Ko0I+iYCZS5w130yb3MVcGhGTBn35s8Z2mRewf/2uaAf33IfxM//11NW99KsOz1CY5rCCXAvAZyagiGCyZul3DNGnmKoxdlH0Nb/bT8lIYM7vqoKpxPLk0kr1qtoGFc8wS0JzoEyzOniV//yWH51HgGLVgU2MyRJGOwq2PYwYTDjyfcK5gpYvpQgWEdvAfUQ9RDYFj+Hj6uvDcnC6VWbJcio/7WLiej/GHJtxNycrPsgyvzi6Ri9qx4DpRUEA67mn8OGiZeROZfbq7AIu5vR2yXlFIGctMBkj8eHqSrzcpnevsvOac0HPPx+rDumAxzPTcch9t33MxwBruxsTrA60dPGwmHqw63zdMG00hUdqZOSxgEN4fTCzUsoXTbmp4iZM7s9YFwvDW/jTuYO2Te/L0yzouoG5xCE52r+FZOCPrCDlnAXsw/FWI7royTg35hq/RdM92I9zQ6WNL6SYJo5Z400iayU6AmPnnlW0CHdqMqAzqo6izQvUz8OSsuCO9KTm9i9I6pPV4CDKQPP679HqtCE2nRd8NFhK8fW0YcQItEN4SQKQ+nM/taWXQnId0E6CljuYviQwsxqH01KBHjG9Fa7pqx3g8gsNEx8inRhNx7GYkYFSFeCgRmoCKV7FVlr9cqogPlQTsNB2S7lwlAKe4YkVpJK96XVFYxGhzNmkGmmad2gEqxTYgBcIQXDhR2iESZdVmxhgpmUWterJhA8eo41w3dRiJHg4q4ZTRveXyBaUvpeRVzNcToguRNAkuGajcfSSWsxKH8mhCq0tfBY2PElv4lxb1xMqmsAXsVoISTEzWYQVSqiyX5Uo/armMme5pvduhhuF1DaZStwN2pz/ZxN3tJ/yzulPkyiAG+qkjYkIUY9C5dzxM+OeaQtizO5apkRmj6AOQpxYPVcfbV32Ke3y5DJVoFo0YVGDK5SplNZSx8uajtJNYcJqUVfgi9+vZl4hSTQnAmVP+8HIar3TbiYFSB2TAUbAY5QJz1hJha5lVC8ug0sINip2pKm5HCdOW0o8NO+3/K5cq04sBTYvmcCta34bA61B1ESlXp9+vRbT/otT82UuRZ32aTOzjzIacSRFJPs+2l4BtVVyC4PtajGKS62Af++p6HGkct7TJPpcSJ0dAUOzJatEAo13acCp8sDYBCKoY4fxpYQEaQEDF6+GA2gF8tyPrQYB/CMdqHrkpvQySWhr7sy6g65joItzUFA7iyJ25rEq2loDvOnQYZOpbXMdo9xN1opBnIS7yq6IOR0KWyn4mgQMcblS5nWszKgpIjt7Simw0yZqBBZd2yNoaZgWENjRTDoAnwAHjM3pBWwqr0hR67IBmA5Zo2+wQsCr8g/MO7H+7yJYNSy3WWozk0rYaWDtJSWBCTyOlPY2LXBqQjaxdgUwNTbAqHJ2rX4PUwWPD8aWb+fhJafEpSmLFn6XotCJ7I8aWAMQWd/akp+LENSKr5zI4JWdRs7i9e/fB9Z6A9FYGnAiZOTnNtNa68wyztcctfNlxlG8qKzhdWSE3NCtVRDOgzdXQbJNASxyuGSJD+FjVu84bQqDN0Qh2tnbS/h0x8HPPbWFw5w0CpP2TBW3gIWJM2wdo6L4RCIWmSCB2aH0OLZcyKGJjTbbF+oFp5JL/BvjleoWTFCjmlZsHosBEjfGQFvnQJImXegSbiIfuhEAdZdySZEVOBawKrCoC0uW/t1HxJBTkiVaaicFYanOv7BAbScRY6shbmbpkLwqyE27FJEFV15VjkUhG1sUk6Ue14PMKNy4AHvSEmYaA3OIu4sYivfjYUi1htC3wkcjgv8LEMSQbQjQ1FB9Wtzxgo7z05qRwQvWy7a4tps4MLJIbvBms6OT4uYMfRqRh3ao4fCycQtBWkRke8iZLV1wCSPHZA0vx28Ryk5WYCaIthlGkT4xAy6cPBdkUGQIUsTI6lWMDOrLLvHu+ClcPCj6WBFuNnaW6IvhZ8vHO2FoS7Jfma5Va/2MzNlQZJA3kW0lmBNSKiht6baff1uIt0QInFxV+q5E0smNbLt32N+IjX5RnZCg9hyrraDQ4KQxJwiHFRGF+TVniwxkyHg3bwU1A24AAeqAFD/Yq0tCX6QOq9zKP38lc7YvfnlzL+9IBJyW6RCP2myC6ndyhZAT37Bni3A5oNthVRJRSfL1CfzbmrclzQQaSlgQTNaMDJorermVR/tSlSldiMvAia7bO4OoJuMrzxN7eHjs2iB6RWphECI8cdrC3yl6mfEGV6Q9Z4O0pMBO0rTjKflDvgCOQOPgc3rLYAiJQYqL3OZNa4YiRjlrA/06Hwsu0X2kvzdRCRTgp4V3rSTRVrFzCEqk7hGI/A7ebhVphIw3C9UTP1my+k3JuLKVazytVRkBaBnUXi4HLNPhtJt6DKJzDtCV+29GiiCH0u2jMIoEbD1kl1qzkHmMHgkjr3bWM4cQ98YBjrTzYGZH6ab3eDzXMVEFLsQm5l4s52UAlsCK6NFWsfXkxsCfAlfmf+aBr7Wv5/Uh1orTZSiuUQ8Fj08JD+kLK4azUtA30q668OhEC0CwH2c0DWHVhUn1WZesVWX6XU9braDFK3fqDr8J6q07sNO/ZkiVbPaQ2tNYr9Oopy4OeAsi86Cbkz2nas5nl434brWxMWGe5FEgVNrdC/lHeOJbsYhISA9tNRGyfRC+fZzFzRd5W7Vda1UlguLhDww/1RMPV13Wyv2eprnYVsKsu8USlL7DIy3seLfMa4/kfutApZQ0sSCFIJmTdLVXW00zSHDnVEP2sRMj8W7E9Fcj69bYpVhUmmzfQLQNfa9Oiil+AnKt2Prl30Zs/CEU3PnjzlUxH795qBUdMU/vGTB6KuNYxEXGLDm7cGUgM8UucyVnUnIPUqY0d0X9dg8Tsr3EFYiqxvAup0hN6tRNxEYjnTbF8efPmzS9av3c1uOtp/Zvr8d3N5eXgTrsY/vwlu4F3m0kqPdVaLLRWSyhwgP+gV7MhPkP+Y/gseVgrDXCMJx1vOl2zqzMW3n5qLFkEz9WGWYZEEwJc1OY+MtMpXqrwLMtxCwptByPXCDQaqeA1he85Tk6wpEjNQZXE9WxcSeUQE/WA7qWdjVLDUckiVZXxIdPvZEIAgbF6u9koxOhogrlLWGY2POpq0V4Qf36Wnjdirn2DwhF3o+/qdA4nLl6GiNH6e4KYRWBvEgFhNAo2d4Fq8vBa3uABydATLrKFU86nKOWidBS4jmcc5wENecAPLY+A0yU/fbnY9rOvO4kVWGMXzU51M6tER9nram5PzLMed2B5lgAgn7tyIDzA3whrY+TJkgB/qlI56J+qUIQ+YV2JUUyOOhr+ryCwhxKE74XGtiCsmW4HOo+ZeVbx6qP8i5RF3C5IEEsWjsToUTBLzmnFm6tc40+fuVumaY3c2Kj1Kj7XX35xBVWu/FCkEqxHuuIpYszZPpee7JOiAYp4RlnnmOkAWiExMQ+NCEwyHpr6mQwN6ZI3lal+2JIEIZvDGlZRXL4a4651A5vX6eK+btXVPAEgNgEr2vErbe7oDJvYryscRKTBV2sjYQqRFLjCTe37wXI9VLXe4rlonQgVx1YXmdZQl6tYJBaRTjHJRJ5UOdJqIRmlzkElsvLXOwANrs//GIegLznom4uLy+H1AAb+dnitjX4ZjQdXQFxDN7TmPm1WtgtHkTtm2qz1ncwx90ti4oarCSjBNc98GwcETxEa1yno7DNd2Isrw44lfzF5jjdGubdZ8oKcc5wIDu0lejfj6boNx0YTYhu43xrD6FPeSKB4l7lwK4X+7BMe9R2zrY4xZvrwejimEOyKO+zkt0DF14P+eHj9NhtcPvs1wmWAT6p0q16sajj1oEZHCFf5KjT6mqFKJ48NEEhzJFEudc7hK7SMq15HdCYI2d5CD9VoLoAyXft4Q6JzaOWjEhVQX0RmlEU11AgnGx5B3bzhoBD7QGSXaGkiekn4IX2AoNkADurGXG00gSWxP3Cm8Um75En1RCeEjoHsTxnEbrdbzwOa3TBjHCeML5geZvfXTKoPUcR9tM68TAqDObaUcIviK3pBl+JYUIhmDCz50uzOMd6lN9VNGzauTh7QnNHn0Kb6qYAo7LnySYaHxFhQpIwERoqDBIvxMa0Bi0BQImamO4V1imsUREdUP+XHvkRLVb3VIirti2C63MYqAldAm1iEbw/Fv+fhDDmIeNnVto0tVuTEMbITY0aL6mpxsqNqnMkiCZI9YNBGPmmY7WpifhIQknq7JR61OtrHYg+/6ucV9ZQNeBj7JHupfFppOnM5G1wehBKWK8JzuqbokCBAwXUFpFy2GzHWQm72e/GEinlrnWKctyAsDSMr9qbqFejYr9tUg0+ifnvZ+2Vwpx8dHVetj/HsEMIY2tRYJp/Sqo71aDlQ6dVR2ZfW5xV8d3wEJf/LfxZAqYFmw1zahdsJVZDxXLFGIaJP6iK6V6lRgWJAXTUc/0ilAMm1dkQ1h7gPVBz9VEN6PcR/Ohqh9JAhNodZpHhdVY4AMiYmMyFBn+vUOIiOJia1gDG8p+qRNMYiC3FxkISnnLudfGwwiBKvFCxGsEz+uJYkJjEf4qRqubMWSJROoCZXsceIL5ZNRI3ELsTCOMs4TH4WLS76TvyqozmLsNvjjdC027HDezFSRck5J/C/atSVjgzizwq1U4cugaQKNTFDu84xwhkH1mwLENXkiPwbgDoEnpwCbjiRDD9QPBvFxr85G38OAtiKl54UrPWRFfIhCeV4pPIvtVbHEocK6C69Ryvokher7QYoWIm/1VXF266uo4e9rn9s8a1ieN7CDE7SCPiaibaXTnp7yeOg+Y1c964Ghc3QLoQNcTzcFl6B5Dd0OXg/uFS3xLaujnZcHagY9tXNOet+PgEX1OaKBHWvIg62/bp4myUtINrTPNAyEE2LqEEsoWKKqQMTJ78cKiOROnBprssBc5Io1CbjCscTvNjRaDfn2sI8m423sJoxRAu/MxaaR00oF5XLmC//PIVktgJsebnay/zkYVgKlJ5ZdaZq6+Zsslpfs/hkyn20K2HYBDYnQBWbwWBOUOpaHCQAAwxGB6V1uMAMdIzx78jwJW5TSkzKHgBvveG3p9HDekqslOULD/Sj/jq6qGVImy4M17UcnLN0H7qJL+r0iMxdEpTOgZRaGwC2b2Db9W2Tq7ajDqYmqXAfw6JmYXjX4JO2gC6Y5AYOAD7ZmivJoEh3g5FN7ZU2Ov+Jgexocy+OCQEdl0HmgyE5yHNTPALVKJt6gi+3NlLBqYD/PosvySzVZF884AYEpAHab5Q4ZeDwenHhPUUTot0PmzqBj9DtRACJbCihAbyGt8M4lmiNCSFDWYbCtV2kgRPTZyGJ8RrAyOZWfbUdG80NTyCJcUUwLQcbmOzAiXuDifg00gmS5bKFVEfVZ9m9j4kWkfyB6XfpUq8lkquUHH3YYSEMMZRQkk7bXAnElUG16V4NtOaxGQtQeY/B0iTEC8KREN9gOXDAMrehNqqf9fLf8IvKswJxowlYtMSn6t2EPqIWSvMRwjbCYE1WsLO1g0eWegdfzoMpzSqAwksTzZiFeGUbQ3Xyt1ZR1EyYwyhCXQXLpaKx8yi3lcddg/OLzlfn/RnEJai0AcGPfcNlFoPcuTo9SQS45IqkiFf2HS+wItZfwqRNy4k4eoNLFdYi3XHGwwiKozAlHGJ8q8t9qoNuyrm61KVafH8mPi3qP/8YzTUxs6s1bYsnpF4LeHyTN8A0HevKQPWs9vs/a96gXnnug7U5WKWMr3J2lBIpE+2uVIJjVWBqsYdZcyleVAWr3FVQwaV63rivfMGpestfbX+Gj48d8fJ2NglTtIR/TLGGq46+rbGFWOqiLrIPi4ZS6aqOL7Ao4bH6qzgf8sq3XUqHnLfA8pV8yV/75JW0SVns0CiSH6oPlQlU3A3eD9/3LvEcY6PwYf+WkSF4oJEcXlp4Zq7a+I2iPUpFTz3KhjapOvPq1i7YzgibRtyEWmyqYBH4/FZ9KiO3L9eH5K83vf5Pb+9u7q/PScN4STowfdQb/tfwpx4mJvzVtpa24eq/AZcNFrYefNfKhTC6+FmCgrWD2WcdmYSTqqS/643e6efDi4v7EX7ILVimhjPFaEmYiGJhBIt2a2x9PkoTC6s8Hvx8XFLzOLfmSUnNE3XNy8HdrT66urkZvysC4Fj+arT0vDBjByuDuR2QYVsxlJWVXSxX47tL/afBLycIDCD8zsZ6KiGmo7FRSM9O0kle5W6eZgeo/pz6c5oZxz8xok9W/0aWeBTeCQ+F/Iw1wb9fnGr7F3DWDkgeIEWxN9OYY1122XMHyDPt4x5eR+pLazmBEzTaNO51tD08ZoWb4fnSWOHP4Cm0gYUhUPzpeJiRZ7OnuM+V2MneeDAaa73u8anWgz14E6CbnpsawZ6CARaEVZ6xsSa07PyWAZWmiIO3VshQIG7i8D0qIExMSIcvhudwTnMtYf2qeWuMyR1YXdhabczqXS2e7N7d2nVZ9gmy9WQ6125XNSRREp+2X1BCZd/ixqK67c68Ng3wY2Jwn/gUf2zF34beg+VGbxhC4rdzCScvtH3Xe2IxUk2PYsVGxqnoqTKb/d9q472AqQtQYEmMIm+4JPWvbbzM5J2HH61P2v7cfrTYDDHipD/vhzlGmLIDjzFB/YQ+9731SoDlpCC9ifQh2r61ni+0JwuP5WQ3QG58deS5HPkblwwikq2ayBL4FLZGD1ZVsM6hIG6vxBZcaMirrt1iVrb/Ga+NlljZ2v6va3RSxjQjGK3DDoFmcy6W2cKG08eqfZQbUFlG6sSwg6m+nPs6HFLckEjyyXZN70kHHuBYjCCLr3AIkAUwusZqhQle1ktLZ5G8vj3T2uJ8z1506sBCsRBn1TUV8OKXVWBy02GWphzzi+mzVZAko+Q7wH9BMvN9xiOBQ+a8l9ueTjGDM2KZ8Muq2ibl9hQLpcPIw86Lt52aWWWbjFFr+ff/EidPDl16UXQgBQ4sfclve63VytBX9ryKJpIfCXSd6zd1vaPlm/xikT6V7gHf6v3L4eB6rPfe4D5D97A5gRJo3Mze4ckmUdz30OZS99x2q8Wa75rr5Spo/95yjLkeLvCgivlTuVFUgVKiJYCZa59dWkCVk4p1WASU0CZjreOjf+aeo1RY5zCgVRjDURHOEyuLkbgPews0K1BReAuuqM5ConE5AM2H0r1TfdcqzgJehb5FiwVhYUjrwxMyrRwjhNPWsmtOQ89zujZeE8wwUiQnQzvQUZ3kGMBfeHC33BmgtHDZ75XXnjVQVxCtrgJGVPKWNkItg2Va5l/yNufKOUHYuuGrDjYidgBnfu3kB/+0QIYDoh2GnW8vvBUL6t40PYg8nr6BPpw8SgOXFURXVANrqOyI8XbBzY1g9QcoqTIpZeY5Dl2V5SFTgoVCh2NRNPppuKZrJCfhmwpkWAqETfvHo08ADM3esDZdatF1GnrEAqYxgyXQ0wbD3qM8AFvbA9604a3bh4HW713n9BZaMO2gvccQ2k2K43iC1u5vL29654PzvPGq3ET31eDOUuJ+9lDDniSf/SdGwvQ9WCwgtuueP9eDh7SKL3sYOkmehorPJpe9971x705D/x/VONk1pFnR3Z0LuHyFBxt3WmBYxD+OoBZ8qupx/92g/5P25nzYV3ZcqpInuMmpmiimMn2Ys1B4b6PvsbMfX35/BAditLTuaD989+p1uWFvXl+CNR6ELhn1MAnoRYqIisaBPFnmsY4Bp4CJEWIwnuikBPtckdNaYAnhst0a6IRe/e5m3BsPb67JXU4fvAdBQ6XZyz6JYnRIvsU8TseMHB7UwWAwcyBIDxMbfQlzRxqlCyI6T4RDQKMlfnUeR7gotCRKZkYZ/vyJs1gZgghucsAMoijOSbie5Cmoo1gbWNO1l+gkhsBMro6ggBk5W12zCBu1o2o0jGGRDsAhCc7RyujEMTWqGAxLsTjkIzx/WgFaerqrBLPI5RdSgAw9MIVBeF5Imctq3P4ky+zLO6TSemEgQMcGscmY+5aFZ2B9ErpysAvVvMuSIK1v9i/whyASAJljKVv+VXpHBIe3/GTGj6wmRI7PjpY0esay2HPM6pJHkajLir9CE3ZU2pBuF/3lg7D73+OBfnnT713qb3rj8eVAH/9yOyigb3458nuO94V43ZKahWOH9EtRUY0BUrawimzoVQa8ny90Nrxi2+udn6Pbc79/Bai/mvva+EYm6BKBLXUyx2SPAlDe/dMymB/Bd3syhLj1U21P+5ZuRNQtlMuPCL+CpM/H3UOrrgVw3PvQdoIGgzcEAH1NEM5SIOugIdUZNS5SDe4aIW9hBb337KnVjBZoAT5ifU4PMrwiXBynkZHoiBoVycaqYSLPyl2BCuszTxUQafYaIEQBBKO/U9oFbgrRw6d5uEmc5u4GPQpSQMctxtG00eDu/eAuryujRx+TZHa0vmOPiUlmeGSWFT/6uFfokw0xowRjyp1Amj/eWjxb/MEL+LmnDenxnuhJ/BV/UmkCS+ZPjlKl2F8Q96Q4vIDDpedvulGGxBdd7sHKFIvtCHFDU8S3h2my812DoW8naRou6IiaovMrVELOSa6ck9xcUdCptwPnjvkljjkDPx5d+lWlcbzcapLTh5/6XRAcAP16+gMNFtrd8M39eIDrn50hqyx93kN0i8oJqVLUdGCFeFrQXW/b9iVIylgoeT3gUcx1OIw9WputsZCElh95RNWV0e2gT+FGrt7ebY0OzPiJK51tULVmhUuRN7eDa308vBroqENo1A1OsRjGgI7XYl3W6s7guvcGt4CLn7Xbm5vLRh0RGpfZZ33leU7dLtzd3Fxpw+uLm0aN+x4sUryzbTgRw/NtkG8XR5ZREeI6QC81HuRALCyauka0mA/uLPcQougWAwOAdcOfLjCdX5PeZKGAMMv+iow2SVrgr5mjZ4t3O0+jAez8h5x9Mdtg4a6Y+bzSXvJD3l0JJXVK7IkVtxdEAa9N+0v+wL/DgWcaigeZflVpQN9Vn1FMuCOPoLr4w0WyWuLPq5xpzvSicJbTX1fCyavmOElLC/XmpIxWgpSUtZsRK5nv28ubN71L/RxWfZVFL7PeO/h7iJYz+ZP7fXpy4/rq6Yzel5lQ0IAi5agSr3N7WoOP0feYGYGp2FSBcJPWGwVIh5G/zpXqsZkSOR4+qUTArythiU87hrx0uDtz/YmXa+fwPOh1dUKQ4eWob+IvKiHj+ypnYbxkQGRkFAIg1uWigYl8qirVp1/UkAdbVf1Qa5pTKMQooBSIj8lpjSY+BeNMY2FMR/joFp5UU3jnYSbbQC49JL+rjLsGmJtz+aQBwqKqZzyGwLkdIBmPLHy6Ha4i2DmqLf56K8zsly4YIYcWmAQQoAI2KOoWc8LI/qG8pxWnOhqPlNG+aN0bOQufiXNrn6npCnZAQoDUWGr954V62WJksaFd0QZYNLYEhOKRJT59/rE1n68ClzUxlu3mp5hEMzslsLPpIpdw5MHjnY9q+SEFMikki5DaYkkMrP2ieE3KX+5w9xLuLoElbumXVhCg7Y21tMPQMiupzXGm+T6BAC1uX9BFGHm4TvC7mTC1xuqIsFzmJtdiBtpR0NYBGcxW7P9+ZgA8OKMemUcUdl/9dCLUAcUX4i3rUZ/Hui2Qe2F6W6da31uO+EM45JHWN/VRabw6BGzYIMJZbiCuPAHsB8tYee4bw+/TiUlAn2IEL/nrSvDJVIlC9gHkd+ul4fZWK8vw+eEUAfNPqoOjmyEG8Y0xfUBjQ7zYl8HRJ5Ug2q6+tKYLg6PUciw8QeOg7SB6WQmSt8ZAC8HCthw+3ht8MqIHvHPyN5WAmnB8WjBovbnnbgAO9AueVqtuYJ1MdXpaqT55DSyBphiMt/iTCEI8DyqBCVZoNaw/Gs7aChioO2vq2c619cQxk/ik2tgYPaKJg244Dh9l2LOXgmTFF45DX1WCit4v8w0c8+doS8GpAs0Hk6sh/qwS1F/Xy5W+ND6zCBwAlZbCCC28/gte3a84FpLfVSPgQLf+sbZXur8OFvrEcyPw5+jZRRPOPggX8AnQX7WZt3h4cI4C+HMdEFgxYfiyEqgnYijMGitv1UrfVII5dbwQvW5zAYoPqi3dcGH5QS4s9rpav0Dg9L352tLn9iwUtI4P3sLviJfCV/S+Esyl5T3Bhj4nrQuDeAWP+hiN+wXf7dnL6uAwqQcQy+d8mIkvqi3Ipe/5eLu88vjAe/7SS20jBj6qPs+mbzy56AsC//cfeEeNlYCWfF1x+MDQiSeQkhQDTOgsxYhAA7xnuUyjPis+rtYWfaqDmLPUAyBI3XnMbYR/yz7D0H2Vl+lkPZvJqwt+SsRbGdUUWQj+8cPpWjA+/kuQhPxFNeaEIxeRgdWLK/6k2gILfUfesTGHDWEzWlvRB1WFCsKhDaJcEdj4gwYwJemqAHB1qYp9vliRCJ0Dl7+t3NuZ/dkqRoH0RWWoGC9jbsk7SXbCpE8qbvyhr0dScJSNKsVn8CPgRQ9WNUmHodT6XIjT6KMaIH2LnBrxLjjIASt/Um0RGCAmCKm6Dz8iXLIXJUD2OR4jizPTCkHs5fiEp318CjDZ82pyE9qX21M73JBnwpR3bgir+z6I54Zkp/SnlRqYecAYI4tiNvIFHCSmYXR/mfikEtCN8SSkpfHax60PhBCOSDyiwvvK275E4wTwjbUwHm06Swig9FU1GjdNGoVuzWbx1Jgmu+BLkXry26pS44NlrXTTg/1zZvtyx0lrLHPo9LfVyItMIFD+hp0NI3SRDyA/GMErkNMjX28ahvL7qmc4354vSNoXTOHh7ZokGX6Mi95X5TDGdEHG1MhHCs/FqW+rbbVTGKzMEnJgS99VP8173gOefCIhLI1s6nTyw2oLEGZenzje9MHiizszhfInVckQYwDmEB9/WxXS1JBJOSIB+VUlUAvsB4gkTlJx0fccxw48IR/LX1Xv4TKhwWG3NGN6InCY+KwAcLEVSVabWdFzCMuzXZmWXRc0UUtGxrPMYFYb3ff7g9EoV5lXL1V6qrExHAStVqDx5Ny5jaTqWS9UvnxY0GUg+McafUkcSguIuuQ2BuvAVU+puE2Tu5Rifu7NIcZNw/TJtkuP6OKiUG+p+YZt2oG2b7d4uFHHQg9b5nY1secs0gV5LuQEZ9iHQejkpSlcQk/jzEKGguaioNAd9M6i8FjwOfp8wukv93ogobF9xnakCC/M1yXA0C1kB4N/JCxm8AGtFfwjXkPRI2bg4Ln49wz+XPtWsPcJMIZpxjzAKnaKYjpTq/i4q13YPrxlbq8wMyALelbeJJbEdl56E9uxutyXJ2EFJBx5kg/3LdTjhxtN9Bwdb3MC2ilaiOyGBPT4wf40nqq1a/9jjfFkimaAu2/DvGNgGt82GcIsbUb4sVkcL/FxDn6QAiyDqrqWZfKAjqaH3r9rd7ogmNG66WhDWgLYCk0RfBtYsIzQYVt4NbPWXfQ8hKVisTlUN8/se5i7HLM7zBhWVcLACiTZpYWhJ21c2qb1uauNPAzQgqKXBp9RvtO4ex6GSgTWxeIiu5Y290BIoA/Q/N+CEzoa3jEcBhqGuUlULh9OdaOyFjPIaXXS6GgeziC6HaHQOKdaO0arbZ7gHpNu6kVeWIkW2RfytD/bwInvMvaOj2G97x8fE2pziYPVQDKDOh+x0qeOFrMGEKctE5DBDzFBTqyhFjtHongMYH5v4R9wDvd800LJ9OPrI/Q4hn9PPuXIBP/U9gNPBPuZAJ/UCGROe9WCTUT7wS0GJhS0yaYNiC0/1pPM4+vWjZutEHmnyLeaAYsnvo50VD30hLxRnSXX1j7wlEBb4qkEt/CcgB0VmsJSsEfQ6xRSMGVjtocYDIvFn1oHnB2GGsjNwEoLQJdGrciIUCx0BYWz5HINbZCwHrikWLxrlyMjI6uw0KIY9OP/ViHKypWKB5+VHRlcFkmjquS4x4KMYmiLqUGR2iabZOgNhsDTqgDlCBqqbRY5GnvOQ0AXbH77TxZtLAvj0VKLZ0V+7RVn4uRUG9/9oo3GvbuxRj6/3Ekgl1AKlkPWO1fpSVyFY0AjPEhR2s63Fkx5vDcLbWNsOrjwTJAlkC/85S+5gWq2O8lAW67X0fJHgV3AlVrWixTgPIPb7FPFsSf6KH1Uori6FzyW3P2wq/Z6Z5GKFS9S4BSHsbzYK+nn+1Lk7Dk56nZB5gTxiHntcltx+ZGQky/xzYBeJEEmvPhnwHIwdpvkxA9/wTx566kyKW2cGHwG/OA0FicwTAGsPTqRw/xqQJQgID9NbIsnKWbTnIUoTaZIqaD13/Xuev0xHq8Hl4P+GKAiPFqUKgeRRkeTSmDyzx851bktF+nVutwzNukpKyApl21Hux58eDMcYFrstwP94ub+bvxO/qC4WW8ZbAIWU7wbqauZlcn98Np6Em2r3qn0BYnQ8ge+5VCkzvshnTCNRw/YBkw36t8o7hFwYcWRHs/9axt5/scWhlmn1XU/xCwXo8eoB/gzte7wUc91PXhAa0v66M1c+tHDCCe8yqc8VlwlzhbtJWsWHXCKA8ekJ2s7h8ekGWIBfMwPocYvT2kfhWmZGIE91dAunHl5gyStDvGBstLSWGnsUKTZZkA5Orw15kUxAvU2alMeLgpdIw0Z8JiKPSkilpZEruGxYt5gn6/mzAP9WePF8CMgXsFz17biFjIhNBmP03MjU8mFh+lgnn3l7WRCSXY0iiVJbkClmUHSw/sIdTHCE6vdIHwoOmdnJ0ap44ypUIrBgeGFNMvwnQ0t4PQINbxDRN1BgPWUJFqD/OJ261FeFPHjD0d1X5saEtFUUnjKIYIoiXacIIqdHnloymwd3sGqiqjmip6oIQXUEstWrtHJKGJikDm3HglFjsicifmy81NlSzqb45O8b1Bkqgl2HgVAPcpNDN0ybQMkFpMSdBd8tlkb7sTAm9GTVwWfzTD7RvztcdG3K2Mjf1rU+gzEZOnbIqiB9Rmh5b0m26bvXuW95inIX738Me8LPanoyl+QBSow+vcV/fs9/fsd/fuS/v2B/n2N/x7Tl8dH9C97+yP9TXCOqdYxwTkmOMdU95jVpS9PqO4JfX9C0E4IzgnVPaG6J1T3hOqeUN0Tqvvy6FPBzR6gauqsQTrFQzQZBQWk+MO+42h/zNXz5WKWnQWE9Q6zuWKrAnBwRIioWhVrFVVI6DyPT/IGup1WU/GoWJGnYq8fbN/iLBoOzp9XNEzUr9wPKac2PwdPPC8E/qQKZq3U8xk5eQXkj1H163OuWlBF1esL+7MW2Tzxe8gWbszo193iGheMhwjne0wIxD4EloX38yiGem5LBZcHZ+RbAtaHXQZTt/H8SZlcPEppQo7FaPDIla3IzA8O+q7XyttrWdppNDtNVmjTn65XkixsBDWZMmtO95ssQx4fMklPhZnCuACDBksVZZeoz3XkFyxMmBA9y48IITciTV/ldri8nGguv5ZIfxthIOeUxRdaco5QplFMXanOq/URUwd90nqmCWsPIWgpwHSuJamjkl8mSE13w/EQTvGn2mBpi2yJIpcVeesEqew9qIaGc/hfNWaDqzgx5x9WFWPBZlkyRTeZLov7CuWnlcs4GuVAKPI2UnRIDUW4PSUyb6l61jhTFmv9Q+/uenj99jSvG8lM9ir9YfEsY5JAZFJGOucEznLI0pZEU5zBqAqNtWa7zxNe6BHk/4wyp2GvsDcFU85XU27miyzUKvnNed+K+qSJ6+1Myp9dzrmqB80mfBivV+G3p87lUJgjR15hHAz9qKiKkqt0yWGJKXwpYk7BpZQCRVfSIDR0KHzeiZB7vv0MkNKedV2kjtQGvbvLX7T2xJph9m/mqovjUkCPjrZCnrhEeFewBNDyDxeqQ/pF0iFmq/OtOsrqLtUt2bYxnzdvMtkI3j8mO8FiUqOiHNXFKN3lig+1hACebmPhrURs4qLtn32NeaN1H8TjlWe7oYjuUl4vrlK5KSlvXnEGhrgK3hzhhh1QbOTcjSmusFr7IPsH0LmK1fLfJPkCWdEbc1Trz3ChoPB/4M0O8L+B1l7hejv4D9jwJuJP/NLOi8bAGhjjTb0d8GwL7IRALbEbH+EglJwj7dE2KMU1jNB/sDaFeV0JK8nOF09VRXyItNxIbNoU1tvc822VeJPoCKPN+HO0k2sx/zxU8EcXTPiDuYvAHziR+F/0asP/btbWg9HKiQSIBZcXb2ODNxHKpisp5aKl9FHA+1QQhTBZV7GwElByoipiqcXsb5R8jinXlGw/v4Uou4PoO+s6pl2BhVglq3JqxWgYhZ6ABHTsdfFWCo9R6FIHjL3w1MSPfBneUWnmkrymPNT8Lmgmbn2LuU9cRKg+KJm6qNWa0xXNlMhyihihOYRJsGf2lPay4hljmbTyCaiAT20xbO4+yBYqV78LZJ+x/ISFSHhrcTZmir0Zox3AkNGCTpCEx+T8mBbKSFfUrHbvlGI3lJVAQOgAwynHXApCEyQqqLYhOmNiInmiLZOQxnK9R/T1HIhUjCSF0iIzrzJQdXHL0k3KyzLGaEejsARl+qcETqkG4c+I4JSvy1KmRGDrjs0wzUhI40PjGuCSIV3BDoDXT7QdoEbReqowhkge7ELDbdFS3U77Fvr+NOv3HdWlnYxtYswmAyvX6j+myjH85mOwg2b976MpHq4rYb5NozCrTAFfF7ydeJeMBlV3DEJYb0g9gnQimb/CBKTOBxXISBp5nRzwYowwT1GbW0zUU+Vx5s1SauR1xzF1LMPXEywkqCJi9LGelpAFa0gUuxPlG4pkxTtm6IVGXYTg/kj12EaI2oGkpFxldoP1sp2/1bFIN7kRuipIAeKwWHVAJChCJX7o5Uk5afruh/BiEhxWFJ32tTs2RLrpR8mBnGleaAfSyZhfqbFTOLVS5Sws7+uJUTaWOGmRYfcayknCXYPET6awqLGt8/HkHUeL9r+ZbwULNtWR1Fy68VElNtUkKsPkHGC/3cTd3YvCPjPjuHrdFWqQpMqpKmkmWQ91nKtvtLaQQQv1LcUDkq8LrjBdNJ8VgzVBF4VImCxvJxryTegqkeVBR1VOt4xu9+U+rjbcGiupAcIc7+T3gdmenRyzeCylcvLUW23qhZtjOkpu7MXVlB1KAF8yPcISjczPkkpTvhDcTZQNT9wVh5628tn1TvKuupivkCAO7egMTpvyl3W0v/714Skvk1lyDmS2RHQj+oPzyrxtopmFAQgD2mKwmBQywj9lhUS0dR3vCT3f8dTZwjnKvKl+Q1t2AVx68JY+kvDXZA2T4i4+VlbZVjw3XDhI8b6ptan+CzpS+swGuAp7zENAfl9BSiKZ1rdY6neTUWQlaUcIbRjWy9IM34p1XilwOKWl518+hgJdeTHKGw5D3puw/xEIjI2J29Tz7EuIeEohunbZPX1TnAsgfE81Hg3bwUi1z4rr+j2X0SxqPy+GSfLeNDs5XlNdxu+MmKztqvilLSehL8g/eGWflF6ck96MefxEcg2ajiiv8ioYSaRAdVPa1eo35WoFvaygfmYricHd3c3dKfcOpHABBTek9W5uSyIIJDxVFh66xvC74okHLL3LL6rf4I+U743ilbohxYc1JkfZg3hqnvPaXNV0+e05ln1kUg76cjHRKfLP8YGBYGwP8lHlDvzM8Ig0PUySUsPkF9+KTj2XuX3+UUCAyyRlo8SzupDc9GqiW6mEU91dKEG9OjdPQCaTh7ZGdhsJimCysYgQmXefV9s9Kf00+yRx3RvA1mQKewzqU7ZCykQz6fRBAMjng6TadAbx6HWxC8gIP+OeDSWkyFy6bC/QyflYBw6kL+GowEmzAvUFpAxBW3390XPWS+FQBD8q1ScTaxpYlDKZzhvVGg+9Ve3KSoxShmoJbzWY4ygz60X3yioSwosLZq6DtuYN949HBoFvDCw1qhpcBgnRt2gIEv3ojvqDa+ZiqV/evHnzS3WMRGNB8kDGS/Wfc5uQxtDEtmoH2VwSpqNb5KbdLk+KOhGHGTSD0CQHc2In8B6tn6wNbQRXtMiukk/KAIQ+umJTHggyUIBf/bykEJmh18mWnOsoVph2u2Q/YEZ6KbUaM+p3FM7WdYT3jGEZiad3lnmLD+tJ70lYDUT4oSSlZ/qhtTEg2Isqiz83dEJSkLNnFGOMb3drNzpYFe6Kl3e358/rE1nBxA8LqcWY77cw2mLGWh2uxiLnY57rzgiY0RfaeeF/KZD8kvkjt0Daif4KHnIdvdU9/bgssbHJMZapt0OvVyay0YQGtQEYJp2kyDUDp1w3IeDNFcYGDx3N5FcSSf1vZGuCXzRcVShfRBS4/ZLCdaBcUsWcTeaIghuOzIc899fRwnvKxrO4H6YvM7J1VdEU8lo59zDKibEOvQMWKIO7fR1gmETKwCpajrtCAXI6cHSDzUh7sh1HQ/c1xnBzUVAcUONu0Dv/BRodpdsC8QVWmeUz6C3lKFQtXFzefNDOb64H2Sq50VTk6CNyMBX5eTYmSiKAiWO488rBS/73hAkphiqigMAEdmk5IRGLsDD0s2RW9zBR9rB3qVFIpJd7RVSgjJmRiPNRIoBk6spBQerWTUcQqVs/FW6kUfMUm6RRTTmQyQt1BNd/ye5KCP+S3Ytl913J1JX31yqbdaNopjzEAnx8fFIM8nkiiqZDhZZG+FQF+EzElti7s39br9caBoHQelO68tlT1orDS+RnMZPiS2h5sBW1KMSEVhBjIoovoeUHmIiCS2j50SWSkSW0/NASibASWn5ciWRMCS03qAQFlNDUESUwmoSWE06CQkloubEk9qQ4EnuFcSSiGnLwAajyUfufF1BCK4ooEQ00G1kCMaTt4Sj2KLREXlx5UVQxJvZy4kvsFceXyFbDGjkfJ+NKlFwmsLX4SblkS+JOlCMxXeRIFQrkNQkzWxo/NlsFhfD8YI4nQhxnB3uceYwxb89d9NWk6Lvs1EMqTNd7Kj0i7o2ZZzVehS9XFNzwDQNBwrK/Rg6fFzSy+DKH24+qY2vKI6h0b7P3wUPb6dworqURbBPRWPGWVhth11C2IsMxNmyMvqHtfYv7jdxFpaBeNE/yLHdKQg8qgSvOuH3L57a8Fh4D7oc5Z2F+FlFt8vv7TJtYfQcnYLCBZySIfOjp5fF7yw6Y93jrlKlV0P/QWwKuomw7wDRbVIPFtowSLKIZ+D9VTcno1lkQ2BqjgsOfROsjql51kKwxptgTMss/VemHKYiGop9x1ZJloBpkGrlpkCow7Dic6LEKMsu3SJ8SaBWoTHjZpjiviu10g+nxp8dWFY1Bam7a6YbKNDSpszzpaLIH+lwdjVCwyPoZ8UylmYkYDa6OfwBa5yAmi2tSvlPm6mZq6C+U9b+6bqdYV8ajJKpRRCa8sL0Rk+eIEtd6Am/V7mTuSQstwtgEVJsrFZXxDWgDjI9V/K/sd6nLfDalkqAU3eLHAPF5zl6X/AhdqIUcVW2ULDCtQl/b9Kopo5JRqXW3uNipbmQhYmORlfo/1jZKPSJwGJoyynZiLG6EUhEcAVLezFmfAe3MBRsOODDmIHX/oRb6gE0izPTtBA9JUtnwS1rcCV2/vMzlF3khL8V1V/r7P8TdV+x2XiW6RVyDx4WiSAg7vjQrbh4DwVoHUqgqbiiW7z0sCl3zcasyNzmMmvd0VIlf1jW6rqtlw58JKFAaSyDubzSx5aEEsMg7QYZeU/fQZfaGcqkZplhxEfhYneo/PpBbcFlDeTeOLEJIqSuUNCzFpSQDopR75D6URK34kqRSzcggNfIqE5oEjCHs2PppNsIaDaP1P5k7YrLL1Q6ay/uouBuFF+41nXn6TP6CnfL2/UCInQca2+/kBflHJJO8j4rRV2xo0GQyS/a4EvaECb9ZbxwPY2ruuFfqb/e1C8+fWnKCOvS29Fx4gBbxLMIpieVlAhKWYmWT46/qmC9hyTOUUF7j5JsfYalhEsw6miNY7ay3kWVH3tRQ0FwUhAGMEVC2KLZGmUw79UwrNnUXYWnLZf2cKzAYdHndZdbvtGFVdnVWqWa6w1LVPNTdrV0iWMo5CJQdzDbi+FwQkIe7UTO/sIYUXpGR7SB/RvFppNZpKzZJRr8ItOR9M7i4uRsISuPcoc7p8o9mr0yz/2UMlnlTu7JYzk8ckTaBqJg/IjM13ZXhhwE3qeimrCiitDnJx+WT19BCowYCsgYc9THArflZ9aCrMP+ItGfZV+VI2MbGpAYmhAlKYwoQ4JjdiS4sWvjQFUYp5UOvbxaTgdDINEapMGMefoyd8Vjw5UHW87kb47l1ktA2vdMRLRWB1YuzgGDJXu8UfJu59yn4VnUhVNoAsx4huX+NMXlmacUqfvBCswCMysakECO13NvjaBXaxfDnU+3cAtLicyXkBxFdYcajT4cL31vPF9rcR3egXAnE80KWR/JUu6TJZBpw4TFEZy1gu/Qq0rayZACLTWBPYbNx0dQ9twVmEktNBBrrKnZR41GBnyyKrrHyApt2LztkMTGswo6TUtBELFgmlywQD4URFoplIizy9niGhe262vB6OObpJulxmbpHeXUZL4GS2hkllBQ52TI7lF+TToU4y5FuWeRKzY8rLkrpITsKjHJhuyZeGEwltqRz6wOR06zM8DoFm5z+l2sntFeOhbMe2EA8dIfIwis8UTQAeUg8Sgcpw4vhl88wFnkY+ox85SopfrGUf7GvXVGkDe34VItCHLAJJPEFTkkYJXwTLbDEUNtLLwg1dqtVMo3VB4yF9eBMvW/Ry2pwosHgpUTEDfEJeouSCIHDzM3ooSqCLBR8hjMPQhVLxc7QlWfzUtDtRGe7cVeh34wi4jDGdTqPJa4v5H8JfjcFvR5o6LgEXUZ6/DgaASOi2t3Hkj3ISlZGoqHEm+3aAKlbd3bfhHJtV9P95/RWOivdEthP2gXBxTuUkqnuJqeleh/qrJ2eE3hsP9BM20c9WKZDdbHJ9aMKZGZWvWohNSTDAhLMQXQTKsknwh02siMybE6C1UlOqT5gh8GK85ffS6bFYLSZUimwFir0r8aOe3KqDRnlEso76AK/BlFzEwkw9kNk1ojSimZ6RbHvRcldDlsj6Fr0NZpKyr+Ngh2XrwLL8KeLClJddXxh2Qdq3JAojiJeQgQRPWE9KEwOIJfqogiWXYkjWApFEjGI2twIBetYxmXLTACLInU22Gihtxys3F32CPqr62QuoeuNdnEsrD46F7BkpAC3G0GFv/CNrjeDjXHv2IkfkSK1hGMRHhrJVw1HgaVgQ2Dj2g3o5C6wLeQdSiCpzuZuAxiNMsEuBJeNZ6GG7JEuE+CdD9Wq5+wlrE/Ve5A/3oE8yuyWQo93zCcvDQoOGnh+eCr0cyIRODn/rynMJZ1O8Y86J5NtNxYs+ciizmKXqJukS031ssa2gqUei8eyr90HzJkArRDEDsNdv4A4EhuPb83g6O9Oa64U6WiXVDYLGYiYU9amereHpCz8XZ6PdgH9ixyN7mkxqOdZIAvJsQ7Z5XCV4lhS9bo9imIkUfjrNF/BG/BdSKrRYX6nQuTICterKHdfJ4ls0jXtWnZMKqMHpP+FDjiOHZAKd7m0TBsYJUjeFMsu0SM7YCJvZUEVwyNz5TZTAUlRF5CppRXeZbrjdKnH1pxVaj02PmI7q9rcNINqQ44L4QCOci48C7oR6ZNWJC5jA3rUQCMp1Fl103DayGgaCCFFogDdOkjDlzpdr6GGsyDuPyYeanNF49vhn8PkmxYgkj9odtCIQQs4u5piLDHUnU03lvIpF4hvPOFY8tCD9rcRYJ0NbBcoUsFtgqatWQaeFnCz8Nxcy4C8kqZWaQIEvUaPtqbYCFJEs9tMQwSt2xz1olRgShG2I0w/N1MaziRWiNezfW/5br003D71Re5Kh1/ZanbN+a9/AMAiWXHMub9W1BURXifTWWHNk3q+JVHxzPPSpDRVskB/CAxeXqy6CaDtdKcbkhkmURPNbKFFkRAQgdvlNiBKBHynu4Eo5WsujfW6C66GqWNeKQ4bV9QYO9MgxnZz9I/4D1/pT4bvgowszjRon8Kay0s2lOisE2x/FxCZGfa9tWMyLX2+eUGVySv+Qo3hykf/AtyKww+Pzy5OiQx0hX5z1obRiCwMoVarM1GtLsumocM4czNGiVLd4oMruIKNC6eo0J7yg5R8uBPadtxjXE96M7e8pRWqPHaTrdGBbgHyAvrPTclinBl9LI0VQX20g7XhYH7yBbybrMNkO+WebrITJLsai3lRFTZXmA9BlIRNMnY77iGeVRFRyYGYFFZwYTxaCqR1yxvscyuIzOQA5aHdMub8sEzLrACq0gC/inEJ+eXUuHzEklirdOcY8T+8YhO3QyIoq7axaklj1dxm5FJZj5K0D5IIiBx/ayFNbYsDICWfb+muGF7sCsMRZx/JfCFqRhoW89N5LkMIfqPJdpNDyUO2wdm8vqSbtVVOuBOM6t1pYknbLOGBixnfpnhaI9GN9VENsMytTVUKSaTPbd3SdE5n0Zwx1ZTeHAW6yAJzF2hKAto5emQnLBWK0uPYVnfOUL6N9jwzwZFQx4W51DBSgid9U0X0FOWPwK1HSiZN8gmzUGVs+FFonysKRHEDnIFZaY0NTpvjcJQyHvosRhmKFSTtIjXJZUqONKkt5wurukwrzAuoUlSSJ+bt1E8AYEuNU+G6E4ff1HJ7bmUTp1SekPTQtyZr2zF3oARn+ObwGiOc1985n74juOFXwjZzpJfImxxftkQ1A9oY06x6+2jXmGbxkRrTtXrbY+twV2JvvOWlGXZys2Nvq2521b4qTWwulzxk4PG1iVongwilQkQMHlupOvjqe3eZjoEfziW1RcCuwosr5ioNtuvN2Q5LqS4nSiPQv7m8HI6GN9fkvzTsXQ7/1hvjzwNAzwLd+XgksxhL6GJEUSyNsquBLzkoUudgl/SZ50uXaOgOHx/zYrP7dvSXvobXHaQrf6NTYOWzIzQL/qzjI9sKzl4d7Uwh9AF6SGajaREegx9MQ2aJfHnTO++giYIrDqrwyn4kxp69ya6gyiFtms0MI6KVOLM/Y+J1zGv9lNcrIZ1i93De/7ILC5eeP696V52cpFMYiKVdMhPSw3v0aeRRPShxKWq2grryhTTtp1p/7fvoHkkPNdgBrSUwxbaNiTRcw8GgFRW5lEQ+p9qV8dlerpcafyC8Guf2I66jdU7YiHQp/4qlsa6KW9wYSK8UZSjtMK4qtIQBw8MX1xRybUjNieS1lka4qFZBfeW4xOiYlMcj5iGJPB7t6qJBxGYxFO/1uf5heD5+18k8fjcYvn03rhCHW5S3dzf3t3oMZnjdv7w/H3T4i6sBvNLf9C4vq4HcqdTxHGpeoZt8VvUl5eeKeIH274klvIUWBP0UJUEorSDATpPQwXcg7Rvz8BsThaO23J1vtePEnlRHL4KlvsYDS41LvSpjv+gNLwfnp1kcWI/lqXl3O7rK2vf41itPD49JsuWde3BeFTjmCI839Mi7PRSuegkTPtrihAt0Rc2OFYQ6gIXlWBxdTC7y6S8lIrWsR32ui37WOg/W15VLnU/2o5voRZ3z+5a399Vv7muxODHQWs7Q115MLxsL5gZEE24pH6yMJ1criGym7Eu8e76saBKLRZokVrX7aGE0kDZI0K+OtL9q14Obn/V7OFroI1hFsEVV1QLUvh5LLEgWBoGWDSZMEaiqKHRGGz8HU9nzH4vqRobC86XBPvP6UYyCX+coe9MWU1mT9XIiToNrZtm3qw04B+Q32vERHEm1o1Ny2vHmeAkPW+7xEYbqrq6FV5WifQ8PfSIOh+LchxhDUm1/0z2edbT43xdwPksLBc17iEVMcvdzJ/57I/39W+IgvLXYIUoz8UOUBmKIKIXTkryTlnWmmJuReV0xPjLDDfobU5zgOpgPdwpHJHKTcjdPxgbdpGB+ZFw167Fi3dJJLYpvyZve+n4P2cAOhTs1W0n5yfCrPfy0LikV4KUXBOuliH1De0HkTV7V1K4ehdH+yxpZklt5B3Aq9aE6pJxRPYOYsQWHllcvDR7Ij13tVGaZDVTIJQcnJmr/RbuNVyJTVGY1ZBgecb16Bv/4WPiIGhWRe9DChbR2tU1LhP8l6Sr1aeg7teT3qn1PRyDqe8u+hLpatv9FZ4bmttRb2dcUWZHH44wtyPvNQu8AeBHTJ3VKyZh7Ry3Ul7CiVuRwAOJhh6cKREppdEenJDgBvRs93PL2Lq0LYCajUYu2m5iFbexXvvKxTg41wpZWYHZ9a1Y3uhPn24rZSVBBer0F9Q4WuUu3G5h0yz7bIuaVmrLSzTRBjtT9bCPNvbarkmq607veWIYzjHlIdkKPhmObsVO+5PH0K17diLD2YYvvN3glXpnAtsKdRDpZOEA71HPu9ZX9oEuva05VWZN20KM9txEfzF1wXQG2UTAXLEXk1WOzlggQsQOHVVEUwxF00k5py3fh6pYa3CBDtzGV/qXpkGpZNqTLMx0m+9kZi2RBg9PkFxptVSYDZxjGXDLmigda/27QGw+068EH6aK5poxUiC4RdySnBX6x+ywyu2jCtJfAPSmgaBtDF5uGb2osahOTJBsIbU+2CWeQM/XVH2vfWAWYXsk3THtdUfBYWGQ7mgXLrg5lsOzTind1obWKQB91vyfZxfhMz0WbbQy8C6LzcoKmZLYfHHoT+GPqUKhNdNKBz3Y9Rcw8WEUW7Zfn2pQPFdVp3HO6YgeSAm4Geptmr8OH3pHws+sBeu7MnuO+LdzUV9CFpQV9qEgRqGcKHI+SCXx/FE0cPTHcOUvfZVpz36oam21lmCaLcH7UPTo6rlYJ6mAaZsOf2y6rqcjlrmzNC3Qyq1h5Ds411n21SyTHux0c/m/Z2Np8jHWpBUH0cKRXNNC2POomsGCqRjhTbbwz6SIjMNygHU1pVc1YAuZo6XnhgsVib6ewu2PqHVmSNkmb2Q40hJTTfsIrSnpjor8eamPwUe3hMJAYJV9t6KD9Pw0tHeIm0Pp+ld/CbhHGbc5nwNVgzVd32ZIPZkLCZZaipAkebdxpLUE3Hn4KyvNoHfO7f2nByebm0fIdY7XVCGRAdWzn6zNqOAJaPvfZqOkykIMKZAS2+5ZAvqNdpiEqsoDaB6rL153iJn9Q94gp3hs7PKeMsk3HlYXV/v6PMjJK5/7LrsbGoLWPv97oYFd65/n2b56LeL61/DHIx1uQpApc+xikzOcdYJ5ZTWW5BJhhZNYgBSeMzC2eLEnJ//hM9kbaaDy4ReU8yB3SYEIvc4EcbEBMXVYU+JPn/S4IMimLaJq+ivNRqNRAEUkpwYshdCXrvd3LJ9yYDM4IXl3zD1ghOPVpJau0Ui4A6G0TK6jEApGhtOsZXhTek1lhctSnCsMCMiXgdgDcBIBu/3frgZIm55NTbRSi5XNClxorUQMtgL+BbsqjN4hSdPNUUxNeopfmmuuaVyGFM4W4+MKK5eSEvDwV2kelZ8FWO4pQ8zVcIDvQURbqnyIPGPh3+L43xqvkUSKFjoQQw6WEOk+G84COtkwMrKy+rPbVM6j56mT9S5dCpW7Gh6sq36gf1qasL6wTjSLeiLI7j7Iv5+4Eh8rr8wp+XH+cHpf1pMgzagKH5zXaV1dwzyMfMLJeI579e2vqhpj4LSeXmihF/mPeynL1tV3p9qe60YLc0Y/Uy0/at2daRc3brvws0iGqlSkZE1G3eFrG3e5LN66Duerm2sz2gzByvaKrw5SNZpwnOFgZFQVf2KNU6D4DdKPniOpdbCzabMchemY2YvvfmDxz6tk3QTL28hnjXzXNOhX9reE+hIXHnQnoxhPns1PT4zwdrlnAqQ5l17JmokfDER3a0EfwkAyChKfgASYPxJQuUZwtQ+uyL5Dw7cm6qru8MP+aeECZaabVA+6cibFtu1YQoJoU85Vxd0zmOsKMlqpuouXp1ZhPFL7fyiFKHsEWpqJMrvo/iqDjHSJlYRudsYqumXsAS72vZQefyq65wn8zclhK3NjX60C80chm17Rt4V8VNq7tEEDbHjbMwgdFR6B6sfDSZW9v745Y9WztTplPE14N4FwH6pmu5EKaLjHyJN8xzHZfxw+82aW8TMp1Wacosse5kg4+ciKoy9xFSfqwiyghiP//95UWWFPPNYEdkar4qHvcxGC9QZVGdjnKmd6FFQdG1VIbb0gN/SVjfKw+I+L5sLFRC102ACtcW+zmLH3XwIyYm8HWqa7OQOoRyCaxb7Ywn9mXQs5KzhXkvraF903x0qkhUqeLUrT2rbkdIIekHVsP7SXwkEIO2tHoKvbRcM5glXU0rBKcoV+NZ1pnJ8+6vxF7z5v8ZoydZRLJUCdzkcnGUmnE2Pe127ubWzjW4vUsSFLng/Ggj8fZU1LHpzdo39hMDWZmJrLVcbGKd7OOUYxc0jjDSafNmU4p+As2aNTYkKVsRHyUZ1xrWUAac8udbvTQcixUfOhNN3Us9WvQ7M/wklfMPsu209iM0fJ92FQB6yiifPzUDEizAPGiNHRUzQHTMBiZXErCSGRaYo+bt9e8ZjB18xQG5Kyw9llMoybbgigs882OlQiqssXU84RqqzhmRJM47nKJ10XXWK0s12y3io/7OBWJwzf0Rvrd1M1SFN+wgU1Get9268oOKOlWFE6jadLhdGlek9/T8og70e0qz5SHiZyQjsjmD0/xidDYPIdxl+7pxKl9i1FInlyJ4AIU20GEhN6a4pJJlBqHUlAV1Ub1MbElbSMISeOo0tC/ayd1lGZ5ZV9jZ0gmWeABRTuI6YRde8fhU1CM3L7NGiKfYl/draSnKuyqYktm1VyCT3QlzWNklpKM0UGzFIdWZxN6ciS8qb8O/9lODMHCbEUwkVnTgCTpkpOPolZsEFX538kebmXykmMo/YsPVCnPxQcuyOMfT2Kwf0tWKFEOlNoxRuSy9S78r9WkHNO/CL5yV4o2Pk0WHVGU/zqbG57lPksnMegVyJyfW9XjL+VB3WSgbnYA9bcM1N+2hLrVYSC6E0okzIMZfTI2siU4C7t1fzkeXqG3HBxKPLys3qZtFqrVnTpr9KGYRum5o3w+M8fzattoqcr99fngjinY9PG7u8Ho3c3lOczDwaujrZgso5J/V8N/Ftabq2jbBR9OXBcwc+1P2uAKhja47v9yKt0dXPTutInleE9C7djenH3TPZm96PBTbe/tW0DDaPg+JhW0DSCNAGGtU3uA22oKtqsdGDOLOMKro+6R9m2Be+LQRVIOLKGLZTksWHIsAMKC1u2gM6pYdMQMO7yzHcZvvira9mOWcTfo37wf3AEdXa2d0F7B8YhFFBJMILn4d7DssWx/9mHDiGPIjCRRj6tnnA3lpeEejts3l07Siclyd6ZAEQVOczLctiCqHYgwWJTM5B6XhdwqJ4FtRAdRdjjLaL1tAVcTLIgp6bZvgFAOPI/AtVsDfTy4HNze3I1bHW2H6N8hJl6eahe+Zf1maY/A7qd2uKGASY5F2ezRwSH0ViLl/O4JXzS6S6KPBqII5Hm0nSQmyg4n4LtTke/EtAPSKc194xG7T6YmVlNrHFXZDa/EUpzHPTfROB+aHkyNLdJbq0oq83iioTbs6DtieliUjO+cTZ4ZzR7uF4ohb9+NHeTtVZXqoaOKyg4Xxiu2EyPrQWt4flhoev2dLqodeGm7+k45UQS0zaXLgxyx8o/Fkr7X2kKoe1ExRS7LxLqLPlC4qBbK0hS5lO88XNGOaeG4TNnhF4CO/YA7FcYovL7ZlVCJJVdpVXBE+w+g2t1Qz+5YNRZhYR9Md4AYUara7u5wHFii/GCkvJNNZ1gWtEOepW23raZDYcdmyFvmbysraT/XLXK9lRXlxsYC9frqTHBaW3g3fGOSI2btM/9uR/FMlJbJUAnUwKW1HfA8uRSS2RZpGctKmsq2S+FYVpSEdmcdWOrsjv8/oTLDNDWjINt55OeCqNjBxaBcCukOXeupF89CevsUF8BIDtcImS5tV+JeupAwSeq+Esns+ZdahN027xTunoII+N3ULs4N6aJchCzWQQ4NwqQwLTCuQd7ZHXVMbS1A/dghySmHPMpqJIXPXjLUO/VmWyW1eqBChb672880b+UqeiY8MyO/5OhEF76uFh5TWbhzi7kxCuck6BqatG2tgNrZxfBx92jXF8PbXgpvc0931/ul3xuNtfObD9cfenfnO7Y8jxtCg3dEIiyzOeUmZMbu8F+Yc21CdyqwJNKGlNs0SbGImGHzE7SrGRPvUdKpdbS5x17QbVfzlvhQ9ADb05nu8TO7CdO+1V4dAcGcHB29iLuEsSZBsPTW8B9MqU7pkzyPnm/fDVRCUydsl3figHXiAHrBuvHW00zLWok+YKYuI5wu6IwNmPENewvEJ9CRd4uVwtn211nS6MvaJARt3+K2q+ESJQ0K3CeLu2zBHfJZ2MoYGGXLpbiOE+uNb28Bin3MSX1pB0HVaH6qsrBD2EECaKhWggdVETMUdfJM+7gdb23Xob5ODbqBjylaqR357TxHR1/iui3s3MFx/Anr0yWlTzN8y3jOnh2X9+xVumdXtnnA+P3WHWvotINlCx8ZzxfrR7dNGGIbxsGIiKgEKeQFhj+y3DWIEhj2J03R256iEostmLrSYQJfTTY6tLhldi0s8cB2AwswswNIR0RGIEejWRFMwfYQU/5MXYkpywGhkl/BKS3+rvWCLPK071+9evlqB2P8A/eoy8PK6hfDSzgsbwf5q541EJPxSiIldvTz49GnUyYkwRt8vj0GJ8CMKwaJUpVthABpmBiqYw2ywKnWXmBkOcqt2QHp018aTgcEZYM0ah2ccA/EY2/y6xaTVAXFiScaRWGHk5/nOZax5WUFP77REIFTSg0df0q1fEwtsy/ZDraTpmULU7k33NSUJPMt18C+dusYUznmnRGKE5tjPVpOri3blnZXho+eljRCMdhcq7lvtaPuCZ19lni88GazwAr5WYzVfiYD89i5+dOz6Va4UP1uOE4oqk8jvJDOrBNhjP+kyY/UaW1JpmCpKkXtuKIgmB3o3EqxVS9RrKrswESd8noI7YPNrLT4TXB0phFC1bYtpc2juRLC2Wi9NzfvB4klxfMVGSb9x/Se3CfD35KEsz1I2N/ydtFGO7rniMzXtmuZ2fzHGvGTl93vv/K+LOyuE13biZlnX8awZNatHTwLblPjgePQjtTZ+7A8fdl+f0dmBzFXP3lVYAf9jCakgp9eDUcjaP8+HuKpNshMD1PtMT6KOiyJo3IzdDGkXbDNHbndYIG90EF9qpPwwtAo3D2M41tchTu6XJEmNbnWv/LsnmqX9oxFTEtOIl39MXuv55vPHc1liqUwmYb1/UB7QAVrJi5Ae+UDZiYw8zc/7WCKpeklFD2j6dNuxSksFYhEkmwl5MYOKYhkJKLIgB6IZReSddTF55eVtrrhkN0VbKUMwShk6wscaSMTNLclFbjWU5GbS1Lw/dqOLlG88Yvhz6ciEY50Z4wRKiVjee3N4OLmbhDtVFtfX+7K00WkYxgwnyVVkmk7SvgMvMpeGhhqz/68g/VUK5whGubKgQWPOokwgC//IFazIh+AoAgFPqUoeLs3XWZWUzFCd2nBnIa9K4uwneH9ZYR3kX5u4pmbHdsBF7g6xH4Hz+FZIblPPNssY5G8J55rxrHkjS2g/OKCHzyDmWPKOyTd1h+Oqr9jvg+RJxPIxL9Zvhf5YwmVg7b0tjOQEOVfflm8sBvzKNn9AVOhSlll3e3iZ4mSRri0rgVfiR49C2eRYno+h2Gx3MIOrYnV5nPY0g76ji5QtARtB89rB2STM/VBMpkaNfLkqMq2sidl7ko4qyIvWCZsmbbUAha4rnIxfcu5+6pKeksckSzzy6qM/uCnx/7N9Xh4fX9zP9Kubq6H45u74fXbU+0nUlxwq0uhg2bZK466LzHJNJwrWQY03zLXU4p6sNzOUgmjhbA4CoFCDxvlWg+0p4XlYl8kUXvuwfOdaEN3GD3o5S6NRLc6tsdBPbcNWiItLra2KMQlgg+EPTEwjFb3V89223GzTVdSs1rqXWJp2NtspfLQI1UAuzyAJZNMJMUa2+bivFFyqZJub5VZSpR6X6tDNj9ni8K+llznsxHwDaKHle9Nrbr+ziW5JZ53ULdkm3tlQdPndoABujTfm6yDkOVhWfKguMSZtJltOaZ2iEbcpFMBIcYIqma2F6WZukkKIQ1CdLAJukvss26yTncTI+BULj/785/qt5mKSSuDA1ak+9YjbByOzgJwIB4bS7oy6K4CcJR8uhn4faGTYzut7Qah4aJth+Gjxotoms2wbbJJbtaO7vn2nEgZOpwcEyNwvekIWJB+xAfCaQeWM+tofzXg/3992OZ4gYC6Ogkk+sy3gL8SVREydNuUzGxYk638b7eP182T7MVYTI2zKfKUM4E5YCKEbj8tqD7g8svOJmd7xTQeDerO3w6OCrtzsldKjWtXKTeW0PL/1hAhtBk52yK8nBEw74NdrEBaK+qmolUZr6e6be5gktiE1BUl+B4jkywP+Gl9BmoNhNvd/VAL2bbjUUhibQZCBHS0Jg3w3VmdSCGZQqEBCiTOkYTsPblAEZYbohZzO5ahwFQy94TcVv0mLCeVno4UgGJUyexcLZ3aeo4BJWKes2bq0xYTU5mcDyd2FLLhZKi152vUVjfYd3PndxeUI0uNWZxAI6gF4lTfWGbMAu5KYBHxxnJiGmIjPtV+b5BQp+pgfM+xnmtEMuycYdVrj5yY7od1j1byQf1mNnNsSoSN/lDA0TD/rVXbn77ZEXTKkqB560B5Kbz0QKIDGbKuXQAJc7zyLtMc9qPuOhsR0FTVbziUbIR9QKOUWM3Fri+Skge58WoLMUXKwKKwqGgON0oov7WLZSb4mZkN3BeYFNhoFlPY1vdD8gCohW4C/lfSjUa92tpYPZp20xLK6u39GiJnL9FNmBY76BEt8VmjayrxuiteNs6MJpdkunpBzVeM+aiTTZ4Pev3x8H1vPDj/i3YnMAFcrkEGXFXZpQnRq20SnOzIv0GOOkLO9wcsVLqlbet1VjJ52LZi/maoqv0LC/u3m1n72jOmvA7YRcbVLE4HmcAqz6tfF0yHKQxPRCbcRgJTlSuvArFDuvo6ieOjHDS9+ypBNElYlqkUp7Q2R0fwolVbGbev9e7HNwej/t1gcD16dzOOscpdj5gsiRlfa+KZBLepsQpBsqIFQBfuAax2kLYWXtiIYzcXprj2HcOufP/dlgprx5saTnRr5cEJ0EMVNYzs4NHwbTLQY7eE6BrvWkFIYd5AGm/W8E4SbyKtN028uUMVG+vGVkJd09nrM2LUYhrk6R18C+/Std7tsBnoGCBejOC9SOswgNVpzK1Da7l2UDQ6PDqEReADoRwi6zmcesuua4WYWqE7//GlaxzObMcKDvmzw2A5PWRSfgy9u3LnrS+LMx6tj6/jBL66YnGzDmJySj65jREpSYCsDbQVS7SylViu7Hc7NXsNt3/Sa/Hxy4cL9mi342Awn2scWwl6iY1sFPWIyV+ciIA84qSC24hb24QRa7ogPmCoNgNDBywtCo+CyxaXyMTSnnw7DK2GHeIZvxN7pI7Atzra7OC2im0f3pY+x1xn5wVdJE44t9HQ0jS760OcTIEXOFHMyBEPHGYkuO5k3chlFznPtj1r3eEdhrTTIbq3g0luHahRTM8aqk4meDoPtNkOJtBewr5J8jlspLMuXsZsG/95W2Sy9Cke5j2Yer6pPVmThec9MJQQA1ivUETeEsEMqr4mnVHr0FjZh/xZcHj88vX3379+/ePrkx9ff/f96x9+OPnh8P3jw2p1/vrp+P3gQ+/Revm3YPr464l549+OF5cvw58na1efuoPjm5OHpx//6+TX89nlTyN/ZJrOT+7J9dXrO+/WaihPiDLB8zN6TEGHD6B8sCY/2eGF5y/f8Dc/XPW+++XD54ex/7f10fzDlu1t21uTerr1oAHMtzTilvZtjINvtdbf/b+7u4KOKmq0yscr2igZJxqzHeDi+DfNhS3obG/KvtrDlnfZ+mV08MPDy5put2Zrx8HgijFbPd1lk38EdOJq3vs3WtTsgUoI33uOfo03K+uUcb9DaGPH8xlz1R11G/uWnbCDgx30ebvaC9gwLB/dbH/ffjNKzE7rVGuxUCyGHx5KpCMwcMYkCvFzB5HIovYvLXceLqAH/193z7bcNrLcr+BI5RKVpbi62N5d1VGlKIqSmMOLQlL22bhcKIgcUliTABcAdbFrX/MByUNe8hP5hXzK+ZJ0zwUYgAOABIaSN6haL4VLT89MT0/fphvtbECbFZyIsiH7BXyv8lXSQeI66Dm9D4LFzL6rXQ+HNwPorcNODlT2xmyzxcjKsjZZbAoEid+XxA8qeze9AZ7zkLbbKiXrqiCd0tmNgcE4PpYgoQ1PSSBuva4gAzK4QKTmB1awhEVyhpl6UXdXPnm7TYF8gAd7YjtLJGKVnXFN+S5Scb+l8p4xoSWzQZMYc2WikhjGajSuWEbTdV434zilx9HMfU1KTMl+DyK2xuMaSUJLZIFn7b3oMQ1uOjisvfOp3SChm+kwIWzg2lAZGmLHed7pOs6jyYOFrgQdXiyZLoRBOEEa0NK2I2ZG92S8nMVM0cI6ps0BswE1ZLhp1I4umSg27fxZqWtjj2G/ieV6ed6zRq/dbg1avS4oMUzBSZZSM6bEnaNH9i/fc7+KmfW4Ka9EuggOgZ1o3/xz6bzMFMS6uevU2P9YTt8VBNntzdvZ/AtRM065aDDeDw/L0peKbJxbLh63a1yRQApvoDW5SxaUiIXoxsdFflTQYYYI0tLe9MdXaOAQmQv8UzyKLRlTHIZ3xWOKyYM51VN+urxtnWWDisUix9ArK6TxcZbCCAEyjMHTHh1rLdC/rkD/Who6kwDKDm7hAxxFV+EFmWD4bSwfcYUlJUsszoJjIyVaPj6pHVJRwp3ZY9EkrVl1fPLCbnUWvzXDNALxEloVUC2fUL1cOnYAlAGMDkaAlb0pMwz8+DxGmWJ8brya1Z37ZAT3Fj1C76PoiOcIaRa9UmN+b80mPp4uTeZzOTrkrOsdLRFRY/VmsOdHtO+AT6mG2aCtNBuy0ChzMl+PL6zViIq5qnmooKt3bj0bY3sygU6AvEXreZYj/6iNMlEk5bi3ApUoA8y5+0RjuMYgW5dUaWUaKGlOTBBySWiU+TQiqRmAL4zKI1YxxmznC89dEG/2zHIyltgKioYx6ItYevl9BLNhjeJDS8+lSYUx/Fg4q+UYj9bsC/LVomG0EuxoP8+suQHsjrK6ISvcxPAsLL4lF1SpIwmKAfxxbvlfePxSGHxSPFIJLy0ngcM4oUT/VxLF0V5oyVqVbKqmaKgSTXRpS2xuL6+22rWrl+3PFueJMdkzaa3qs8K+mrCN18uuJOQEL7GQsJ0XXUedbXas86K92d4c0X3g/9kaKipoYC1qzLKZqEDuP/sBmbPoJpZ3h6Z5xmRKBRG0aKXlUrnf9MoItLDdeGxaCxtj9EuK6bRoONOAGHZjPJapAaZWYAxBHaB6d7+BFqoDkqQqlQgaKcso9KRGySorz2lNV9LRMH9MWjsrPFVTUmOxkFniJx0QS1aKw2sLGWCKJBsRF1arYdzyFMfL8O051m5Cg8iDbRnhbIVnpvHwyWiG+VgxPDnUTgrzSQoFJ+q10xylLgfKj2BAtGzxCeg1DltDTVC8dJpgEjA1mWLEpUOkEZcGdqGHVfzpZaxBgOmFPDIhHsH0dj6WYKcmG4/QlMZ2YOAJMY+uXELGRY/Rr7roFEbK5K2XHAvoX1muFD8nK5z5n7kRehx3P1BvCM17HHdE7GOYhzCblyD0NGRYqlhDhFoAWlSSjpbn2ZsxolBamdJ5VkvCnyd3bbjLGUu3IHoihjfctGi/KOMtEq9XAv0c1LtCp6FxVmK7LXzmjPOgOmxl9t0yIPTcO7qWrCL45w67WK3oPIkJBCJEySqS7CWt2aH3TG2iM5hgx8JcGqfCmTMn/n2kFhaZ4uJSBCinMkbcyxSxMmbJXdn0ccbJ70vMVAobdkE+Vf7AdMk4Gby2G5FCkdxuVApeoXvQElIwY82UslAH11C6JuEULw6oTDf5OWmsqqmkSeg9rOESWX9eRJqOOYFoMXXs27mHoc7M+Ax95MmyPFa2zi9fL5xPII7U2RaF+ZUyLJHn/HC/ih1lMr7ulo4OpfAAbIhW4+aif/nGdEn9pStz8yWA3l/J4+Y6/DgskeQGl9qPvjObTUSGW/S94RU1tF3PG14qO3vYQ31+t9Vuafa6Zfdla/Oj0+MmrvVITpsDJNGjbbqo8MokOG0OqtVO6XVPZfdkW3Oj0TVFO7Ats2gZCJtYKQqHzolLn7Vaz26DEq85cajHaQ8j3+1gr7q3XMBoEPjhERodR39NPBCRtRFZlvQICOmshZbqmsB2ygY0f88knWeUogGRkpoNSlBw7473yxx11HDMMd+UItQYhm+51D3Ks13H27EC1VfGOjqvyY56bXqmTVduxUzEWX6aqBJZiG2RgyelKyutU1FpM6ixMmxRSakDo987vx0MDXrC/oBPGF87YUG5zZoazaz5gqXWpCHU3/ZGTrB3ahxuePCdl1M1xdFoBISZKMkYgNGYBpAKgMHSTJHSLZqn9sECpUe6yQV9J7y3ITKbvU3TSmGCUZa4YEZMobhXJN4MUg2owV8L5tJGzU+AF3YB+L8zZeUUJrYjJrJQBu2YMa1axmT0/Z4/2zXaNiDgThTjB7O3OUAOxuRgzoxPxXhs5R2aL95xywU942LBVJ8a//s/cJONaMmk1mghOaTWEWxkF9hrgIn6xmwICsI8QZAnIdqDe5xYCtCooBhGD+UQG2vXF9x/mWHnmGGN9mr/eY4nR+3RqTFHnx/WLd4c9OeXIDccgeWCEUeVIsp+o2Qap5yCW3M5eVmg4NPKAsmjL8isjB8k/IseeZGbwhQByoYOpOEp11TxL+9tmA7iw7oTFlJqG8XboEBBF0qaR2PjXTIaQRrQskdMSn6fYOM1ybotp5rPOuOwTyVsZgr//4lNrdVttG8vmuZlqz1s9kvE4L3GwsCRi9YG9WOFf346LFtgmZshFq7t4MKTQB8V4NLyxYvqhcU9pIZgysMSTtUSlovSZ2iLKcYFJBU2FtjhapEA4QLyMNMLWOEmM3C5PF4o0WpMxfhE9YvPmB/t6CWd5S9SKcYfOabtOCvpAPQ6pUsFPcI4gGCDv0JkS6WLfun0whrCBl5KxcGrcHgs1oM3bFgwFsvCCOo9NcwIRZsVYy9FCnGV/VOor5fZE1JhljYxlzcvi9oY0alQHU7WV6qdhJeAqLt8ktQ1AVFXxdAEeYQGofL0IV+2z0xKEssXHYGJYNYmvpFqCvpfpfvQrIVdEwhp8ofJttGb618HrcZArr3EyJpX7zw1aMs876ZARFO39UCJaijQ9ek6PDyU2xKxruqsgH1Hdemr8ItXaKeEKRYEVhPol3XkyFeSvCIDKVJX+JdGF1UeifFOCst7iIKmTqvcCO7UJJ4uToRXSicth6bAx9Jb0VyGHaVIfGfL56I1qJ+3MYVb/UNr+KsREBRhLM+ePRsgddsz4SSwfVbO63tcTMmNlDyYPhCV9YAFe3W6X/GC/VKGXxFJaQY0NIveQ4b0b81+T2/Dapq74k3yibwwKhgjBggAVrEJZF6ezQuW5l1JBsPHwBzbPvoxdQhwySsWPCJtz9ua8pBBi/k9K55MLe3KY5vTxDz/yadRxaWxSWzvZXh1eACD91CMsGDXMjbfGdPmysjS8zDJs6CM71fYUfDnacSfqcqDeybOQoWx1/Cx7qUcreBEQzplLrzoiXrWls2OnqJ1SHNv8MreFkBkX2Jhnkcg69rxBAl7MnOtoCLGd4tSF11Betdy+XiibeQuD0f9Y73fbXWvTlc1qm5vaFzSLLm2o1K5S8UpaSxKmt0/djaL6lr0gBDdK8qE0OBV1NBF07JyHlguHWvJEpDMJrbK4bTkQcWrbMkrngl1oS//qbADukVd2OIq07XSTpiXt0GnZIstOBMp2WELQuNriZ71ikN9LgG16OpWhT0lA54KBjaGJ5Mm3ACTGsLF3Ry1eDBXOFDFIxYKW98ZylY4BKYu8WJXnKxmLWAuDT4QG+Zql68A09ZyihLo/mA0ruv9emPY7JuDIfrfr5utq+shPDisHZdiSUp34dmZcaRzM2RBlZ+Nf/z3f/IdXToKLw2broPwZaa0Tw6IIys3KAmyBL7cKsAsvaVGPa45oqOysqo9Cpv595ZLaHv2oqSd6JefQ0tRYGEFq7GYlG2a9oUe0G8eNLvcQJQwCJWKkZevtUwIJZKUyVfMBJTiJ1v1pcVl7i1YjBStSEYjSgIv48iZrsz7n22W0zVKR5NSmWcY8pLcM2YaYmi8TnKRXTw5MpX36wN6Ol4kEiwDWTpsH60lP9S0ki42zDtTLqcWXiyQhiaSF7kG3msRO+bWUyUGvJopfpRTiV5Y/vgvyapwYNzSnB2CAlhSfi6XIM3GBuGls9hTeyVKr4AdYsnKNnACrtwRo3511W8OBq0PTcO6c5cBG8ri4eOY4ASb8Ofoi7tbYoL8U8SAPBDH8Gf29D4Q+dOrrLHCInmkN/01pLxyWT1CLg6iPcwqtbUcGAGZERpeROd3uTBanU7zolUfNtu/vmZwjEMeTWZhWAnwFsNRLrQbL9xYsXYWzh/Il00Tet286fWx1iRHoGQLWesXA9+UD98Yx4f4xqHu7ajRrnduPoMAL6w1eLCOaxn/+Pf/kBZ2RVJHxXiXseqmVRAsWzFG1T12JE8QNpC5XEIweCWliW+AX4nn0tMJjyiqPwCnGKFAdQASpTMGmQD17dI+F62JIF86iGzLAWQUvNwTEYRFgFRG1uwDnxJtwrtepxfWJzqjnaglMdbXiLS3hhRKK/dQJw8dPYdM6Sldre487Jxkd6IN2bBVgVDojEgFHleNCo23p4jsM5LEr/6qhVfKl3KI0UWv1bOFJarD1HSBTkferrGC/BzlEzq6d1J2LzqULxTDhEEkIUVVws6HwUyBrvBH1XbzoHN4y7kM1bshjMyrpUotrTrGxEu0BLou8FiCJLcd7SdDenqnRXpSiRa9v4XyEvSRCUZbkZkKK0WuAxLPkoSqjvGh2f/VmNBK6g5qJweorYAwclg7PPbxrLBx/XWfBrtawegelCleOqAgIW1SwlZ5pCdW0vjwWEdN482/UC/QuWUXTV8SJybsuPFmDHyx3xq2GvW2yH/BK5Kr6LrKEShKUeXzSiT6oS23RKhxGkL9AiK9cKkd4tGyg7/EmYtQ97u9jxs6kUqV4C16wocd9NJWi1UZ9VQ6JkCvLx/dN6V8+Hod2njpdWrjpde4aM/nZGxbAaGw4rC35tsM20wxtEhIlbO1ZNlZYljoSu3d7DT7V81u49fPEncJTV2w2fFNHH4tPIqVYCv0UErUbx3ZhkyAVzbjkNwhgV3UoUSOJGxwQ8Q3e1tGbYAJCJAfj5jo4S79MOk4bmO1Wm1TJ9Gu0V867Osc8aW02PI9iSsFZPBdo42swuA1tJl/yRo/G88EtGSPwI5nVO6WgTGGzSHAcrNzGEHbwXxVPglR33B+gL/jvpwmlauevTGOCgvlMrX1aZd23wCxx6qHJ3qOKFDHBSoJNDeX6yAhAh4K7Dbs/gY0QxsDJKT8nRbwQXdBHHNpx2inMOlsSDZyCdhw1DitrA/lBUlAnv6P0rwmSqDB9CJdGCxH1tkb2OPDACv4iwbOFMi5ouhJgTweDFfJtlUtoJSslfmdPk8kcpQb3qzZTZSN7SyLoyLLokzsskxuzJNgO0YOxpsGKxfTxdbRvbK+z366a+DiMtDuOvFg+gxrggoXI7oZppOPJf9HW15e7eDvhCLSnxahEzV9jAnuQ2OTbUq2Ywfr0sRmtFCUBtR3adQYNM6xNxBvTP/ukKeAUYH6uw0mdnVgik2mPOxneBmD0T0ZLzEFhUCftkE7YVsz+yvd9Q36cpoEunp3E5KQcbpk2TBoaU6Gl4ROHi2sRwObzn38r13jhkrKd25wb9SpFEv3itC2MgBtYkSVo3vrgRg0sZjpkMc7m5i/gy40XdrjBD1ImUtAOodhJ37tHATLxsyGv3kjvHPJ+3FIyac1dfOYS20NvBJ92hxY0oiV+Ju9kLglv48pi6zFYvYMs/Vozsnc9Z7R+YzCS8Uns4nKUMMH6tH1Zgo7E3/qYZ5Fhd2Ix5TFTU22L9o3cXEpgE74hykUvvBsVNiH9wS69GCPCIoeNBEj6xNoXwsLvTlVgxbiAHXk8aBD5kYHmqvRS7X0WApKlupmGdgzv+ZPnoCHiE4OJk+dqVc1zpezGQnYX+tAwU7OJDiIxUz57eodedwAG2RpMJqs7co+lhrhdkf+MBsCxYTDEFjEoGTgJsO5oyNgRgjJQxIDmD1Wit7V2MxT2AvXRb8yCons7pq9EzDYjTWg5BEcJqNaeATlDeBpmFQUQ0CDBF0r3kBCzwdpzR6tZ/PZnNtOCkjpDTXIDHWrOPIOcvGZbvzToPoj/JryGZoBDFil/UDSk4DRqlNpng94QitUCATGz441h/3f8qZ+JWVEqmmdUjeewdKy+VbXxXPYI8sbm+gNJ0+mH4C+O/eZAumClDvyLP8etq00CSHl+8xgZESZViKjo7uYWQHu0rBaQWrhD27a9eFlr98xW70BO3gT7+McRKacPurBju0nJuPuMRQvmh9ajabZaQ7rbY0oZKyfTUFBT9SfpMBnFM9ZVuwLrC0Vsa0UUsj4/Kjc58drfJ7HOfFiIR1mQEb3OGzt3keYvo7Z6V00zUFzOGx1rwb0KI1MbXQpchqtGt/+2GeHbTisGKIUsgnrm/h7VSNT4cQFFr6NKpKMW46KxVcvrczGglQYFgbDgh52BjkD1gfVGcK2Tt/4XOagsSS88Rz9i00LLbbOMEx2tSJD2nxHiyUVwbXGi7/FW7OnwKxxdJ6CpUcy/XhctmFi94jKzDWWnzYLpI+KDLuVN2kgDligI8Aos/drHBLo5XnhmqyHitGMI1MRjSTm5oqS5YXto1V3QFBarqWJ0UDfaY9W5XdJUXlgxrEFCP5+7Qb+PYe5ARLjwxrdSYWQSNJIRU/x+R39lN1LBQAf+s9+jb1bG9zbZDY+n7nu+LYVSsDyzUKYLFAFul8GHBmc/kUaWkKIthlaPllYDsbicSm62bium/VWx7xtme1Ba5iLjx3A0uRf429VxkplN6R0l91m7+/mbbc1NAeNeru57hiwlZDIlSlgqv2oq4c3PrYuhtdV3vH4q/I9+tq6s0xkKvPpXyY8x9HJppYYweLejDyvdtW5ICPXswI31HbIExnhfN89K7S9XXnIuM71BV2csIgIkIozInH6AZaBigd9hyr3z6Y9BnEBGl1RQOVeSwxJLstKUcqjgxgCzHydQ7Ji46otiIf/N/3xl6gHtCITMB1gQHxh2s7ErYpVekemtpM3fyiiIrsJ2a41fvRw0NLHILSFMGchzNgd8fwaQGgs/cCd9103Wh7yTS0Q8XcLurlqkYDlsEA+Dl1INULANC1haOgOcIa5iFdIeS/zo+OUr2qMqSJi2QBOVgDMYf+1UG/AXSH9Y/paysdLO/07RkkrHwqemvUlHnle+Q5uZiBpLVZRtBaKD3CCaiauesCB7r3qiiAKnxYm1AIpYzCyZuQGC9XftvaqEgZUdFN4sdJBdcljA/p1Y0+J60SwsK+bA7vEoNAB/iPjhXO/MSw2SKjHPBJrAdN1Z3lMaNsvB3iPkev5cjIpjeReRPod4vvWlHyAvQkkxiTk481BXy8QbHkUL7zlVFdH+zi1Q3ehoXsMYJtMgnM3AD6nAWQHGQIaiKcr418AGO5nxONyWllobGEEiQVbDFbL+Q0EbT3EEcE6uSgPjUastEDuuSD+KAnupMgcjEkXlrwu8h2MPEKcjuV90QWRVuPG7B1KgIq6FAmbVyg/rViKwifUZoQSVvC8IJWEwFW7qneazApwdduuX5mD2/6H1od6O03NXN17UA0D3a5S4R27Ws6sacTXlB1TKN4Zxp/8NjdvDsYRv127RawCkVJ0KyV0RFSIY1zFdQLPnXUsW9ojqQCSRjnrQr5ckllsE9cBdHXv0AI2uWdqAdpwR18WdqATbpcEj673pW3FNj4m9pVF96PlOaA0qNFVL3jZcoCr2benDvP22qMKC+tBG2HCTnxyfGenGWVS6LsiMOXsjraTuqrUyCowWYyyjNU61poQa5feg/2QzgdUGMNw0q+g58pSKFp4q+CqAzUnkpFIGSXyFHhWeuG/7HHpu9MlubInKHr1N5Gu80FfuEsQV3FLBElntPa+mA94gCG0KdKwHqjrSyz5cKl8dm6tLSjnQ2RLkMLtEPdRJdymlK1SbJfMwVahRJTvSFuT8K0RErrtmMzInVpwKR2fT5XVzjZ42ICyw3pwR6UwWrX7aM5OX7oXzfrwelC8az3n2nXV6+I1utPvXd0207oTMhmB/AUBXNfjHq9MjGtx4Ub9Q7N71Uwj1JXuZ67q76bDGT2++dCsZhADPDabF63h/nc2IlI4206va970m2a7V78wGtfNxt92FB/sqs/vYRgctWmmO4rn/vQInu4gksapsWP8gK5EZgPNRAw/VLwBt48FPBZmnYDKbqr6EAeuinaE2ydx4LDcVeCV/tdEAyeKV/yRgwdJMfxNgpUNaqd+QUt+4wzB/82P/frNTbNvDHvGoNHsNlXzJUMXZnST287pIbfQkl5rs6cf2Z+xPtZMEDbtybMpICxtZZ/MWaJDySZzOtjqtobGZb/XMS5ajaHoqME7quwftFnD8E4TLfXm2B4FlW/otZZQ3TsVw83MlMypgQu9knyTVY7cX/dkwJ741J5bU+JDQ5VoJdDjEcpm9yvJD6vGp8/7yJ+OWK3ST5/XRgE4FPcJZHQzekmk61wbPh6xWlAwWQ1Ib4VFONdsYG4tTFrpPRU4fwPPiv6Rt0YoCfV7vU6re9kzOs3hde/COFaRzmgJSxl9NmdxB5BqGcIqfov8IPwm4gXiVj4feJuBRA3/oZ4xaEZ4j1IweSdjIn24ilP0MB+7d3kj23OMGxYtZjRw02x2L5Q7BLw8tv3Kzu0C3yVjo+1Oa8FTsKMM3dhdN9h7F//J3K/EAX4lVvhPFmZ5zak2EsrpMM4icM0Eo1NNnSxhwP6MoZujmQsMaGlX9hLh0retLnlUxcPtDvu/msPr1sC86Q2AECoHR0fvQWj/+eioahz9fPj2fcY8slgja27O2JE9+UTwTnQieKcqN5IHL/vwQSw+kjXKHG9R01UD4xTP4hgYlcPq0eHhPyVCEKqHoOVFhxfCowsHaWcXdqNgkprke2UV0sRfq8Eq3FWb6aal04/hDXi4kQi5SzXz9E3+2mg0h/3KtNyVN+OYRlgKDOV3FdHvivB3F1VGnBHkA7Qf9JAh/BPyBVUMvG8+EvIFzXALEtjsBEf0CQtNU7yUUT5RXrcxpBgroUcAVKtQcDtAWmJvnjKDXD47C6EpWGYWp8yHrNQ1EOn0pFj8hbMzgykLuGeZzS4GwHR7Q7P599ZgmBHppVyB/r37COtuUcEdFOO8MA7FHleOfjk5OeJlsVNC8Wja5TSEbj5egLTZ615pROj4XQmEWl3zEmOBskL0JipCXu9g2bqdOH53mN0J1pHcs8Ebj93bEmNHf17etrMCil9k8N7+8iqDd5IzZ/mDh6IlLFJz0KwPB+Zlrw/7Vr2jb228LbU26M9280OzDTg2u1e926trXbi9P/z56H1p5Bq9zk1z2Bq2QISDYWx2btv1IUhu2pD85fi4DLtjK6TXP29daMXpRA9OdPwyEJu43p0NQqm/umvzR9KahtdykvDQ2iQhxDPjIC/p9WYDc/L28KccdsYGJ5cRzMgkoFIn9DvC+MAI0J9Xwwd5yZQ2x/xd1fi2h6BBf2XtsAMd1pgeMcAn5r279PBgjR0sMfvtqBIiCupsSYq4qHfXWuWFGPrMntsBjIZC/AsfAfGoNI7Co4r7ws/7/EhtBRo4S7yAf8JtGmGGf4eY7O+XHcx/6YFcMWx1QKlsdVoapa/jdznsKFM1RHPAbSvtcNQan6aoknilFcrKGqrmv5qD20Yj+0D2+rLM+/ShyZyyRh+236YuLH4qiEW7NxgyVFI3sM132J/TkaGqZLQYE6bPNbSYdEJpUAVVTWlrf5xCa7nft20/3eghf03wW4eQsUmHkPYYIFJLAjy0gySTjxn3anHt8yyuIgutWnGyfM3z6MkX1vjQ2DU8yx5jylZnzG1UxmTpjJBD+7SuE+jytkPGNN+puzDcSZRgAR0TcxLcuysmAjQAdMj8YjlfPFfG7ijjuLuryNiFLeDpLtCX+0sHI2kQ2hih7WSqyPxDxTSm536c2DN2tgldRJ9S3Ft4Mmpse8wLBj/oGbgq/Zb+RH+s69cerdmXtP7KoMR3+FkII2dHnCxnMxGXD03hr9pvru1UQrwEpJw9MeqwiLALQad8KVAW6LKv8/conBJ8X8XYNsizMffxtFdlhyaL/sup8e2PnXCXztnVuN1kxfyLBOr/vrQ8dUSDOC9kIvZVAxNG+s8+zryCWinh7Aybg6Hx7pQWEL17DsgIjUsuelUa5iWOnVhWxsfW8Lp3O6RFtweDZue8/Ws2VQcqH2Q6QQfomwRMa+ccjQrrx76xO3aJj4ngMPAtd9wClXcyszxmcBKNhIEZUfxTRAT/E60qeppsVuWzDN6GkN+fGrc+MUyaDdc0aybdfkwTKcgykIr/OWc4Vc6Q9OHktCDaS+l5ZmrZYI6nPlYwzvggN1Ot3J/5Ikt5WaeeqWwjZYNsXPKckiORut0Zq6ykazWRD94ajYjvG2JkVC1ltpLfQmIa1R6h4H1IZj8JMuPU5Tr8YHwOcak0klziYpCLkxY/sv8nIKyfVIQljbJITqCP1lZa1E5rKy3k0lokQrG9badPaGCo0ZhZgFrL+Y0WUUyQWkLQCQEk3U74EDY3WXwa0L3OCIjPc7XS9DwJ+LuJBgBGErTYM+UOcdyB+my/FeKFDiTUI/BN3G1R1yDOFGRJzCng0/TSfICZIihnpUi+qADiP6wBAF6KA4nA+CPPXgQruMQXCH+KMVUT6A/bR7mZxad/VPbwmf8jf7P2m0+dUXuyKpGAgq/Q4BS/Ij+RPuD9kZ/ypAxRf7CRQ9HKCr1yCPBGvNeY7EGARdeT6DabefiMTqVN6Y/V4uMN8AlhabQV8yO9BEjGX6NTxV4Ro85fSE4Ce4kHmCuQOV2lOlkbkfu/8m1Ij9L4VPa+Hf5R+3YE/x3/sRcJlbx7ValL1RD3BCEF1vRPQj2AKQLHEJlcwqEvJVYM8QDmyoqJycrsVqjeiKOuP/JT+j+OUI/+MQ6JH35dPJvSd+HPH4y92kIc+3We/NSX4NleDKO55fn3Iv9RfGY+NPuDVq8br+eDqMGdeJZUoEU+b1ginE2ahCmdq8Q+weFI0638Kv4RHt6v0ACtdJ68M6DjJmbWmJAAcw0iI5e+oiajFZzlkdsA6ZXPVuwb7KQ96KCw0JQgxcNad/GlRd8nXs1zA9erjcnIe14Eqn7zj7/O7Dt8zZ0vYM34GW+GzZiY0N3zaeoRTLeX/gknEL6aFO+pJkXhDOBr5nBlFXEyk5dausYbQZFZVHwJOosvOTsW553y/IfMpnvzN5OjZF622k2zW+80VcTAUTk4yuw2jK+MUAqHS29U2SZm/kkADoWNNGaFeP4fUEsDBBQAAAAIAABgUF0J7qzv3xEAAOVAAAAIAAAAYmF0Y2gucHm1G2tv5Lbxe4D8B1YHA9pmLfuuRR9O9oD0coe2KJJDkqIIHEOQV1xbtVZSRelsN81/78xwKA712N0LkE3gW4nkcN6cB/fFby56017cFtWFrj6o5rm7r6vfffpJsW/qtlNZe9dkrdHDi21dlnrbFXVlhnf7vuyKpq232piiult6n2zrqrJrhym1h2Lu+64o/eOzH+r0vtkVpceiK/bwMDzmets+N934Od1m23u/SFfhrOZ5m/LMuhVv90DwfeYxaWsYT7f1vsn8YrNtC9ihqHL9NH7Z6rxogVD/vsvudAp/O4NYp1+9ffPtD++//+ZbtVFf1xWgmL758s1f3w6P+F+udwrgF136WLcPuo3/Xd9eAah2reqGBLBS569pwdWnnyj43JX1bVYqD36tLFw7HGwbEJ+8/+HN24of4pWdXuzcPsmd7uKI0I9WvBd+BFmJrrLbUsddm211utf7un3eTJfzSLRW77LS6JXfCohTm42KGKdIZVUe7k/CTIGzAQ4D4wKZJ1/Zpzf4EDOYawHihneWsk0q/UjP8UiOSWqnPejneLVKeKf4NvrxMvoYCmAENgI9BhJoal/hi+dS/yESJHXts3giIlOrSGkaizXJPisqhwB+9NNWN516S//AtiMoTWaMfaPLOXzrVsXuJen1IRKilZTCC9Xda7W9B4TUMMUoeALtVGVd3Z2XxQedw5SizFWjW2WV+nNUIrCQolNV/ahMDd9gHVFrVP1Bt2XW+H0Y1yT1rEyNbmFavEoIEmqvsx6nEnXfNX1nYpDx/YwFdX1TOhOaKH2/2xVPDgKIDZiEYIi0mYk4ZkC944A9re76trILP1NRAsYHc4ZHxlPnMBDZVbeZ0aDUtUlwVmKasuj0U0ckrK4vb1h7LVya7OGKx0i4km2ZmXtwwwE7TMgKoztG+4VzZlnyktRgeHwFoutBiLc1oP/YAl5+DBC4gD8g1X6LPMJ91IPWDepH0apdX5aqytB5kwMhpoFabHBn53geQUe0+r7ttWBh/Vjp1sBEcQAB43YZnDF5se1iACBMYSfkRHSObAHHLR+UVdmJoqwVgWXurJUU8MYhHkg5RPXaya6q2/0WRBJb6KubJMtzK0i/1gmHOUGoI453bd03pGwENPmQlb028QoVtdRVTOMr9Vq9DEjm1+cDh/1OsLCqu2HDEf6sUdNlg6j+txnWCuUS9ojijQOl6toF6zrRITJScjTQ/4gczzl4lfMdzMENosleMJoOoytwgWAkdmEU0mE1odKnuAs8RUGsYMvP+K84hkJVcuvtqoFstPB577om/ef5dM7CXHt+Me3hKQHU8klYGJKvCAuGOWiO6T3IbnJc4ssUI6yxXtJO2d1kgZA3DMfL8i92glxiOmI22gEOVtjBEpDAQwq6HHt014jCaMljAZouAxD6zlFCNGeW90XnN2m1gRNdx7DZeiLFk3CGSQBxZh+nlCDDKBoFS4p0vGoexABRUjdgzFZXovYW9DMzajcCnmddhv5hFJwQPGBCq7N9vFvN7IjHgn9NkZ8F5SNCdwalt88d+BccXwXaNawC/ZrRLec3cMs10shBtNplwMRcbJ/rkigZMWBGlHS2ABfRz7ntJw4XUwNyykjomUnO8qTbN5E6U/Eg1prMqynyeDWnRcT7AQ5g/7ggAPzsEkLLIxROga1a3ZQQBEuIjMlq4oUHNRub6gnmjB/WZqHLI6sRym3qvt3qzYyBH9NY75ZEkHqI74fYPo1ul+QvveFBHWCO/ZKjZQSCZWJjzLavUr/Kq9NAOkWDuMQd9fqpMODz/YSFnQTTvcW4jdKJybgPuqIFiJ5c76otBcIz02kXL6PkKFye4XX6wBzIzQHKZl4cKQ9HqwMg5Fm9WT7FXRa5AGl1TMzMl9OFJHi5KCT8DAIwGeTvxX91SkWUVLdt3Ur9OM15jHzHrqiyshxbERrAR6gh7bWHBGsWm1P8z8f4HucSpj5onLOi34V30+iPZQDnXAzjLn0PPdcQxnGp59QwDjMmilvWsHe3mHeNo7HAKU7iMViWlPUjpqbkgDAdG2fkVG17BcAY4QSCsCpP+X0cqr59iaS6r+PjjFWbh5djE6fPbn9ctKv7aqzPL5SGcIpTdcrjDCX0bp2LkWwKrjLM8SkPAf1U9Y5yeYwqzYmx2+DuHf+BcAPmY9lPZ3JR7eoZwkRQ41jpHE7z/CpmhD3g7Nbgvwx45jiBba4jCoZQc6MbABycQaLqMvXKJ4d0I9R3YJNZHh+P4VjQjlSn7l3NQTyDXHvNHvuA0wK2X8c6qbh0qm3m9dZgyc7nSteRexfdjExSxtYjg/wFyQ9wWZZ5cWIKW8due+nxFvg7jql+/WB/kKTYVVddW2jj4Vl6tnUOZ5Idi4e6NzitLOcUIGTGUiVwhPrBuJEkgyeOFamr7Cf7hxy/x02rd8XTJmqzYsuKEo3z0UkEiR/UeY5HnZH/uy44sCdhRZZ4qpLNmDycUaeun1suJMuYHMkk8OOyicOJ2Jx/2h2J8jwSTNf65MBsKWqVFDoCW9Bv8D51XlR3m6jvdn/CFxTmgAxtMHOYBfhhHYTApdNVHgdKakOGQU2dixwzZT4owo/tKyXtHoxGC3EWdxVELhyTbUS5hRY5HbaFcDEgcSPhLbqEtaPr1wp10r9/85fvAMmfhhr+VVDBgpl8MuCAiInWjq4r4Yx/Fh7anvgpNhhi7Nqt1dHm07hVNS56gZZixQFRvobhmwO13qmBd5l5oNpvVYH8tx/kEenY+s27tyjKWT8cuDECdqiMIU8NYA5X6je0cKQiLoDR3ewJ0rT1ztb5bF/PvV+KgLq6A8e9EP/MhPj2PZWoLsdmOymAWlxma2MxqxwZw2ot8JZI8ts8BllapoyFPMhkPlOVuwBsADNbH8UPidqgN4hZCHLxOsArb1FPPdor7gFhndqo9F+kky6cQPW2uprGRpe7tdp2T3P6LRudMC+xdkANrBS/oz52T8n7otFBxIZzuentptinuMtakMRGWtcaO+xmE3uwhIrHYg2RAORp1cRBiW1852vg3gAu2Za1mSLIBhVqJY3k4F7LovI66/kG3ASnyVxDCMOZMnYG431GljPaB4EkQGPd1VWxhXTpMweXzJW/DoXYGblYTcFdVhJhyE0bQncOv6mXGYEbFX3Zz3zz3Zyb8b3ViXAoing5FsBDUZZxgCy9WUIWQ1EJtDApZVvxJPiSszrd7uFc7AL5H0fwl23mKDq8z5gPoY66AwhDmtus296LSw/crrTGY67AN2Omfjno4JXaQeTK79h8NiRDxprfYfwvOntYw/vpZ9/Gd9A8ni8g8+uowS2qbLbXfYcJb9+oWw1Zr6Y5nCxD6gvk4TGDfJGdNOeU4czg/uVcFDaQpX6rLpM/M37EA0xFwfvb/u0QHRgAhEPXSPINrCo5yTCeNioOjLqhHFcwgGHq7G0GqnUeao9L8/e93aOt51D1eOHYwloQeBxdFzfqLHetZchXgO1Z5Xq5mOl+Tk1p7KV+QbNeU1fafZe9dipVgMz2WLZGdvm27qgw5xLPoMuPNYGwUcq6Ce/32VP8cq3A+mL3EjvOJtk2PfjlHkih6vHLtZCT2xbODAQxuj0FDEePTuUopw7gpmzTOOyK/6fXsa76vW7R9hk4L6nrErXkxmXX5IEvpSOCULow93PHrpRvVVdlvc1KAiHVifTomlYjh+z2/DwC55cRHp9t1Msgvup65GVUP0ROe21cbpu377782z9UfGZWKD4akIHXoC3XZ/nFWQ5aAz7jzMD/1KTIKQz2vHfHLsdXWDehRqbEfrVmpFaB495pCImslFehy2b5jKtDNDXh05TnJE3dlHrXYRjjDtXDNSYLZfYgF+MHjnNXa56izmvHHn0HwsU4mCOq2AVOc4aMenaNfxLindsENYLACKjIPno3cDU8mtFKU7zV0GbVnUPXjM8i9runYecwTLIG+e+wG6WUQq6CN3MZC35ue4Nd7GtGBLF2Z0FlzQ40QkpNlNZvJqE7jiDEmSj6FjLghxHxGcSzOwqqp5rgVMB47LxahGgSDR7NYdZBVAf4M7gKxNAlXiaX1ikOa/CSyjj+m7Qns/x5xiH666QJbhM72ig4n9IFzsdhMxb0ZO58g1HCR3agSiJuC5UNdNZF1evp6HwFi3aZy3Ug463b3Mi0TKAySYjdhwPW2GXGaxe7LhZ4LNDFuDDgmT0khD5fX95gxYteYJECUlQ4Zm2qi5VG9ryjTXAWji5sM/JRH8tomSXCaQjeg3k5X1Jj/i6wZwIs5fmxyzun6w6cpTOTZx0OfvBu5DRPOqTFNkIEr7PQLF9wRBTmHbD+2fEvNojgUolzQVF8oBtVNYcNKttByqLO7khTpseg/MxqxrQKOHXD8+copYphqW0IiV1WYst9sHEN2XZZ36WifcGTRxfeTL/lOsAlI5gVpX/yFVUHDS1oWlKlAipMGdFlFwRFlWJAe1oNGuKnucoMIxqGYO4zb2BEy3QB4MlVbYrQMOj6sUJ5znS8xVzCbAMBGhGywUV2WVibEgCQZ6bf77MWT4eIqyyQOECCsFbfWYrswztAFb8xRAz7nMDWjvY1ERTCZ+TETqGKiAHZ3zIpZRsxRpCsHy6PJQW59Wq40G+mlt31yxvXQZ7kZUNhd5LJIURQg5gazmu+FTwFIG54o2LghraOZFArY252pNHMPWa6dRHwAffkEzHcF/9lK0+6py4SOT6nLJZVJt7VZa5baVI+9Qen3bcGcu0rYh0wzF78cNdKbTLos5piJ5aENpMXrbvd26LIwW0j6fauuoFAonyQqIy9J65KTB1W2xxsBIRwcBxjWgd7wQWHekL0Lp3MlkIXrQb9qYEgUhnXagjzhRnkAAYeEbA6IHeMwFxHTMznXSeuxs0vjK+Kk6qdSHNIr3Achy3gBVBaY2KPW9mv2+lt9RhH3dUF/InBCud+PtxTV7hM1FLtTHdJfbia7e5as/Zh+IAks8EmgDhbkjVAWeQY9PUAMDSneBliZPnpfkOwjXC1Q3UV/j7AAhUOikprtruD5efBjnbBbbbCoHbghMSKXErKJdi/uVF20F8iueJIT6y0hrYxz1irhmcZ3+BLjALjV6uROY88RACPHii7Gyx9Q++Gx7DsZWHME/B1bYftXRVLBLKzu886pi6RLV/ZJfJFxZ/8BNH5vqLdCbOq9m1acWUtvNN2ZefKd8FcvvnjpvG9FjHD/kzLOkrLMnqzmsxxv8ViUPJdsCO3jSREF+/yvJ8HTtMo3arA4pZ/wtao/DHHzA+ygIPhfIQwvnRO5dJ0mOIDNlf99IVjryBW9EPl2KoJP/iuOL3lB18/HvUwKfRz1wRY3ezvGNvQRwa6Gp0ZjhrpDHSmgb6Pi3Kki0F4KbbywWUwnYpbdpqzOLFIHLRk58526SJia7Gn78mX7V2/11X3nkbE9dBc2xgAL2FGf0GmugtHFywXlTnjp0g2U67vhXF2tA4OoH3WdXg7AXtym2Hzb7PH7yF4+Ksum3dujlinwVZqiILfPmX7Bmzz6sdK9OIjd4NOkcjR8TvELObmI6er83NXrf09fHcV+JevLuFpcCwfD5QU9tgy5q3a1zmucXfs3lxdvLdf/3hh34G3/AU4kH0rm71uzQcAwHxeScXA3yalGWtEHIGKRtjzrAsQ6yYeugHiZgEE0PcgvU1Ee2M202b2NzYH4FqtidxS9r725aF1g3ywP/Lc6A0YwlqxX9hcOnic8LE2gkuPecqVevP+n4rq76sjG4lGDG5EvaWZrehHRxhIDB1LCLHAy8NZLXatsA11ZMNBv2DLzF59juhybdq1vR54hREqpCy3llvmKFD0CMNi9lbkwDx2X1hYry++AHm/Fq7qGMpVfS4v6R/A2jwUzdA+O6ofQrXPw591HdwEzmVIBd1cY50SwecrSfZQh7MJ/rSimxcdt4TBICOvBOJKLisD2ywY6Lbv8AfRFNzZbbBRI+6OLexif790hMweKOJWGl6zBYLvsTTu2mKnbHGOh66DaE9se8UQjn8VF+Bt8cIgTx5IxoOG2i1HD2Z5WZprZhIPbAEicjPT8FaIiFDXjgx7hR5Pzthd8MAkim63pimlBCmtSFOXE9iT79NP/g9QSwMEFAAAAAgAAGBQXUAIYu9YCwAAHSIAAAgAAABiZW5jaC5wea0ZaW/byPV7gPyH2QkMkLs0LSl24qpWACd2ukF8BI5TYOsIxEgcWYx5gTOyrRb7g/o7+sf63hzkkKKt7WFYEud69zWPr37aW4lqb5bkezy/J+VaLov89csXSVYWlSSsui1ZJXg98UMUeT0oRP1YsTwusnooliuZpM1QVqu5bIbr5qDkWblIUsBQT8V8Xq3LZjvP2+NynQFNS+bCZ7c8gm8pEM7J6cfjb2fX0ddPfzv9SiaE7n8O3sBneB4cntOXL6Ivv30YvY1+PT0+Ob2C9Rn9/jh4/f1xAZ9BDB8Gn4H7wUMXl5++nkZfTz9cXpwg1EE4GAwR3SvyRYmNjMK3pCjnRcxFQFiakrLigueSJDmRS27WSMUzVhLJZsh19OXyS3R9+QUAArDo/aeL46vfouOTE5gYgSKiq9Prb1cX0V+Pz76dwtwhzn29vrw6jS6Oz3HmTwOYObs8PomAsq/XCGhQT/3l7PL98RnODd/YuY/HetdovwZVTx3A1Ifjs7Po47eLD9efLi9w9jVSdn78+bQ9O0LmX76I+YJERekhb2MyW0vOqoqtA8PuGLiXAVrS5KLIuU923xF8GL98QeAPt4SsLHkee/qArxeSBZ4hiSB5Id0T9hT5ZWIMKyzZ/M6jR79Shcd36Fqs8rlMitxL8pg/Glqq/FaRURtS+AHgXc5+8LmsycqFFMDmDWKe6smcZVzNmfE9q+oper8TU7JDErIoKvgGlYNP3HIPkIXoHYDZGwXk0PenDedofFZgnmEczwuZyX4QhwHZH/i+IwsQlN1QZJ5PjsAy3zrr+Cf5o0RHyMRttBOrf4HUarEECl9A6CMlPxMX2yAgbwBbG5iWjVUagg7BRYEbjzIxTxLq99J0SHgquCblF7Ki//ondQDj2vg5PC5Zu96QHB2R0cAPiH1yYCml2HMeRRuItHY6vB0M4FyXeAdQWsxZCnKzx7Q6Up57VvXubusEAXHcMSC4XbMCRkeG/QcaNww01mfgap/WgDURT8OtHX472K27mtjUv96KG8FTFJl4ZxafkNlgc9mNg2a14nJV5b1u7DW4B1pStcbAgcCq3wbK84QCD3NyVabc6skOzYEGlp6+37B39Nl7dFgHi2c+MzqD7cuwXFMHEpilCRjogRtGGOh5cJRhoPMT5qEh+qfXNSgD1Ql7s1WSxlFWxCugVkJI5DISyd9tLBacx+oRs9i2SPiKMFjG1Kbh6bhVqC2QqhdJnuS3kKOL1e2S2HAriCyIAYmPbFasINc3lGjhGzXC+YmpIMIrHTKQRBsPa5hN5FUggHg9elhCAaHnjlwkTjyxQOBQkxNQkDV0X+eFzSN1JLETzh6FE/IQQmpkGK+yUjTb/e3xXiu7Dvhtwtxg/4S/aCPq3dbK241n9cYfrCjawJ6JaQ6B/1dnhX/Ik2/2ex20QQqu4WFuDjb9024K50WE3qhEXFsASNlVuveEq8LgSFv8OxgoL6SbnqaqY2VsKhGOsSJRHgXeZdS2yhNVSfyDfqZjna6GwCM9t6PR4He902RplVEBTlJ6frgC26u8pibCxZvd4XiKfCjQjnUYGWN2W6QFk4qmm/HucOpD4FC7bwyA6bStFzyDS27xdMd5Gc24kB5+jUmczLF64vOiikW3kEMZ6yVlx3qTQ9sdXwNvnl64oVjz06mFdkNVCU+njnUCs3gGqz8AiBSQGgXsh988FnQKLo9rN7B36kx3aomSsztAn7HHmgKcipSJIR0ODHfBt2RYElQN0weija8GB0hRbAZrQJojE3x0xF2t8kiZn4fmJFA0sEPaQH0Q4MWoyEoQHJTZRYGFyUcG5AQQWqpyJaI4qVSN3Rfh00RYg1R8gD3+3iguZTOeIo8KtSO7cj2PYiYZxs3WrekX0o13raTj+IWC7Wua3HLJubSFUFklueeWg/rOx2N1PaNOVAZqI6c0VjLyO9p2QQtIBmhsHt0RewYs5l1NVvvcQyKX7cP47FFZSJbSwIR5LRHfJ0wAIYuig7xLvnkOza9WfgNm8zDCvKFqWwRpk6INIeYaqP8HuTUX6f+F2wbnc+waRIpd8xyaX8PuU7Q/x28NtXMGPLJB+NOkttEewsCswF2vVrlMMn5aVUWFghnb85Ys7xHYA0iPT4mqEwqDPuNth67GJTtkFSLM2B2HBUxtdlNA+CN4aFTcTa6rFe/TVAFFiAenSyaX4Y8iyVvHqZhDwpA6gpjbnfU8+jCjSn2LHhEtwocqkbxXQ1rSJuZ0b5RZiZhVvtItnDC7i/HZKysoCx8nFOQyNwTRDkeyWvfQgppE9gBoi1GLDFixCXrehdiWk4W0hXlXAM945H/rYTVNPV5WC3YjrjxBp3WsCBNFfbqK5ks0v4bhbZKj3fs8/v2HBq7kluQsTfvUqLt/YZXJinOHhOQ2LyoecfRD4dq5qUFumqyJYd6kXVFUYJWGLJibpCybxYzcjYmbZu5uBtNQlGkiPbpHfRiB5d+pbovNsCgyVnGTiyHDzpjgaYIJUxYgSpbPIbWqymkjZ8JOm8q9rUWMnfE7VZHFV7N9W3EhOnebbYVUkaqkCKBCuOhsJ6btz1hOIQRAAj/tOqrd4tzsxsgkX/F242mjGnvXBQsX1mE4gHqhFnHXwB0x1E0bWy4BML9tJM7uRrOZMlADVxkFBibbvQ6Pq9tVxnP5Ra04142Y67AJ0Cb0PToI1DR3hLP5kpRJqZSlXYHAzYERsc7lkstkbq7EOgK793rQXsakRL9MmRCTmoYr9nAN9fWvPC0/2j3OOQ7OXNxO6Okjy+AOI8bfc6fqocS05on14i3LZHdXlXIE+9775zDUlRJ5DY+QZEu4jisTwob+dljGc5ojMFfrkwzC0R8BgaLSM5GWuoDpjGdFhdw0d6tGhyGL44gZ5XnU8ESxEl6wVSonrU5/QJYg3Ak1ZSkUB6ZjoSXhmUNjsiN8jNitw8/j1cIDxHJd8olqolgSDixaCMsCyvtKofuzavgvmJBYbCcCAlcpHRIOfLqFU6iWe/ENLD4jUN03UdW1A3+wDb6bfthcO4CQGJ4lxGVqkcD9oiBYPCl+mqxDVNbZgkPr9nkEJtKp+5neTzxZsTnPILkUcyLS4kEQfs9hQTniNsasS7oMqASvOGgKcyM+r1U3HaHu3vnYspJL0NoC4g+vtmDU7lRj1MggRoEiVB+MEe0yEHLDubjHex2ktK1sKI+rodrUYWAtKtA5yyFSVWkC6qidGqxwC+Tab615qYTnGFg4OmikB+IHYaEW4uIhJ/fCiQaOucGZWjGADPOZQa9TNM556rKrCgSnuOA5vgjTOo+0BWDQhCpZPftNw08lSXywzRH9qgRbcJAo1Rm1zVYBgX4R4Z6Y2lSikip2Hfsv3RNsFAwDDdTcMZ37tyawHrYu4GpJj/WdV8+YhqbRTIXtFrqzO9wXBL7fwPdwUH+N9LsZndGxtFeZPMDXN/h9/n5P/Sqf+fy+rue2FQ4Vk1jD2JytL1zgxFOy15PI98hwsH948PYNJO/eTA9xpw+WapAMwoHTQ1DctnN+l/dwtFA/Q/wZxbS9e2dr3yjoIfBnfBEK4RL5Dnp7NuTdO9jjFEitd48i1D7liNA1XOXnkXZmz9nedMi6IqA3yRRiUSE55iDUsXOsg9r4mIO7udy4G8AOKjAG9fogyaGAWMnFYf+Fpw4hE/UaPwS3j72Fb2TYamG1K9Nn6mZFSlPZtfs0ThGnLbIG2u3O9ViIspKbn6bOMZSa+kdryQSW6OaRbp79IzazUaoag3nClNxOc80nhgOxxmsdZIqqs6Ndez8tAATAHyFoDfuNJi9MFYqBGMK9XELs34l3dkixMKbktVWhSQ5axuSbbiOQEqnGeBSRyYTQKML6OYqooSozzbh/A1BLAwQUAAAACAAAYFBdwHg+PfoCAAAsBwAAFAAAAGJ1bGtfZGVjcnlwdF90ZXN0LnB5jVVNi9swEL0H8h9UlQUZHG+h0EPAh7Z/YA/taVmEYsuJGlsSktysWfa/d0aW7GRb2PoQReM3X09v5I8f7kfv7g9K30v9m9gpnIz+vN2owRoXiHBHK5yXi8H47WbZHERoTsuulY2bbOCNaE6rgw/iKDn8hui53bSyI/ww9mc+CKUZZPDFfrsh8DhjAqkhR2VFOFW/DLzPm1Y5LQbJOO9ULzkvSkKD9IEWs29vjhyBb/0xJkBzcU5iVVV4Xhz9WVkunzHxC63sRAENSxNXM4a4Ih7XFEa2CHzFdjCE0nYMHgI8Ps2GzjgCBWMVJf7xJcGqsQEPaKzwIvpzLC43jw9CKw8FsmI1YjD0REd8J1u2BLt2xoeXZG4lc+BtrwKYGMKLW7DqEFz15iIdK2L4xMWbqPg0RgelR/kmROy8EtZK3bIb4pf+Y+Yic2VsUEYjWS9rKDweM1joytE9oaPG3dTLL7S8Avmx69QzhzPBpAD84UZ5A0CVgf1gTB+FVUVL8ReGD3IwbgLoikq2a6x1Bpm+iZhsOeZrUkA3R4raJ3Bg644DEVd8pv4f6fKSPgEZt3iMcDNOILxOjH3aISQrxEkPduQzTmPlRs3jP5Y1D8Kdj6kkF+PO0vk6ZkubkgQ1SCB1tqZNmQut03o1Zn4cBuGmJeXFgcTSZLE8h2WubDl565Se36cAxXohxKsgizneOG4mJf6vvrrjOEgdHuIb1krfOBXrquk3rCGzRQLQj9cCTE3fgpqK65CVaFsuUixGd7tEATAUJitrqA/GdWa6/lSSk+xtTWcQlG8a6T0MMEuQPfn+8BMGY9SheCdRYjUn6noj/pXKSrdDdeUjiTMJo6Hb66zaaPlewqgTSCeamSUfjJM8wMDQnMzJ0YNW52kipiMwdiehj7JNevmfFDsUcI44qx8ssoF0E2HwDegVMJbAS8d7cucLSu7eF3m+pNevyE0dns3F/QMGg8DW70yZu4gL+ntWJAHC8HKOtxTnpK4J5dGDc5r0OItzu/kDUEsDBBQAAAAIAABgUF2xdkyBigcAACgWAAARAAAAY29tcGlsZV9zZXJ2ZXIucHmNWHtv2zYQ/z9AvgOjooCEOmrabsDgzQXazN2Mpk2QdAOGNBBoiY65ypRGUk2MYd99d3xI1CNtUqCWyHvwXr876snR80bJ52sunjPxldR7va3Eq8MDvqsrqQmVtzWVirULQEhVznm7oLRsct29NutaVjlTqlvaw/PhwRMiG0HWe6fjJbnjekuO858JLVVFvtKSF+TC7JFXBFao2BMuNJO1ZPA/yakAbVQUsEo2lSSaKa1SlAwqdZVX5ZxEl29Wp8en5x8uVmdL8oL8sqO3PCdbdv/6s4hmRG+ZIDVIk+yfBviRm5DXqxURdMeyEnZV1cjcPM7M4sytEHL8muAJdKNI/P75MpkBIwG6W72dkR34aUtLVpC8KhiB8zEpzSnvQUt2tbz8c3mZXZ1eri4+kQWRURS1LnK8M+fNmfWZlvv54QEcjzgy+LHv1qgFLqS3TGfmPU4OD9h9zmpNVoZ+ifpHEuCn5Ou00bwcCQv20g9vfludZh//+PB2eQkH3eCZ0rqkGly/I4sFie64ePUy6ivYqa+5BAMq5YSb91QxvQOvxChD6YKLdMPBcVWcIGl6nr1dfXxz+VfyLaaq0Q9yGZlgAziDai07PTMSrZvNhsnIONUuWgaQN+aAxQkWWE0whwu2gcShRSwSZ3ZBNQUp1ia35RyywdSIkSAhRwsiHAf+ScoVI8vzdyZEdh2SvJHCCERVzuA7yTWL18O0jsgzEkXp3xUXcfT05OV9RJ6S3FRFjuWx3mtGpaT72EQ3SVImMC3jyFRvlAD/OoKKaF2RbspGbTGH7rbgZPJJNsyduMtD/PN1MgsKxXgAMzdtRE3zL3EEFQXuMw75KUk6bhNAkIAVYLzlpAUkrtocQafEkbgU984LTrYGhi+t8+FAhCsiKm28oeaTh/CPacGsfxq9+Slyqp4QhVQCEh7QSVHNAZuoAgTL8mpXA+ucNIJ/ZVLRkgh2V3LBFEGIouA1yuH91q9bka1x9gFSBkoqxwh/lgagbFR66+1qZ5uVgorQPieLiUIhqMaWej5y6bOFFTQV1pruy4oWcDIHRmnR7GoVO0NdHGatw6BK2D3LozC4DhtRy/uoHy3z49wHa5OKo6dqTp4qTOUYaNIsy0uqVJbBk8mTbIa8gUJwBdrPFRfYGcBfTtrMxjz0QV+Xe2rLwoQdbHJ+j6atWjqresXp9p/5EvAFAOIQAJymxDuqx+s3e1ttJZoWAb3j9+XZ2bk5wBAG2sZyBdv//ofUhwfGa+TUBs4USdz633ukpkqF1Bf7l47hiklI6Lha/81y3cIcAF+WccF1lsWKlZuZb+NzNLuXa7Cb+h6/8GTDfTsjwP7HypdGu+kb0tqa7/WDn6U2yhPsxOsK+v2AMy8rxeIgdv0cn1DfzSvpRVVDuPrU+HcdWgQpcpxDZPv9/GY2ZjMtYRHKX10sp+kg6I8jhIkiJPx1+efHP87OBrRJ/xWxBw0N7PbdFAEWt0OPuYI9vxqiayDLBMavuRrErdSEyGKQTdphAU5HCf9c+3sHw+CD+eBmT2gyMM+VfLOPUes1VplTR+Y3cAjJ6zjEJScbW1qYUJltMCabxRxnTZtYg27hW/wDDoxFH5AebPrmJL3GH0cOXUE4Fh0xnilwSCU1r3soNBgPvA1OQGbh2RljX+bWkg6ybalOmYgtJawL6JtYl12DwU1bf8OIWotcusSRL/yBYQV3glCGB/mwrgJLh525B9GPrm03ZnqI7iGzh2YUn9hH67IkSR4p0bA+VruV/V3qFvd7dL77GAabsi8GNF1bC4hGAxmOs932D0lyfXIzLvzYhXLWZmky7tmtAdOl/KiUYPfgm8LnwqivO7uP7DAxmXS9Ducbem+Om9k7mFp0fX1cUgHGmKH4xP7DEdsJnSq4jRmKgnLLaqq3D5eYue2aDhOQ48CxjoyDN0P3+kFxY1HmgXMP699NaYGOpHd6E6+2h2KRfx8Ghs436oMBrmumAfMjG/64iPs1MUqwb/YnO9V8X/Yd5Tr+cSw16K2f+I4BxC/vay4hTaflfOFlOcz+no5k5CbfOlrD/L0S7/G2NOKp0eoJQUAuK3F7XMKNo/BlhN8ywq8kCNlO1c8WxCGqXOPXE3MVYhaDWdFeJnx9mkla+MnmqjdbGVWL8ZQ4Rm/Pfu22bkxeGH6TXvjkWwlh0OyDhHCJPRLROWlH4cLbzbBSmWP5r1TpG3nb7JjQF2YnLpjKYRbAuXcRnXr4MaWhbEFS9J/iSgMTmQYq33KstpQWRUadmjjiom60ivBDkbwFmHkGj1tW1ovI1S/ChPqmiONjpxdYwUTalHoRdUtWmj8aXrkaTddwutgRz/25E68Gj2KuOEab+UF9Km6hoA1okHRIMejGbcAmkKCWHE9/fXQD/mrKoL0Pgd442qJ8qMPOJQv3hQVwOrxywSL2h9ifZAN3aYYN7sS9V5D5AG6YsEaoDcT8W8XfznEmBXs47nCyX8bWPn5DzLW0sIhuLqcWuttBLxkDSdiaptunswiu5C+mFR85xaFK7JIP+c3bFQJm68cXGEun0hTdiUMejvc6e7k23/SyDEssy3zHtQV3ePA/UEsDBBQAAAAIAABgUF0QTie/5BMAAPZMAAAKAAAAZGVjcnlwdC5wedU8a5PbRnLfXeX/MIaiCiCRkFa6u/Ktj65TJLqiRN7VrSRXJSseAgLDJbwggGBA7a5T+e/X3fPEACBXcnxJWNISGEz39PT0ewZ88M2TvWifrIvqCa8+seau29bV86+/KnZN3XYsba+atBXcNnT8tujMrfwqi3W874rSNP8s6src1MJc/uee7y2u1l6KbQ9e7NdNW2dcWFBxZ687vms2RWnBu23L07yormxLsYPH5jbnWXvXdEmWZlsL1txliXpSt07rDqa8TR1ysrYA4JbnRcszO3vRpVc8gb+dwLGSV8uX5z++ff1mefGOLVgY7Kus3jV3Jf9DMGMBjCTvngcRdn/Ayrq6mpfFJ56zbFuUOSuqjrdNy+HvqeKtgMlxJmFhyq1gdZXxGbZWDGeNDZz9y7vzM7gFBguYAW9ZWVQcxwgvLewMZ8yatNvOWL3vmn1HN6uIpVUO/8UN4b9mTxhv27qF710hBPD1O5SETzApl5CuZkBrWae5O/fk3cuL12/fQ98gCAyrshqmdouSMrNCMyNBAVrETK5vy5vyDiBrEW/yuuFVCFf5vglPImDgDfIt55+qfVliJ/1ctugOEuJZqJpjFJSqDgHBCTzd1fm+5ALA/+u/cRFyvmE4g7BKdzw6/forBp9iw/CWVTVIeMUUjHqIH9Vyib1WgMuqgbxKZAdCyh6zIN6lRRVEseFeIsUXccFq79uqjxIp2wD/CR4oAObEuACXJ6crRUbX3jkE2SnINn6b8aZjS/oq6srp2qSoVYgdRURjFx2oj+qFeEhUEldU6AbmiksW43giRATRGDn9eQLQBH2viVtLlDUHGhVqj0sUKOkLFFAp+Gi3+jqwzX1K8HNTAOFSWuxMSFxmjIOKouFYBPtu8y02IDFiEaAophkPQDcEcsDDafBawY61fQCLkAOElkCQvIlOMJbpNIJ/yMmwtyiiA/3fLeAqssCKs/+UCj62+n3G0WQDLYege/FNW3Q8VD1Acj9+rILI7bAp92IbQhNpd/JuefHT8gJwndUVGdyvv8pKkDCWvDKW4h1vP/E2rNc/w7z1RFHxkqSoii5JQsHLzUwbk0UYudzAZ7F6BON0+wb5IO+jQTdyGoac3kOkv+DCoVXTAdNtOyIiYvPv6bFPQFbWgofT41mPFb8lUeuz/BJ1jN/ybN+l6xK0K5hnIGwDq7kCnpeFkMToWUczf/1AYhfuiK/fLod9QC6OdwIJcDu9Wv509uHNG6/fvgIf1Yq0TCp+g0ovFu/bPXd6+YyxvCaXH/8F/7rsQ88FXmphXXf8nq5CWIsrDpQjmgRbEoVshj5ILEKX87Gc56w3ajQYJ85TvqsrGA7pHjyV6x9pkfgzin+R7TjEQrkjrS4xoVS+GdNjjghOz8ZSd08RFWwMNolsKRACgUbYp992QfSRK7fGOCgFQgN7ikNZ661uHcOnWjBAQgkhpEg8tDrkPSCrOtMmginTyXbpHVtzcCJtV6Ro2oyNZjDbQGENvqOoRQU1AmZBLIY4J91AbMNSlrWp2CKIgrAjg/Pt6RaAe3w1UmbWTbcObb8vLEWlTBy5sXy/a0R4ecDhQWyEVtAYwQN4jWX0lxgjGlc+Y5DvUPNffQ8tuFSc5a7pRuckDdJ1UZaki4NhKagw6zHAfv7O97outX3rCSsiHxxYivuR4/obp52wu4ItsUmhRpynbF3XGPP9kEIMMKZr95MaOZ4TC1n77QDf06nAkERbfwgtE/jIFQYveMHPUFpdBFKoBn7n6BoSjtSdxXAcPcZNWnTh74ey53iE91KClrcNhC35PSc7GCOSoQGZUZtCJEJGBrSgg4BBjXVV1uu0ZCrSMAG6jjyGC21jkmEM4qZoDr0yqwX9vALfi90kCsl9E/6QrBo6zHx4JfYtTxyjER6xvjRflGibb0DWgo8hRgAKhBuourGQosE6sQwStyIH8mXSRCh+rgs3/NDNEHaineuhJpsdBzPTSYCBwkg11A1riCMJTE8pii6friinae6UJkdTszDU9eI5SvXjXf2J2w49HkUHJqwayA4M10CWLwBJdg2ZuQj1hc/wbIeh5EhQtkOX1xQNfhUV+JeyxMv5h8BEZgZnjyBHY9p9FcIAEPVveXa9kCYrlv0g2YClWrCnDu3QP7GVgmOyA1HQvqsTRdyIYXSm2Vf8TVvvmB2IclJm6yODxJTW1M/etZXGz2+RVzk4+5n9ACUhUD3+vyRnA3FW9jb8kbL/s7r7od5XOZn1mZsdR31X54oA1W6mFMCvQd3mhQgifz7atE1IYk8I+/KnpNuvjCRGsdFtXnpEeDIYrPohs0Khax8DjB7xB3XZwYVNtWPqDtpDPfVVfyyMMj5T0UdER7P7gOMYs4dHMvvDToSkRD+H+FMUv3hT/35A60BanUZlgIctVAh9++Li3TJZXlycXyQXS1ielsc6VVFAwV/B+H0Uj8PLF/N/T+e/JKuPN4+it1hsVsXHtMPlqHjassv/+MdVePlX+Ps4wmuG4tfuM2QB9dtsBAc1+pg/jj6KR/8AjsmNOLapSKiMnUgrFB5zyH3DOWXn2nvbuaJCA+Gx100PRzuoVfW4CTrTZdt+vjhhn6bMzTBwvM+qEiszsE9dgtKdUCFgnJVF1f09OUlEMfKqn81gYmHD0Ya4LB1dCawHm/6AXF/LRFTg7MLgQTC1HOhoispVpv4EHi/YyagG0uP7raAbWIi0KjrQ8/+Dsk+yg4VzehhjZUWKU/RZgqqiuW1aXdEKOvJb8ZtEj3KpzLgrEPTMLemjVmHOcFzbejaXnvuaDR5O+Zy6QV2ZaQu1kP3jq7ZWuxru/TPv/rknhmZOcQpiV+VhgOv8UISPsDI2Y48eXd/gVXT6sQrYQ0vHMTxDiQyI2WkB1vgChA+SQFqJ8GNg0zfWWGt9CmQ4lvih+BhEQMQQ8UMW9nni0XZ0ysNajF3/vqsaSbkH6NQWhslgFK57aMBnRbkjKqBaZTlKCr+hrp9bKJoczS5EkpU8rVTscFSndcRxyHpTBEBhApq5gz4z8rKXrCzC/6Ha4wNvu1Pvi2Gmi3StucpJYI3QVGH3ogULudsh6aTdvMIHDaTBnaBIgae5NQBeeBlKPfV26py1+nvFl8MqzfFo07JSlxHvH35ifZfCi3uHoaRQwyLeZ9aMxkuTutXu+PUkzNl2Pp4gI9vFwi31eCJnZM3dzYZhUB6IDPwGMfT352VVe1O0AlJi1D+9iw6WRKiKN4iPrmNKn4Z7HDB4vKtBfuuqyEIsKSt6cAH0JXHXlhhbLvZl57svLbY0x55fRMEFzo2VKQ0phSDlHq2MWnjTfT6gfCCgFu5P49K2Bt9+7Ug53zUoalivcraVUfO6XRMHcIVTO5TWaBR+mAXdgBosK5keTtVJ73mOlR/tvnzobwVoVFaCzIz7cYAewNm1ntp27dnMzx/sAUvZJgVicyu/tC8juqIs2Tb9xBk6lY5XbC/QWuntGsXyKbrRIICIhU6T2v1xk0d/FUYzS/sUnMqw3ECSrV1wOHRLBnw24oich5KBpmEont7sqFTiO88peRqRXvDTv14c9fQFeLHwmt8tynS3zlMGYcDulIX4dfl0NZOnT/DmZBXhPiNuwXJ3d8XsnhA+x2JuiiqX7JR77iKUAZf00eu7DjdTN1hp8rdS0MRAmiLo3AsCQdqeUIMg0fDqUIWgOlCV8ZA6zezhqfglQJ/3tvwdQOqNuMmewfIQaUP+E5FaUAjIW+PRuRIlUjbkLF3eQEyMZQN9RAdBrUN4c/7iVfLy/Ozde/b0O/bji39dJj98OHv5/vX5GTa8e39+sUzOXvy4xDun88l37GL5/sPFWfLTizcflhIdMlo6YsnzMDx5+nTG5L+T58/05R9tIz4/octvn0f9ZR7jrBO4KwTw9/Z3cKHHnjG19uT41J1m/Awb7H8n5lGd6OwU8XEd/Eky7Ptg5jwGT4gaW9XYI5iZ/QDrvHHP3PBc1Ps248NwVfH/N0g2TQpIGVwrUzjKIUbKA8rP3mzRokpItBghaiLdgl7qLJApaNXWy/8jn4C4qZvwaTSOXmKZn1jUGJYGWCmVS2+vaBWDcfR9aaH23jo0adGalbhvFDUSqx+v7ViHFrTrA0WArT4D4lQBwm89BZdSB52s/MvDZy6Qa/n/dysWY5VZtzRDXWlQdQRRWrkW8Ob8dmYEklf7HW/TjocyIfyNKhWSlBjScJCSFNxI6NcnLleRtr9EonMA5dfGt8TyHa86nxdO/YTG5IJYImlFlyh6jgjNkRsn42fEL0hJmlnsMYkDD9V+krRros80sH+hbGbfLOhOUeQ7tWFxz1lV8gIwhV9gVRS8Hm3MNyrr2nL+CUR+xC2OVxKncwCF+R55gI/n3rmAGuJoPoAfL6oiZuGi4OlkiNQeihj/5THcB1QwchXZF45oBJFMMDTOy9P577wta/0ZP4JhTYhGgfWe9aFqjv70qjqhsnCPHeMljxyNhyF+ACsXQ6eBg0TYEqcnrXNfz3aPZRG9NZNDjEbH6iF4ucvnq6nKtrID0pPRqqzGO+IzKtVj18tTUigqwYF86eu41OZrAsm6zu+IH2OxRZ/ecQSu6VHk0jblQ+GUBHImwGeiCS7vpEQ8FHQMfo9wTNlLqUgtAEF4znNZdw3lNGfMIebZamo6Y9Q8BnIUFjSm/BYrOzo8kAfSyL7gEzQsyJIR9NglEVndcpVISRsKN/3MCVEoWqfk+lByTUMVVVqWY9o0TJm04E6Jkx3M9HRKtJLhlmejnhbvprYA7u9qbbkY+Iwu0B2XjvEpXBRerrT+/hYl4/uXi1GPXDr9aq1TAKFy1a85cdKPD2f45onRSO9sij3r1EPX95e6vOUW74Yesv/WUUyuXjQ8k28YTJz9w8/kMQlVwFXHIySgPrI6jG/8At1kidI7OTF+5tOItK9/TswvG7Uqu5rsKfLCsTlqGs55K1tgGh4vOGYr6m4Li0vVOmstnBdSxlXdQk3XR5w+hiOuIJFjshTdt+qpuHyg0Kkj0zkLByHsXK+/Y+eIUGFeQqBb4pu88uSWuEEPvpH1jX5kaQlR8ooZpW0cHseYzuE8MZNkTrt/JVeyzqpNg35DTlYq8rRLVaVIrxsdkyLf7b0OF++rqrkmEL9i4bxeF7/9t5fLSt3IkqsznkLuHROlDkh7KHc1lXRUzttI+CCmlp4yeVJoQVwpbFrIZcPg8puVxEmQVDDC3Ux05BYOYixQ7YV6VQoE0a0t09ZQ0YXPrOXQ7wViaiVPhzk0uPMAHjpnN82mkbpP14I2ZBxgBY0HM1X17B6nN114YxmU0EgKiJG1uiUnqZ4Zvjrd9S7h+IEj6OGyGTrt0msUFrcHOD4ESuprt6SJIiPNGNGjb1HF3NOtLhrLCBnhZ4HB1Uf12ZgCE3XQa6M9G4NuDNHKJ3haydwhMjc7VbC9V1DjV/LuJd6EfVjXTNAibPFVCR8BNk4Ilhk1ATkcADruHx57W/9kh/Tcqto6NZm9hwFFDHOwznNthgLTv2ez5V4hdXf36wckXnOM5SVpcJ2AOQ3ttGd2In6Jp6dkeA3EYd/B8Ztt0ZkR8EUU8HChGXumRW52bO5SgPo2HFAPTsRLm1Ks1MJjl4E1GRyVN0A3bd1xDaBIG25roO4NyBx9l2AK8Qhe/XKEH8O6RnC6oIfmf8o3JPIwrCrZGa2qrRkPgr5aXXPeJBit9CNg3b2nwvpt8Hh3neM1vhy4KW4hok6L7CTBwk5fs3HXeapgaEJ1Nc+Nf7RHZfbK2+lSmPJrVKacdnrWxilu2Y5D9xtp3CXx1kZGGny8iDOlG0Q2pBulKtDSEL6q9Gu4pBWTnHC5YRB6adohGZ0i1PT1iEUjuw4gOlfiV3v0OGdGBhG5SnRGFERNc+zJxIPe8WeaoNsyAqDDMOprj4yr5rGhHTu6GFhWD2BoHOy0x5JxYNxlQFKG8wtWjjbpzdsxS4erOYnYCaSs0VRb1LBqzsoomVXM4nlwKK4aOb9VTB5rVEQfNoIaNHdpck6xiYP0KAKkXT9cQv08D6U/0kcNPNSoO3QclxJVJitgi4GboV3rAdUUxH2hMRmfxheSP0a2DTr7Eab2iCNR/GHnOWWQxo42DEXpqB91g2RZORkFRvek4miNot4PztRRxqOHJ+lUATpdxy9UCZLOyreOUcu59L5oNgIVYLJ6vdmLLMVChnyKP9uBYfITjHAdYwKB1y7tOjSW+AL/wox3kd68h6Tin3nZ/KD7OHAc2FhfLYLlbbpr8Gcyesc+A6Z+U0b7OhgVa2B4yXMKYD+3P5vPgWlzylP23RdAV/XcrP8XgKO5nysL9gXgpAJfAGdInuuyxR+eQrMbin8BVlJrJpUbX4lGjG2tlsXu51tJjNM8T3QVPAxIa8FqbkE6FvJOyVlwCAxGuctwGQ2oOkkX61+oOQo+AX0fYCU+PrQMWev2joWqun+qCgObugRfEB1B68oV4E6lAw/IICYdJLlmQHFdNMYFpZRFHUbtytxh1NhT+1f96z1aEHS989BgjgCNyBwM0901fLEp6xRMt2LT4jmeW5HjW8uKIGy9zyGsoF9AgAdVLmbsqaz0oguyfAYMUXBU3HrE9ZLQgzyBzAYW1dTNpFtz3b4+8CnLdTY2OE4R0IG5yhwt+2EisJv8gacdJEf4yq6biEzglo72yOT2MA8pwoLVG3zFUx2IJ+E9uNp6iJ46yFDB0YZiJ3/NQ3U2644+LEIn5lcY6GliKhqhU1I3oYRLB76pi8SNdMNjz71a4ExPRIZ/6NEJP/3aF/6mDOZ5SUJn/hKCSBJ9FFN61q+/+htQSwMEFAAAAAgAAGBQXaDsd4F/CwAAvyUAABAAAABkZWNyeXB0X2NhY2hlLnB5pRprb9w28rsB/wdWRXBSs1Zst8kV22xwrrNBg3PiwnFzDdyFwJW4XsZ6gaQc7/V6v/1mSEqiHrveawUkK4rDmeG8h/TXXz2rpHi25Pkzlt+TcqPWRf7t4QHPykIoQsVtSYVkzYe4yBV7UClfNp/WVK7d8WdZ5M2gkM2rXFeKp+1w004pngGJZlhu4ihhsdiUqhDtgljwUkWCJVywWCH8+dn5T/Po4/zqw9vL92RGTg8PXs/fnP1ycR29O/s1+vHT9fwDfH5+ckq+ISfHp9/Zn8OD6OLy/J/Rh+uzi3n0YX5++f41Ap4ch8cwN//49vwa/p9ffUKkz18grcODhK0I/KNVqqKYxmsWASd+QI5eEanE9PCAwCOYqkQO+w5BnlwUeXjLlO9dnb09jwy7r99eeQEpBMKUVK3DzwXP/XrAHkqaJ5Vkwvf+6wUT4oWC8tgQ9IKWk6ik8R29ZdE9E5IXuZ/TjE2Rkx5HSmzsGz4rUWTESBSUZt9IxhRNqKKIvIa0O6mnQpdOYMDYQ8xKReb6B+amg9VexqXk+a3nijAuspKnTESK3vrtsMc3X5G8UA74CPa8yJnXgLegZDYjXpXjcJOyF56zFNmXoFbfnZ/UG0olexSWeIYQjL71go7avSdy+kR65Alx9gULJp7RMszP7DzinoxrMQjICuwDXwnPDReBo3r0uGgFqH00mTGdJ/yWSQWcW+cM5ZqCHfuW2y9crUlRslwjAP7EEkySSrJyNv9lDRTItahcieATr6v8DnCvQsFo4p+Qly/J6XHQBbLa07C99fgsYeld97PhOaxKsDbm64Vd4VqANXswb37HG3jJUp4zkEt+y0QpeK76vlmUcZGwKKMlcN8JMuHPn87nuR34QWgh7Tyu2Euu3S0IVgpfgnuxxG9Jh1yxTPpBEECEwI++R2XMuReMIulFvTASBbAY3bGN3yJIqeL5SYPhEXnFKZWSvDZ7O8e44hfLz4A8sHL6moBbEZnRNCUvgdKrEGM6YTmEElKCd+lgRGCG5JAMiCoIV5IYJPIHQsmaQ+jP0w1MVQAqiQJ4vf5vsqaRYdQnPs5cXP1C4rSI7yDeQfTT0JL/m5GUZ4CJS1gLHhGzhCw3gN7IogBuZEyBMXCeDemEbQmzzJLS9hHxnKso8iVLVxMiikLN3sMuJySjD9Fyo5icgq+hagcZJHDsF5eHuBoA9Q/46UhO6C1oaMCq5r0HE1nxAUgnMTQUwU0tiNfHH6HsIlyzazW752BACDpE4HgNoNjiTf1FVQ4JPdJoMXm208BCRu/QZKXf2dwEUgaXKiruZhhYgjrfoIrAnCJQstUQz8tKRehmOr5NCOSKsUi3h1fig/EUKhmF8dSH1X6ndAhcepOhSDT1YLorXiHyxh8rtfq+8cZx+KX327Grhp0+21ixEaPWtJUTSM0KCDxxm4DaoqRnGa1eAM/N9HShX8hTRNZQ/kdb9IX2NaM5JC3hcIZmBXEOsQb7JJFuVdKoKTEGrHNTz7QnOHEZnV/Nz67Jf8xg/uv5Rf3+r6vL9xefgr1yjS1c3gBzczRIOReiECMMjbOJDyQ4DGAh/oeJppEu1Hs6tPX5D8grMlJ2bkGPD2AULCvuh6i2r0EF8bxiQwi758sP2/a6e7nerEwZK32okk8cFoYy2nCWJo7z8RxSSR8IdgcxXzJ/lQT72Ma+0nh0nyWkv45XpQVNIp2dek7lWvKQqbaKcn3JOCdgwNId86Yu4gWUjTo6QFCZ2fjQL7iaDeg8O9ONVIi8+Stni3Z7vt3fhHykacX0ez9CWbfHPDeIBYYIGLF+MU2KrUGBMyifu70VFsYWUSs4yLCYZgeRCEurolLNCAc62+rQtCyK1GG03m2t1EYVgM/Ztq0nDTQEc9+g1eWCF5YbT09zu7EbD8tj6S22iOQNTaUjE0AE0R9T742PyGKv2USwgGjom89evRn4CPxYDrRobhY7HQLTD4RNWI85Gri0FMciDsvKOpVDuxA+SUKVlbplaKIgaKvkid/PMOO068f03xDBy43uHbYYLUb+ScvFllCjnbFMacz8BtTsbmTBuP87mm2bX4zFLca+9gYc6HCwjVeAqJxAvNU9h841HjsMGkN01EbxGTcw+xXzoOtA4+6ztfQxRtn0fNoacWQrWVlUUCLrKbQdT3sbTrntP7rFwM618BYdZ7Oo+3aMy0NaQtBLfMcnNAJHEm4BWCsXBtjJbtcG8hMEwxKxkT92BDNy3K3qOm6l+etXGlSAvzQRZtTgeyu2u6BBtssJ+25mPGOHjY74kaHSR4zbfzpz6wz85A+A64j6e3d9E96n3dg+6YG15udN3bK4B9aebwAYWGh/3gTgKbnBDrFRVNTR1KK/CDcEa/BnMKWtGyf1izP9R/v6ddtoagrYOn4RXCmWE+h6FToJ9I94bgFtbI6NI5gFeAR0mUsGXDK3k3Ui+iM2VIcSZ8WftaG2qnAMwvuyZ/2ga4akykpfC2FCVrhlofDAQPYdak/jGzZ7R51uD6LFEOQlOOpo/Ow2jW7TPgKtwXo9UCcA9+q1sYhnTE83flZNdbAxv14/y+xXfo7Gkb9ciuJ5hmmicCsJ7H7qWjc2Z/D9Bm2ZVJIlE+0rix9qk9XmY+oi1w18aGKZEFWpWGLPRgJtFzAtpOrGDq4zxO9/dGUIPbVIdOkiQ+QSzzk6PWRfjLZi0+tCLs3ByIgMxlsOJIknZX2KGtu22qDWg3MKIsuUY8fqI7LQObvusYqrbAW5p5ns5h+fHbUYsqg5kop2Tlbq5y92awKis8Bm2io0lEzZcypjrTfQxE3I8WK7NPAI3QhiC3VD4+Z4gXFRwU6izFzkDPbSPVUfwXGywMxmkKBBj7YrnHV8xcQGEwCaQ7W2zQCLd2i6J3C9IznYrjOQOn6Yon7kqE5H57b/ZMnApFsPMmDao/sFRqFoihBV5uu0jtYetf5c9zGouHts7+SgzDCxKOnWQ/ggKgwTgMKePVtMOkzOUpotE0rupjWBm7sFqHDMuPGEQzP60jm13KLHkTOWdqNHs5YY2yxA20PIvYprd+NPOznImomddM2E5yBBbs7SeyeL283lcTVjPsU6erFd+o76d3T52tz4qsNW1wwf6YwddY3iwGbZEMNe2bbHTpG3QGbdldsCHW65rv2HLDg7R8ARHI+q2CoxhdoHUQTdVokq2WZGVZWpG1Me8zoHtQWFRuP/dL/6rimjvFWpvh7Hfqu+Kg/PxG2VwfKf9Yzf8pAwc5kDNfjMe6dPUHW5am+ZnjUVtblf8ZwSFxjMKFSxItKXN7OG2BX9cg3B+ieWlm9qGGcdA3QFFIzzB5qV2Br9lnvtrEfshX/NgrnCgGRnxL0vcOti9SU9rV+WfwLH0RFN033X2YL0CALUUbbEy3pYaSUQuCoKaZJE1OrG90DUGfgDJPd4XfAYQoHv6U1jum+Z8ep7EzzFW4OUZ565/KrX76KhnQoR5vBNzrxvvBoHM3eNLDGOJ/UVWkt0F1ItHUBEY2NIupqLFFT2DXZHluZqTDvbI1iNAAGH2pRspi89DDbnIk7X0lrgvi0mpuRJEuiuZviHF69e4bXwbqpamEdQ2Xld8bY3fA4lqSmNXLdZGihlvNk1pPQPEpNtA2GQz7qXnwgSNtgsLoim5rvRs66GjH04UScuKpSTPZgwNmkClRN6zOWZd8MXsAOUF2kS8pPwZEXe/ajlZ1abqzoX7zNycvzd98///iJsZMnSMe4c+3FYtFW4hsb7XIRuPhjj64Xqmt+vFuSW3zNjofbgCPRf2x9+mEnICBIKSyH6hxUwwR648k+dCZuY2pzXcGXznPK7f9oQ2Hs7c2TgsDwu3ro0aEWMkjWCdcoAm+XG/+TDLRQ7bOIEBJhOZnYn9B9BjLKlPWYLW6aIbYjWaYbjjTU2K1GkdRtFmHSiqNasSUGHB/8DUEsDBBQAAAAIAABgUF0qT9qbNAYAAOQTAAAKAAAAZW5jcnlwdC5web1YTW/jNhC9B8h/4GqxgIQ6Sjc9FHDhAkWwi57aRbuXIg0EWqJsNhIpkFRs99d3hh8SJWudTQtUh1gkh8PhzJs3o7x9c9trdbvl4paJZ9KdzF6K766veNtJZQhVu44qzYYJqYdXve8Nb8Zhv+2ULJmOJE7ju2FtV/MGNA1TpWw7mCk0U89MDdPdqSyYKNWpM3Kc1aXinSl6oVjFFSvNuGLoDpQYajQqv76qWE2KmouqcNe5S9mRlb2h24atQVxl5OZH/F1fXxF4eA3Xyjtq9jnXdKsj8YxQUQ2r7Mi1mSx7DfgoZnolyLjolvy0c1Z+2PNyP9EvFUmSyO7glO50l3rzrc0romWvSlgAS/wMemoY2kttpWy8TWVbkQ158DpWJLkpE/g7ODmctMIw/RBN5P43hfkcAPD88P7RCrnBHQwqqSjXbPNZ9SxLHsNNdd8YOHNEQq56kaIh35CHyPzRctBV7ln5tPlIG82yicucvtyNSlkxstmQb5cCErRlox+/3o3ObyfDtHecgyPcY4rPfMeMfw0aswE/fg/XREhDfpGCRcgw6hSNYlA4xeGc2jp9NC8bN7FjyTpDfv39g1JSzbR1FHMO397C8aTXiKxgvT9kTcCmKMgEIrMiB8WNYYIYSajNUAK5RbjQhlHwck0EOxpcNXvmHecOQtkCZTdDYuftU4XvaadYzY+bBCBSov+LxF9k6ocQNFARwvmX5CINqgGr7sQcJJPIF+BudPJSpkyiO6Ism7sfwTsP770bWgenSeQpAJlhFTlwsJVCgqNAbI9dkB0TAw7BdLVNgDs0qZcjXwOsaZV6LcBVtGli53i6UK1RjEUu4TshFSusDdqlX8QdTOgeVkEyncI7AiR4z3od0wjdOE+lmbtguaVPSLlubUWsYCGf5qd7yi5sKllXVNTQtUutoLKUAvCGJDFh+fzTH/cfwiDN8oot6RrTLaiBfJvlmvcvzk75d14+8l6I7in1mhbuYaRLyNlNVkT2puvNBeL9n+5oKdPNVqwhQYObGUEZmQu4PHhcwizeLobcsoegsAJU2+CoVdg55WrEwgSI7m4thYSGqjHEn4tgC7gHF3I7M1x6AZHjlhiXneLCpMnDm0en0+6sZS+qNXmnE/IuOmpF0OANVjBtKsidKHlxEhM8DWQedRO5Bsa3GIhscFJbqlkhaMswH0xEYbprgC2OJg0TKImCsY4sdoZj0SAOIysdxtCO4O/Cbh9Xt926UvqhVKNqJxszw7hvqigOiptCRRNqHreuRg/Y1PHhg4vnjTxAhcywWCeWutdLVBlH54tkGSANZk0JkzXLhyWT+mJLAuyd9oL2gtMCHoEv9AozQyzapnP4WPyFgwYEQjOl5DOHhuXmJiyCK3uoOZSgS1x4ktW5whlQZxLZdHiGXXzOmw3r9Ams8T1NfH2DpjAEGToczf+eQhXjwkUt1+fGRuFZrMUvYzh+8JCHxLJhAUBLHkFt44tqxIw2/K4bulDA0WqQWgzjJGihyNcU/g7cAVsvkcai8xmw8SWCanttyJYhABANNjW+mpn8EaF8vFBb5nVolLtYdM6ryMUyFN0QoU/JM214ZS/2HzkYjrVZ+sRYV2DzEzckI1WdtY1fbEPfQw8aURZ8jiTIcctdnDyvlnNiqnPsnFnUPcydwh9dP+0oM/hDTqvIS0W6/hflufa6I0MOShoWmRDVslCxbaEO9dV+8fuqYt/zn9Sub0H9J7sSEWHFnF1cik3iEYgIuPU0B58Oclv3uqTYQjvZmPdqqVoKnyCqKBv4itkMJ/5GD5+B4H9mTfcxyET7GCSt3MGRR9p2DXy6/SmScTUJ7B+QjznXniw8utMrREtgcHDYja2qvXnFzoj679e3n9zr97duDtDOXqfLEjdx9F3qZ9jsnZHFIctpVRXUxypNfJUhe3Dixo0m7HNpr713vN23BC6E9hPi5f3ot7kCB16pTiQF4FH4wl97gqxlA8SQvaDWexXU+u2bZJxyJwXHj/9mQZx5qudih7d/4RRknhtMYFBKSwdvbfDTy0CnO5yEYohyplrISsA4iWklrrnxAfglhacuiOH/Sybd8ypYaH9QhU4zn7hAk4Xls6KwDVBhdxRF6IJcUl9f/QNQSwMEFAAAAAgAAGBQXTlDAxWRBAAAEQwAAAcAAABncmVwLnB5jVbbbtw2EH034H+YKAgqBbuy0/ZpWwUIghbtSxo06VNdCDQ1KxGWSIakbC/a/nuHF13srL1d2JA0HM7lzOEMX764GK25uBbyAuUt6IPrlPzu/EwMWhkHzLSaGYuzwCyv9mDndycGWpg/r5nj3aLIjdCuFrLBe690ftbgHupRN8xhHsQb78kWsH0LH5TE3fkZ0M861iNUEFRKg3uDtsuD8ZKrvkfurerR2dxvL41SbgNZUM82FCsfjRW3WH02IxZFNCr20W7y4X9KO6GkJU9/Z43itm6EyXbJ7SQgww1yNWjRIy0Gh7Pg38XYXhnQzHUb76bFDaAxJBIyolKaUdbhLZ8DDfFs4E6ZGzS2CqbTxyZAq0YXpeljM4VcpWexymZJssVHYv/TRkiXZ3+++Ate2R39w55RBo1/zeAV5F8HX2xgTyoVVby0riHZhGVAiDAYhMsfyCy7RS+Zqj0wIfMpykApQ3BP9CrfmXYcULqPYSVfom4wsoeSrLJPyAzvSMbNQTtsJma9Bq6ko+0WXGfU2HbAQBN6wnopJJwf1GhgzqGpec9sQDzG8Tu7+4z37hfs9c+TzmofUq1VW2U/3bNB92h3VzJbVjNI5wdag7rUB/hNvu8FvzmhdZW16OpcOBz+wS+j0MVVBtutZ3PK0J604DFWsg4bZ1bSe6IRfH/Cwrtb5pihDVJt48GkDSnzYl21kjVNzVK58kwHiEgVOsKsymwsURJDbrDFe7Cj9p0Amw1wZnErpEVphaOzWWTPmY8okHXKj429q7JydrVXPVERnIr1hTzp7ICOvfF1jxqnPITdW3/kJ8vRXq8487xbGf7RR/P2olx3tFPml6ZBTY5HIlunDNaOutLsk/V2SmTeQQRXo+EIue3Vnc/0ehR9c8pjqjmZdgeNFR33Bb/LyV9Uom6gOFqLNvSt4F/IdpXy+49/0OkapTvlNbWmyeu+V+yYXzqWW99MFl9po++QljKXjT3haabo84h+GdEcqCEkV3AniPHkh3fIb7xjnzHvmGxx9uibLPWl5Dg8vGsbW5nXcOawaqoGy1SrOIES75M1vOeo/cws4wxg1otW21e9+Jo106mZOjHpPtV4w3QkISHo8m/XnZeiX7Oz/BQ+fvXv6yEZXoNGnG0z56qHg20ZmlK5uEuqNLpXiRwb5hNiNEnoElCFOpdU/n0d+ERtPhkf/DREOw/62EOOAUphRJVeWbdyT/InQ3s885pogg6Xh9aCN+VZIgzQqA8ksz8ATemZMGvGUVl6lPkSxZOzMRCgt49Debl4IdB79GPsGjsyuFD1G0t04Dc7YoAzxHBaURZTvKylUQqM9Kl1IwuxQ4Ts0R1gjrHkPa3nxcP14zVba5ys3PT7/xVcbkd0BGkc3HVo6JrhKFPfAJKhFWZhpQoPugHqnnHMsyvfq7MrehQroYxCmRUPmOEdQVVBZg3PjhODLkLhb3X/WQVWPF/RtQ14bOarLCdjEyVFoOQEIEHwqnxD16Vow1MtLRHP8iN1gG2sUgGv4c3l5eVROoabOd24a8kGrOsARl37K1ldT4jEC9r52X9QSwMEFAAAAAgAnLZGXKI/UWNsAQAABAMAAAoAAABpbnN0YWxsLnB5hVLLTsMwELxXyj8s4ZJIUXzgBFIO/QAkDtwtN942prEd2U6Bv2cdu6YICZJDso+ZnbH3/o6t3rGDMgzNBZbPMFnzUO2UXqwLINxpEc5jSVhffv20BjVXu/hKPIIWyjTtU7UDejaUg6Ew9Ht3WjWa8LJVGol+dGoJypqhfrYXhBSDMsHC3khnlQSxLCBFECCVq9tb6l5IyUXmbOoErjuYcF6GHMJRzQhEp4n/b/h6iBMKfAvBCF1g1OvJTkZvn4j3TRv9x46D8EgdNfNyFE6y7IFF/Wy0ujcYkHr60+ODESxq8yznmNdjnWjeEc88Th/osGlQmPo3Sycb6TvIznjsIrlRQZ/UFnthnP7Hb22/CBJFoCSGzFHkqGPhU54SzbXSAs7kvAxOJNSrxRkp9s03YQf4oXzg9jy8uhWz5rRJfbylJgnaRHY/DdyyXAvRVLylW1jbtmkpSTHnsco5DHQxnMcV5bzOO5oWttp9AVBLAwQUAAAACAAAYFBdqY4s8woFAAClDQAAEAAAAHB5Y19kZWNyeXB0b3IucHmVV11v4kYUfY+U/zDraiVQLeLxt5HysKry0Iemedh9qJLIMngI3oLHsk0TVPW/95wBg/FCtHEEY8+995z7OcS/fLrZNPXNrChvVPmPqLbtUpfe9VWxrnTdiqx+qbK6UYcN3Rxu1xAss9XhudoOd5o2e1EpvltY8W++yppGPPz12105r7dVq+uRnn1X83Y8vb4SuHK1EGlalEWbpqNGrRadgBefJ7qa61ylageQrrNK3Ip/j0q85FR4sS3cqfBDW3h4imzhT0WIp2AqpGsL6WA3wArdEFIJ5VhipTbl0EuwJBB7gIJ65NinNC5sfR9C2HqAdmkLIxdUATBdcjlYQzwD042hD7kHsJiOwT6Gnkdu+OvBPk4GJD6UXZD4UHbhsA9lF8Y+lF0YB5BLyAPIJeQB5JJxQi4phzPADuCLi/gC+hIMOIIIOnAwgIMesRC1i+cQ2CEwQyYJC6ADYIWAjoAVAtpHckJge4gzBLZEfCHghhQhoEPoRIAKYBOxOKCImDMshAJ0BKgYHkSAiuB9BKiI+zCP4UkEz3zsx/AskAOOmNgwjuknuGLmE+AxwCPuAzzkCnAP/scEhw8x6wLwGOAe9BOTUmwkJqfDiiTMMEuRMMUsaOJTD24lrDjbJwFFQhVQSEnMmDcgTRKqxOxA0jAX0iGPMwxHOiQyTeqAKXF4A6aEfemQKWDDOqQKeWO4fN6RzDN3ZGM7SGnYwiGHNNRmEAwbSTgDkiMDNEZIZzkPkskCGoGMBcEdBuAacOpxJqQbD2k4IpKzIDkciRk4Mx10kvMhJa05GQkBORrSM/No3GIEHA/JFkdoNCWaZ8Z5OJjQ5zbz5DEpDv32TVVpxFHCF+8I7hspM0xnfJo6NPVp6npH6P/OH0W5OjmKLpxSj3+r7fNU4FssdG3Worx0pF1g6jTabLZS4DqcuJ2CEYwugI7fd/8DoL2Ih6DVdu5G6VJluaoBNrOe3hzv6W2Bj5Pjk+Hj9D8Wfxdobo7+DjnP2sxQ2mKuy1aVbf+H4LVol/0fl4m5H1lH11c6yy1brFQ56uz7ALzaejvY4bU+yQBhmgPCqbZ6m6uqFXdmKXR5Buw8RUfzMyTniETWcO8CclUXZTuyHj89C1XXup6Kz40lPiNd9QhW4zMEvGrVbupS3OtSHRVQzHRRIInZmp3xopBswKxtYc31QYI8W3rTVpsW1bfGHylTvllXwzIxvKJc6EF87IiT2tC2oS8Xm3kQKkEfrdm2VU0Kf61nwJGZyD3VfSaYr37840mtqlU2h/9PTwz5xhrbxquzDUyzfQMfEIYdrCuwd1Ig1jPLRL/IB7HvcwN/FzncyPLRGX+ZhdP5ObbU0cFOwaTh8oTVqtmsSPgu7CGzC1Hqdm808P1sY/V9Pjkxft2DPMrnc173slqUaDizYYtd95mHWxL9RCQG6YjxoWDOD4htno6l2gH8gNvzdQDek8BcN5Mqa5eTWdYY+NNmRKIsZs4611I9IHTV66WuQi+91kW7P9oHZejFMt797846rLOiHHXZNS8GPOS7l4TJl/pls4bFg5GMctXM68KcWbeWLtdb/b0AcFdN0Wq96s6LHdgky/M026OMrN/vH759Te+//HGHgVuqVXVrmZKZkXrX8s9vX38w3aXlxBYGDQ+VHYRZCNJ086W61xQonby1DOWTk74ixOTovG14Jj2f9ikt+LLDeqapuL0VVpoywWlq7TO8S/f11f9QSwMEFAAAAAgAAGBQXdnxqDodBQAAnA0AABAAAABweWNfZW5jcnlwdG9yLnB5lVdNb+JIEL1Hyn/o8Woko0XE7W8j5TBa5bCHnc1h5rBKIsvgJngW3JZtJkGj/e/7XoPBeCC7MYK2u6ree11d1ci/fLjZNPXNrChvVPldVNt2qUvv+qpYV7puRVY/V1ndqMOEbg63axiW2erwXG2HM02bPasUvy2i+JmvsqYR93/9dlfO623V6trWs29q3o6m11cCV64WIk2LsmjT1G7UatEZePF5oqu5zlWqdgDpOqvErfhxdOIlp8KLx8KdCj8cCw9P0Vj4UxHiKZgK6Y6FdDAbYIRvCKuEcywx0pt2+CUYEpg9QME9csanNC5ifR9GxHqAdhmLIBdUATBdcjkYQzwD043hD7sHsJjCEB/DzyM39HqIj5MBiQ9nFyQ+nF0I9uHsItiHs4vgAHYJewC7hD2AXXKdsEvaIQbYAbS4WF9ALcGAI4jgA4EBBHrEwqpdPIfADoEZMkkYAB0AKwR0BKwQ0D6SEwLbwzpDYEusLwTckCIEdAifCFABYiJuDigi5gwDoQAdASqGgghQEdRHgIo4j/AYSiIo8zEfQ1kgBxwxsREcUye4YuYT4DHAI84DPOQIcA/6Y4JDQ8x9AXgMcA/+iUkpJhKT0+GOJMwwtyJhirmhiU8/yEq44yyfBBQJXUAhJTFj3oA0SegSswJJw1xIhzzOcDnSIZEpUgdMicMbMCWsS4dMAQvWIVXIG8Pl845knrkjG8tBSsMWDjmkoTaNYNhIwh6QbBmgcYUUy36QTBbQCGQiCO5wAa4Bpx97QrrxkIYtItkLks2RmIYz3UGR7A8pGc3OSAjI1pCe6Ucjiytge0iWOJbGUKJ5pp2HjQl/TjNPHpPiULdvdpVBbCX88I7gvrEywxTjM9RhqM9Q1ztC/3P+KMrVyVF04ZR6+Fttn6YCv2KhazMW5aUj7QJT59Fms5UC1+HE7RyMwb4AOnpb/jtAeyseglbbuRulS5XlqgbYzHp8dbzH1wW+To5vhq/T/1r8X2C4Ofo75DxrM0M5FnNdtqps+38EM51vAb5Wa11vvxfqxe6cHuLp09HvpWiX/T+hibm3reMSVzrLrbFYqdIm6KjPwqutt4MZXuuTNBGj2YWfuqrXuapacWeGQpdnkM7jdxz/yXCORWQN5y7AVnVRtrb18OFJqLrW9VR8bCzxEVmqbUSNzhDwqlW7qUvxWZfq6IC9ThcFcpetWTjPCjkGzHosrLk+WJBeS2/aatOiOKzRe3Yn36yr/e50Gzzi8opyoQfrY8Gc7ApjG2q52ECDpRL0wZptW9Wk0Gs9AY7MRO657jPBfPXXP5rUqlplc+h/fOSSb6zR2Kg6W98M29f3AWE6SI2uwN5ZgVjPLLP6RT5Y+z430LvIISPL7TN6mYXT9upS2hfYOZg0XG7AWjWbFQnfhD1kdiFK3e6DBtrPFtZ+chfwIJ/OKexlsChRXGZiLHaVZh5uCfo/VBukI8a7hJ9vhrF5Om7LDuAn3J7WAXjPgnDdTKqsXU5mWWPgTwtP/CqsCQv2XPn0gFBBL5cqCHXzUhftDrlfF9dXzPk6K0q7y6R5H+DZ3r0bTD7Vz5s1Iu6Nxc5VM68LcxbdWrpcb/W3Agnpdk60Wq+6c2AHNsnyPM32KLb1++f7r1/Sz5/+uEMjLdWqurXM9phWeTPyz69ffgrdpeAkFgEND4sdhBkI0nR9o7q3EzidvKwM7ZOTGiLE5Ch+bHgmPU37lBZ8x+Hepam4vRVWmjLBaWrtM7xL9/XVv1BLAwQUAAAACAAAYFBd7xNuIBwNAACpNwAADAAAAHB5bWFyc2hhbC5webVbe3MbuQ3/PzP5Djxn0pFyimLn1TS10+ah9DT12akfbVOPR7OWKHvr1a5ud5Vb37XfvQD4WHIJyvIlVWbsiARAAARB8Ef6wXdPVlX55CLNn8j8i1je1FdF/uz+vXSxLMpaVHW5mtb3783LYiFmSZ1Ms6SqZCV0v23SJPXNMs0vTe/b/Ob+PUdWcikn8LOusPXk86fR5OB0f1/siYut7S3TcngwopYD0/Lx7f6xavpomk6OTlXLiWk5Pjn8ND4ZHVHrsWkd7e+PPx2Pj6l1aFrHByfUkDoNL59T09gOun/4VlHNTdP7wx8/7Y/+SY2NaXw3Pnh79Nkhv+z0uFw3pm//8OAv1JK1+h+NdVvlqDU6Ohh9oNbapzwafaTmI+uSUxiGmnp2lPGx0unMtHwYv1ctv7ZGfVBcU9NyejC2jau28a8Hh/84oMY/WU1GStiuddrR4b9GB6b5zRZOs+acvPt8MtJyt7EdrXv2FL6pEBse06/e1m661Ve9NCXd3p+o9zTGPHa6J5/ejo84GkX04fD0HXms2z9zumMyZoroh9HbD0zvdGxsAC3+dsrSPE9dVWNEJAjI0HNmadhlcrZ9brps+Dgh4nQ7keRFViBBhZUfZw6RCbI24qgT/1EWELSgX9+/J+CzpLTQ9u0X+eU4r3tpXvcDkj/bTNKrsqKu9k7Klewb1vfFTB5e/FtOa804LSZJeTktVnn9WoBA25pnxTTJKr8Rcs70ukp/kX7zPEsuO5RTGOi1uLipZeW05VUNdJTNzDDJQnaaviQl0zovpYSeTutUZlnYOk8ziSLCobp0ZVVnaS7zwtc+y4s6ubD647+ZnItiiWZNoCuTvWK5SJZ98fiNotL+TOcirVKwM8mnmmYgekQxIMKkLJObvpk3zQLqGnnf7YmnL1463fgpk7SS4u9JtpKjsizK3pZSRZAqYrGqanGVfJHIKmRel6msMOAtv6xXZa4U1QOpzrBjeClr+N8AjO2LeVHCb3ANaJBfyh6I7/e9MP0RnH+VZJkstcrop8kkzdN6MulVMpujJJC7d1Dk0jUb+4aTi9Ucc5xxTK/fJSiWysY91vvpXEkXMgMH4RAd/tlqscR8QLLwiyx7ZIHRFcz9gn4lXYPpDHxktfaETGrwTwXeWkyUltryRocQK9fY5dnphYWiSCsyrBsSSqvGqIEfHRSuPxvXobBwoVMFG1I6fVO1nZivP1/BEoLGXWLqDJ0DLal2psScTc/PfQrbDpS53wVm5SD2D9sdoUqJ7/fEjt+OExsjfeYa3wllbZ8zR3r2aZ4diQ8EOFdMs6JalVIABdZeciCyoriWM7Fagkghm2RaU8cfRX0l1ShP6tUyk0/8qHsg0louKqBKarFIriVKWBSwQIu5SARNUEEZWCQw3s9lWtcyhyWGeQiHQjUnJMOZDqBqQwWibygb4Jq1FEtIzJMMNgag0nvhENs6FFcymSEF7red/llaLZN6egXdv/7XdSw6D5WCWOpMxHyVY9wYTkod6COg7AezTsR8LJMsSDU1pRotYbgoi153xLUjL/s8sR48Igo/F6VMrsPuSOzhJ8zIq3yhcyGtWjXHW/3QY7QmQ/eqOe/Rz8DR4JwGfUO9jEo1JjntuLAXU8kSfd9NQe6HYqxno6Tn1C4DyhlNX/xObDcf9ac7xb4cTg2ZWUVo5dxFEaqR7qSH49OoMs2agGxVsXUiKyYaInrNsHOdw5jhegqHY1gviiJby0pnOjKONsX26MfLq+piCbxlKNM4CIohcQxUY6BK6rTIGYN/43pw1DYHT15LqPPSZZVWay03p9TI+oKSOeC+gXXTiDdvxLOdwPgbkeQz+Akl2eMdxmZnZDplMeGhSNxzFGXdXuOFMFSISoen60M7EmzsgoERof4IxDF+wV0jdEyVXuI+H3qlgd2b27w1w+OdsKvB9sZvn6WXaV1Bx1mndlClR8OMoFiGyXIJW5924e/RLn5EcunOCy5aOr5CFAHmAJOLGqMvHpE966dDydJHTZrWrd2Hsx+2xEPhiBqIR/p/vPvnWZEwgYmuKeUSl+VQ5lRTbiXVNE3XLCECT9huVRWRhaBRP2IJr+C0WECybtauPA3OdHc72LaWSVnjztVrhrDJZhCTw3SRXHIbuzUZeW6xemPTbjUP5i/lFsDX7oftPsgMuspTMo6d9saavqrnr/j57uilsSalWLVR2PKK0ca8oTM235M7ezGXhNKKWQT8ah0fn3yjUWfpNDqqxfmYoL6WNwNBx0YMbYhoGoSLaSoCgJyJSuoiIfEVjShQbFVy4eMtyQ/dgsXfjRAqU2mLyZ9DBxjy96oIscaLNqK1MNJG1IQuraNcM++MaeoMFRzYaSg6NMb0UPBV1H6ErGKdBtKKmqjBrejQGuaK8mvAa51ytzjNWWqqIBj6ANmtK01xKOQskmnlpkv8ePStVvi8LH6R+eYjW+T9K8fXB9MzOpMR9IVYiK39GUqs6y0NfolJ80rxVqyp42NsI11BtxympmY4oFa2ZBYY9Sg0CG2pMGgYMqpuLBF9Y6h0iWHp9HfOS7jbOzbj3s2QQYcl0nst5xfc7CwdfWOocGtqzYQvDA1uJJYGvzA0Lfbu2MnqBeHamig5WTasW9ealpZaI2LY7WG2p/Zktg61hXRXy/aGAT8qdS6LygcLVbOaCwNqulU99cPMzyyChV/gxKlKNzOQj9ZpEqUL3mn4mF2CUPdjhLpvNExazA2IV8GmPJONnCGchrFPqJsC7qarsoINHE61iSF3xWKipVMf0iqLnpRy7iB9Gt6D0Sr50woKNRgOgbwSkbUWxUP1uyieg7+SQU4PjVRZ/zi+bIlWuQfyKYxPN+KdcUtpZ8hPiKhTUKRANqKdG5mCsx4KerPHYcAUX3TmHx1+pBO/30/oHBh5BiI6BzwUGuK8JlhtSjjvTYOU3nq1l9/BEJqx8KSpDpLQQQT6XBkWe5P2/iMY9BZTtRuBAibMvx2MgEb6cKsD4syZc4qZgfKe2OmfbZ+fR5Av7eAXYS+BXo429joTzAyUjGgI4XtZI0q8VjeeFwo/OA3uaUJGQaP+nib9Xg/HU6qbM9RmV2yjDRSvsXDtyAeiiJJmPkmF1/ys6uEZX64ZWc+qQTCqyPyt6e5OIB3BIiPGw8AZRJ33nHXFz+pj8RxnlT1dd3VC6HJ9dFM9tFZpBkRag7RqsSq/9dm8olOxn05KZebmmaSJhX0Y8tqQ56w2TaiJ2gvvkNWctRSO3K4f/vrt9tUSWyUmT3cXCGfPt99sxrixa4CZNnlRrOhmjfJzFypZv9PolA2xvRPoTwviAsJp2jUhBLqBTOiCSqhnDw9L0Xs46yMQaOCp6aDfh5oqxABpJDpaJnmt4QD+qjdLFhczqFpeK+SB3xtBRqiy4jfRHmN8+TxkXb8UFOzt1iAbrIhXm60I0ooUvoNSCEC3Zro9UTg7vzucTe2ddWXhbA0Huz5BVPgKgyFXlazyD+ucp+JRd8U2frGNH6xKUpCFhYnMVws8C0qDNzO2KDT8P6I3E7u7opfCIDsvIonSPC5qDATOTowCrWORpnpNTjO5oD+cSQ/Rja0FBTczwmHK9+4g3GVGzPk3M2uzjGYKxyYUm88baZ6UNzEf3bKk1HO5/+Oa0tpF3RzXr7W7VVTdafHa8sn45Vf5VqP18RxnZlYlgWiyk2Uuuewua0ohgRSXqFPGAQ8fLyUexqM2wLEyaoYp/40C/P5kLhE2doYNc3OvwAhVBWFMZFAuWtm8NIL1Y8I4MawUgukDKTP9UsVtU5eH+OSRSYPXEm97VZXIntOQIPXfXnY/kZci6i4gLnx2BrIRq9FbN+ONWSQbchMcX6PmgY8D8X/F4pynMptV2i49Va+69yEORhzbfRUqHPGPtr+Fx3qP0IqBeKSGH7hDDEQEYVYrS8ajDfs2D9wWN45ucpbidqnt06ozU1mew/769MXLkOjMXvzgEd/43laI5koowqZeM4dsnSOXz4UvRlgu/XaY56I3JSzbxwTOalE+89CDZfXB7ZgI89CDFWGB7hg3rA2Xkce322cdHdqXz2PU+IzAJY5A4u1VvUscg8bd63Xf3BhEHvw5hcvm1ia38DKD+rVDfIL1q3nLF8Xpu4/oXUfTFr1+DPWovjMMbKwxLn1N7vLEbwe8t/mWPnZLYK+mvQjgbwvs1bJLG7k1sHe5/uTHNT4eeWL5+wP/rsuLw/YegasOimVwqG8ied29LWBqybBEdcsCGKh9d6+uF2Ef4N6Sz4fqIg+JKqRST8P7LTspZ9/86usGPAzgixSr9mpBT2eduxF7M6EICPxZDF1ToWaAFrJxl3B9w0F3CPNhJeU1PVd3faaae4bxscc4EDv+0/zGt8Nel5iX5a831F6Lcwxwvds6Tvm2+16dpLdv/b2/IbBv8PVTQbolQfudv1Mbyhz94F8/LMJreAVcWa46XQAPQzcQ+i8gJqWEoQ3wsxjaR5eOzYuhfeQPHf8DUEsDBBQAAAAIAABgUF0OxOxIZQ0AAIU2AAAPAAAAcm90b3JfY29tcGF0LnB57Rtpb9zG9bsA/YfJGgpIi1rvocNWtUaCHG3QJi3iBC2wUAguOaulxSvkrKxVj9/e9+bgzJBDeW0LQVB0E1lLvvvNu2ZIPfvsxbapX6zS4gUt7ki1Y5uymB8epHlV1oxE9U0V1Q1tb+QR27QXdVQkZd5eNrum/c52VVrcHB4cHrB6d3l4QOAjQcU2r3aHB/Q+phUj3/Gb39R1WUs0DicL8kNZUGRweBBnUdOQH0tW1l+l1YYqzISuSRimRcrC0Gtotg7ILd1dSuHjn4u0LJYNqwOy2jHaXAfIO6yRT3NJ0oKBlHNfMuMarknapEXDoiKmHvAKCJCbGPiB+yFnCOTwfUyLuEyoN8oilhbTka+xadbQR4j5bxTjo5UKAw0ZSy0BSavcRWnSBwoIs7NzFyTMo+YWwJMekNIE7i8nAcH/r7tw0McADyChm1LGGX0bZRggNpwKnTmja/KceJZVzw09/S5p8vGkVdmkDBa9aYlN2i52lNzhOu+F3FAGfvHa1WtX7AsIFpbGOYXESYywZGXYbCCyvbso21IebT45eY2/jYjgQPI5rNL9t/CxIlHAXiPs5WQy6cSRgJ4gdApQY5VryrZ1IRDep2UcJumdF3H1IEuG1JQs4aYXkRdkpa3nqelgm5eJF2dNQPblHZETghRjpROQ+LAmWhZylsuwR65zSVhCfm/pfTsFzWfwM4efU/g5A9RXr84CcnZxHpCL84uAnF8A0un5XFOtISFW4DktoCs4RYnkcx5JHdAUQJ7nwe+rKzL3yb8Ifn/9mkznvk+OgdaXhD3SmSSdGaSzlvSXx0jnknRukM5b0pPHSE+RFCyCkPDgQtOfKvpB0jMp9cygOjMU9v4DfBWtxcZRB7EsLORlm9C3017dQdSpC3UG8t3oMxf63Ik6d6GeOlFPXahnPVRII94GPCu59G3EciWQbiCmZ4SjnFhTG2vqxprZWLM9uo2hdR2KOURrvc7KyCwx9wGBVH9ohaBQAwr3pxfTtv6L4gU004sLjNOZAcHKJCGawY4zmHUY7BDtHBnMzzocJEhzeOAcJh0OD4j2EjmczzscJMgMWihu9+SKdPvEPTlekPlkdv7KQt05UHcCdT65sFAfHKgPEnU27+eNDo/74ZjYDQfCg8mS0TrHjL6HtsOtGE+wYnk7fg2qyusHcT2bw7XVXoGY8zjho+sYQqOsPbzjW0YiJrTa6djRZ3GIGjsbrCMOZW9qhtodyGrI1aLnUcm0LwabrhqBVKRjY+RB7jVQwo5IY+dxHt3SMJVzlFSoXK8hvbVWnczG/vIW+wtIuKGeMWN19LTGu6XgCgvwFlfuraWFxGkGqwnKTLsyBY1bqm1X2p0FDdnJE8peRQ2O2bY4G2Vv72lbpIZLzt3pv3aY5Tucp/Niy3eZotCpJVTNxE8sU7F1iawgGbeMWtGKXhmM1VQXcmslXEGCjIxMf7dJMwoVHRIw7Sj6a8tVJnLq2wgpTttT+97bloja6/nr9WNp0yINkaf7kKcyZvYLrtSYWydDcvttvMOK8sI+sRbw0VDpDxwD0SjY9OB2QPbAbZEZ2kZakE/NFSs+nPvQvuIy5LFJ6RGhx4K8eEFmvpORnR+9qmcjG5PST/WWunL7KbKa0bxq/WE56bhv/h6O5fyOBusrNE2O8dpMfAIeBH2vOgcEJzBwD1ZdQyxoyicRb9rq3IX6HZWs5hZvIlWtqqFmz9BJ1Ud5OE1wLvUc3voF2HY1s9am6mV3N2qweCT3vVxXAWJElRxCgKfaWVpd1nBCPOiEGPSJ93ICLl5ATvhPL+TiQX/YlcphLIt7a7m35bHL8qouIbYbaXoSsehSbPcDQou43lUsLW7gVllmAXDCnBRX3D/d/TuEt8Ah4JqiZJ1cdlambjkst0weOUR1He28jBYe6uXbc66hXX+ESQNxxkCLbU7riFHBwZFNIM2siDIbVo+fjXySiKQvQq6QOGYBdGsElIb2V8i5ApKVjC65uEgU8DIq/rX4J/SJ+PMNrUOANCAva/pURnBRLiueRoi0REtRJ/fhn+nuTbyhyTZTMRF+/90P4R9//OvfeW+8uiLTmZVgvVN9eeilsqxzkO9bGq6BqfG0QJ/amnQL/dWKKUduWSVqjxN5zsRRZmjIolUmDpy7xTdxwzrF0tB5eJfiEN9TYRxVFYUJRCQPpzBHwUs57rWsrp2zSTLMLdmbW+8wPksbJpiom48e9Gv09m4Xv2E1jXLuW10hfe7c0OncazsTm22bH1BXb9hmcG+yie5wGbD6mpKXk2u7Dgs2uA9BCudZgL73jNzU5TtyQ8ucsjqNoyzbkaYkeVTA7xwuyXNMYYKQhjQs2oFXCrCTlHdQZbNM84rLLX/ulUf3nlTihOsQyH+Fg1V62lqLR3Npw5tUx3K9OPSeQTCEHNnj8h7vCyZVi2/OWgIixwyED7pfJqCr0bfpa2azBkOhQrfoOUSDzGDrhJ9GMuLXDmiNssrK+LYThMLcbiTqKFS0iHCrEQSZq7/2mDhaq1AEuuvyFhusOU19JEe5H+jsBAb3AJZX7R1Ar2zhx5z/zckfF82hTYe9Nek7Z3xLKBot0jYQnkIHPKSVldAS1N82cjCejnK4I45lXnxiNDeMVrIXVbtxZEQFtHC2q+hCQIDzufmoIIaw20GDa0kfaF02+1B+wN5FrnsvFXpxsKJrLFtKl3ibN9vcUzriybf6btPF27qmvIy5NgTH0jvPW0WOpaT+YnMtQDjfMXuK7zHROrgonHtYflAreC1Ppkb8Kx6uDqr6A6q9UHaNIaxhITzhlS0wfumPWSm6a4eLsaBSuBas8sW3GaqVxf+eERrFG9LI6QwmLfSc7oRi3iIVrdvMIduKsJKwDSVZCaEAdTMtqi3uWmiBHD2J8C4FFdgmYiRaM2CATQw2Hv4fSFlAA0MGeQnUNY3BaLizbUB7GNYaEtWoSsUOD8Lvv/xH+OarP33z9c9/+eYNWHkK99rr9vnv12nMlvL7T9sqo0s58IGx14E1geJa/fPfwnyelzd4OCWB3vtHTUxUx0Qbgx+pfHnCPXHKlWt9vSDakHFVVl7LIuCVQOLjEwNFAq23WyMMboZSj2qAH3ESinOKVsLHgLEd3snshGaG0ssCSpoHW9TaZKLaloHXGsb3c1JFgaX2E+3Ndlnuy1pYIN8F6GxG3jOOSL4i4lcpBGNDkaVnGyTg67rMV9v1GgyJ7Cooki/o461ceJp3L18LORVGvmW3B3ScrTZ1lKWMZXSET6s70JUBRQnydmHcNvdd30La/wZvTe2/PdKxKl7ussHyYVL/lSX98s3/xssgg14ZKEWB5eIeA9Nv2jsxFGfjrHfUCYaRoWsJpbjmz9YtlHEYFvQdBEnnvt+hNNbePVtLLMNQ2/IeZmuRaWAvtznyb3Es59yvuKJVJTk/07J3TlChCvcj39VoZM51UT1sOIyPCOM4x8QYivZwrbozlttZ4GVGUrtDbvHkLWP/sl23gdy38PGTxf0GRy3FqP5wIyB6Tlpy8y9B/Wt/iBr+HTMQ12R4wqgtl8cVwGWPk8oPP6J+rwKJU4FPs7wTjQDtn5Bu1/8/Gv29HY2iDCiv4qneRzRg1MDd4KUeHaBocUPnn0ojVB5kMtjrb4ukFTebYA+iibqedJ7zPIOdbF7B1N4bOsi7lG3M01h+JEXy9B5mfTyvAr6/bik/OoG9BQXgjkR3UZphppBVFN+2IX2TlasoUy+Q4x3ev7OM796M25KKn7V4I/FS+0gO1bgx8+AuRx8FmgVAcCZoORpzJa8RZKnSTrzvity9kYxFYDSSEYNfjQg1IPxS8liDhduajwaygegX5VUJAhfQLFDWYD1ShnUKj3pl3vJWG5bFDR5s8TeHxj+qV+Vo4vdrHl/0sCjNIx8MA1ehEzsdeeILYYsCBM3s7Lx/oiUxcJMMsTQ79bsHytIOPUsgSbwpYRPpeVBuZwGZB+Q8IK9clMZOKs5oVHe3ySIvHA8G3v9IoHWQOCH8oLTq8eBnS7RyOwasnM58l7PxI6LOdoyMRIck/GDt+cA1Ug6HNQJtLsDtZ2cBOZ28gq+vJpOJ71w3/EDuwPQaMVbjYXwg1fXFpEA+W7RQ9GMHPGCx8LrMk+Peyzfmp6rRgaPlZ9fkCKoWD1tylAhnw++jhsjjy8VREuAdWceTFLdzzYgcEW+YPX5kNqocCThvZYgZAoGeAYechZ8V9PVbG6ysSIUVoKXIPwIDBGR2wrU09WiUgHVa4FMBw5GqJrQFTYOGkkU2DuVy3RXyKC08tUr8D4Jwu6D+OGj8ZX2zzWnB/sYhXkKbuE4rPCtajL5CzXtNIbqJUC9+BgTRQmtsAGZqqjIphI2jJAkjKcUbnZwI46G08i04/wMD0DPaZmyBrWpDs2oxEiVPHCjhAZaqo55EvYS25r9HEBZKp5iuFP5XNZqzZgzcsJpJ/vwXSmj0u9dGK2jbL2KMhZUBZzE2SjakmqIxFtxMgQQabJNHLN7ARKE7LMaPogwgZjK6aHbAmiW0Nrd1eJPep1CRlHd0YHaXkkuhTXfx8L8UDxqKKKdhSBYLMgpDDKQwVHtPEVaHB/8FUEsDBBQAAAAIAABgUF2EkcKflRIAAEZAAAAPAAAAc2NyaXB0X2luZGV4LnB5rTv9c9s2sr9nJv8DypzfkY3MyE5eLqdGyWRSt5OZ1OnE7r03I6scmoQs1hTJIyhHquv//e0uABIEIdnJO3nGEsnFYr+wXwCffPdsLepnl1nxjBc3rNo2y7J4/vhRtqrKumFxfVXFteDtjaTMc540WVmI9t4yFss8u2yvVzBiGeftddmB1nGRlqvuskMslusm68aIbTeo4atqkeUd7LrIkjLladzEjx+1d1Oe1NuqiZI4WXaw1bYl5/GjD6c/nvxv9K+Tz2cfPp2yKTt+/Cj65eT8HfwUvPG98Pe/ff/07e3dbH5x8ZcfeAE8P333y8nZr+/en0SfTwCu5mFSriogx6+932fjw3/Gh4v57dHLu78R+NnJx5/OT87Oo48fTk/OYID/+BGDj1eK8Io3yZcU8I7UvZ9Pzt//z4/tJTxnANBex/PLxLi6TILN9s/2+uxFbD7uBNfeSuLFxYb/E4g4au9t4OrvFxeb8Rj+/WPxd3zQo/vXd+fnJ59PDdJr72Lz8h9Eu0YDt45eDG6tx+Mh3Ontx3fnH07Z2S/vPn5kH08QO/v5zgLz324CZvFfe7P4AkUwN+BmwRwF8daQBBJz/LwnjRpleSG+72FT4lAc41/KF2A2i3idN1FWpHwTpVnt12XZTJho6oAdvsHvicLAm3VdgDmHVdwswz/KrCDYEfNCkdRZpZB4Bvao4ZvGv4nzNbewZQuWiawQTVwkXEKM2OW24SJQEPhp6q1xZVBBA0KweVgIvrduFq9wWg3ENwmvGvabXCg/EtRJXZf1Q5DlcZMVRxqdCWLwlYAHaCJgJyuuhCa/XDfE5WlZ8H1s+sTniGRscgvjw7iqeJH6puAUJTx3I2vWVQ7feSZAFbCOR2xRl3/yAn72sC/KmmXgTFim2LGEYfGEoJKljm0UUMQLgODCx4sRq2q+yDZkL7BkPI8EgLQo7EW84vBA8oNDwH9EeFNx9WXJawQgOGCwKBuFExgWnHkHIjwQHjtgvrw9YsZoRQuMn81pNM0GdLxelek65288iWXme0C/N5LTKRRziQPlQvJAwQhwIjz10R1KkouAAAp8SJLuMSEC9tS6fRPX8klP+IpQrV7fQ5iOnp6ilQaIqY5E0g5SoSeiG8KYo28e9HjUBYDwPYz7dPkHhK/A0rwmDvhF4iwtExrP2yde4iIwFyDc3W9eCq+6DFyqkI/2CRFAdshQLVs1orNgUa7rpONOXnbezjBchQEsR9SJR5T6eVbwogxwsRVcGoa8Je8g1bxYr3gdN1zhDkWVZw0+FT4MPApQjngZIn+Vj1aoiYMbV3W8Ej5anuGCuaYJ74NZ4FeYl1947ffZRbPFh7OMTVgGpvl8Lpc9UgbJxxX3c14QCGBmx4HpqtMyidCz+/BDYCQgCkYwtFo3EWY5D40KGoE5djY5npvXQJwXQt5lRgu4j1Q8hIDLsszdFPAN6FD4Q3ZMRCbjX2pwdQ+Yd6StyfbxpDOVQxmGHF1DOByxSJkn6S5rTdIwazn+r2lf/woTsoD+cz87EhZEsIqvOTwUvhYHXOCq9fEC7I+kE5XX0/N6rZ0oJpiRmofcbRo2q0q6XLg7YjJ3qzLI3bTXzgC6rMiW1GDwEV8uwf3Hgi0M5rT3Sderyr/1FPfehJaaryUKgzXz8Ii+7yCOdXzVvMpj8GrGdMRRp8aax+lDrSfNEr2kOk7uETGQWDv4U9an2czLOPUX5rJagBPjdQW+rPExxaDkeUIG7F5K3kE6ORATFfS6mXrZ+6i730v8w6jKKo7+pTdxsBO+JamOmvjK95JlDIsSnVT7RPp4NHiNxuSPgl2FujEm3OMpVLkUgriO//ulOSjkhZnOBeGSb9LsioOdBLPJ0UvDU0biOquiJI+FQBtteF1odYPjK2QahnTIqZ+gBxTsjzVE0CqGf97M+0ERJFizRM8NmSuLF4CJrpO8hFB6xby5x/yY5WBc+hKWtvc7fANC8Ozg6/Ogy/XYa4YeVtEE1lKkTF3MsjnFzt89M2azp1CefNX4+a7xX5aorPtQfOdEcYyzWxNdXKjwftRTIMaVI1sVXCRxxb9JFzG7jJNrkWNQQFpR2ogFBQ3qz5ofGE4hIHkVWJFDfC3gl3+xeXE0YhdHY/wPtRddnd6GYXinFJKAQ2t5gnh3NG8FnYSZIOR+P0tLYUjW3ZAixduvie9jolBe7xQyPJ470espOpVRTp+QtE89EwlkB3HdCPROvncL6Uc2pFODwhJKfe+OgFA3KDiTOD1VLyVTrAL8rbcBn3sM/m0N3y/g+zf4fnWHPt9PRmzczzFWEOA5BjZzCsMhqDUR1euivzbtBOuJBmVifalzXn7D6y140yZZshWaCOSJDXikHzDBh0haQIEAiVYSF+ySQ6FQ3vCiVar3l4cRVk86cNI6nUbSjOwaLo2rDH6P9y0oA2/PwObuVakNrl1SqOU9OPfhdeE2DDrOIfn0A9Q/llF0SyRZNjBCzadr7aIVDaFRZDrvht9uCEOKPW5AhVmB5bO+o8wedEX9p8mQG3zmff/21nNQLmeC/7PJ4ZEtHS3pmWtkx3MvdAxZNtalk4TdC9A9ac9XAGrpQcbSvZJLsFVqUOA7WVk4XcVb6QV6Pp98gqwHjuddHevF2ceVWG8OPZd54AdcdUF1zSKPYW2KNSxKSH+oWQV5AgRutiy/ULysIUqzckG/1cSUkQk3ZmtBmp+UV5SJHg0f7QlwNGoHG87ItgNWKmy4wvSH1GJhc5pah2yXyaFasAr7ipmclqA/UnBfR3pwP8LDnQhdctrvJ9w+YugfAE4jSXT0cSLWduR5qh+5Vv0anAlrXvT0WHBz9ezNFGpiGaxIH+yMOpcfMP3zy1535AnjkCEzI0FlfllhhgrxqRqxumxgomu+HXWpMgQ5yG8pUym/FOx121V98+x1myi/oaKjzYYQBCthacdQejwbMVGypry6yjHnPDzsMvFrziERuixBLzSOC0iOmhietNgFuyqpfRLfcF2OUp4WZUXWRJEveL5A6lWXd8RaIqeY4xvcyCoFNPZTDH7K9BKII0QU6Ijhy3rSYsQUo/2N+Zyz2xxYw6OO4WlHjQ1kKma6o84yMLcCUnT1OhZ9qkdmVTOYLLDJ1eWijbQ3I6RVCOcNeJWzqvJ77/jWUoZIcFmgrUzZ7Z31DAqZpt+c6IZRtUq5W2sldAuf2l0O/Azb8V35bHOzo15uCWjiBtU7KJw1gOrh+5/OqHM/Yv/C/p76ffLpJ/XrfFvJm3YQ0xOYAgFPQLcptfUMnQKd302HdrULZW/oZDgOeMcdO+xl3N6h5tL2Z8E3YP4pXI7hqgLlYN5LT23NEQpUHU47Uxjn9lJLDRCcxwZQE3ZAmgIbUNPSQbbUzU0TIceyy0L2taBsC9nRjupJuq+Ae+U+AJdK6MRpQ0jNaEnaTztlmaK0oQwl9gRpwBmqNbttAw+ATVHsvRkV6IM7bfjpddtIiF0XTanH0UkbKMb2EzVfQaEVUaTpXKOwXMcuqF228sQMWpA7Qk1X5ikW/vdFWQZVosjKAkOK7Nzk8bZcG2EIA6Xyev5eZ97z9b0ggiWUFY6CwHT+tC9E21bUfcbSFiNaP5bYbsnl6O3oY2xw6Q94rt5WfEglMoUImQATIUgyEEPM4009CzYjatkCdrliOnsQ1qum5ly1fLOroqx5xNGzCnt1AjFWt30vO2bgGnjp3tz70cj4eQ9trZWjLX4FXT1LBs1ihJCZkquBPLBkrHuAPupNsZu4yMSSpxOW1mUF2SDlcwCBDgRy1gVUS0uo0+GqjpNG5ovS28dXcVYYvdoyUb5beShwLpXfUTSSbdmeatSYTJA5WJRqu8UWO5oKdeF7XstlIeqZpkODzhCLo4RTz8HxiySuU19S5CqN1X6vhN9RiqQ83z8t5fsABOzM8Ftdg++AdVunlAy3ASDEfW3wXDi3fD47plqoE+rcIqQlgBDgFBbPbZ4VxmnqsDl5SgLG9c1MG4I0Mxwj7B6ZNK5+oxrIFFAKl6KzOKjNYRXlUHvccCgcsDWmbIunpi/nxTAT/Pear3nqyBCprOhXayhZcmCyy7YUlqRQ+p1vgyvaTjGCjJXta6pIbigfO9+S2DCQ+VZgktORfqemenHdDjG1yia3qPQ+Jr2D1iAFWTXZCoKWMJ8fGc9F9qe9jPAzLF1ptm6Xc2ptt+DNCCl18eOk0rZOlwPvGyceXepzNTK4cOwb3s+RIWB0QLS6LM/Tguli5P9HC26GdGLUSxg84IP47xGiSXb1+Iw5VPBU64Fiatm0e9K9Sq9Ht4MgiYOseq+waY3proZlEIZXEyoWSR6xZ4SL5mu8lD4fgPOZLgjymlXWdBlav+YB+skzjAdU9XyrPjJjilx5WVs4vZXRGvg+zSut7NG+CiLfpCj8PGGLGESWouNUXnMCtK346pLXKnjDf4inZZFvUZR1BtBlkXC8LxuhO/qcQ8uUTLuh3WsPP8PCW3/04YN2+3s3/7Nuj90RtB9Ub++WoUy4UszIm3pdJFB6pExkKCQlVMjXJ7iRekNiQ0MapkRfK5d+fqTqsx0OQhfC7g6pNrCZkQeg96YJhuBmDkUi3SGYXuISwkJWHTAfB41kzA3IUTiTpIfZj1ynfb729YXy7IargN8FGbmyHQkTnasSvl359L3zbEk3e54aV2a7gHHOQWJ1T3ZrCcO9CP5jC6CrGrqTILtx2cHkW1ePJt+RiO/O2ndZ3I48nZIiHONOwfWo3RWDhf/+xF5hvj+5x8+9Cb6KXmTmvTotgSidpeBqRJdEd/vN5kZtCwiyQQatiCZ3C1xb17bOTDW057Vwa+Fb1IHe0kq7nRQjjBpNhYvxEJSG/MidROP+f+nZdwbMDniHbpTYO7iBRsxHRoOQx3WyvEcjNb/im/4LBe3WGNz78PPpp88n79+dnQQ7tCgdnGEB/eMOJH8sUQDUeGsjVP4XT4D5uOaGGdf+uvFeF3ZletVhUjuszinV9B0qxf0SBW2K2mlpyOmsnXbe7pT1sl7qGXHhKOrMjgKMEW2Bt4NttyvuTmM/yBnrs4Dz/5ArVc092bv5hiJniW0YkA3StSWxyF/doU1ZoYHhhsrGCQD1PB96CZW8ozgdxCpd6DPXe7sGo+6UOU0Y9IlDuodaDjEv96/5dprHq8s0lvcn8gtq32CwmtVA82gX0AEW10Rqbfl1cSVPsroO+D1hMasyDhkfHgTAvE5UPMfMmprY8uUnJk+bYBlYrjjWhGhsIkthHTC5JQu8rQvsA+NBA4majjigXUHwQTzWWWZ9kLW85sXg3Dx5ajwULZFMFLKnLTJs9j4fsVeBmZ/AUIrLsKhCdUAmwTOgFxe/HYxfbfBsJqw1uGce+1moe3i2Y3M0Hg9jB+CEPG0GaDYH42MDDaE+GD8vH4bZjVsve0C1Phi/MND3W4TGG2Qhbc0kqpy/B+np7YG4Q6RDBOYMpAelrWRZZng2FDH1idDiL/HIErAVHttORqHxZgfi4mI+x4npnjVTSyFddYcxBxM8Hx4JozevPNx3YeoIgUTZP1/g2c/a1wnUAvHrEkxW0HlHfLFuPMbcHjvA8sZ4cAgSg14MRY95AEF5FearxEK+CJPjWcin0u8EailxDQrpaq0OzelmoKKc8g7JfvhZSgEp6o6V44JuM8/hC3A2IJrtDodg6Nl6ATCQrirq3j+QgmrfvYHKe11TyNBn7pA//cpjeM7xtb643v6YQXBrynrr074XnV4wrIn2gKa9wxzSfbreVlNvqRnWiAHKqpHal34k2a/spSFbnZ568e0gReMs+iC9Zod3MH4pF6QFhXPr4m6mX2n56pdNUAUiXmGIsFQwYs/pvRMrQnVvPchdEFeMHnXE2YkMjRl0+sDqxzt6enKE6jdZSZc+MNad3Rw2lr8+W8QP31Qcm+Ao22EM9h3W0cZbCq/uwp+SxDYlKEhKOlFyj7ATCWdS7s4s+qDDXplqv2WGA+mO5dKpBgmgReHKnNpl6O6NyP1Qb/bdnB3gaxXS9aTZYsFrgW8brgyP5OtTvXT26qAO9IskUlvOGkuvRT1RBhOlneuBrCS55rTEjIN/wnrXSzPReedVDGrV/NKL3HhGR7/UHb5TZ8l/pSd+yuVihjJh6r3HKV2+mTboRLPfBXuBOSe2dyJ9cN33Dg+lD4Rl3mwrPqXzIqosmVLkWPK8mnq9fMmQhq9gJxhmgnumQpfvnMieBgEN1B1iwCborCvhpy+cwdj8N5x4Gw8RIpR8jghFaAQfsFo9xjBG08pStsoE5aNYP2vW0QD0wBFtmE7FFreHIFmsza2rLebV4GeOhnblUKkui1qV6nfScNOdTgdEEZ2WjCK0qCjShyalfT1+9H9QSwMEFAAAAAgAAGBQXWaf0ssfAwAAUwcAABIAAABzY3JpcHRfcmVkaXJlY3QucHltVWFP2zAQ/Y7EfzBG2hIKYS0UpopO2iakoWkMafBlbLPcxqGGxM4ch6poP353jpO4pa2U2r73Xs7vzu7+3nFdmeOZVMdCPZNyZRdanezuyKLUxhJuHkpuKtEtSN0NX3I56ybVqurGRltt2FwXJbc9wPIHweBpAYhf9vnL3fVX9uPq5yWZkiG5uCDDsyaUioywRuVJrKKYHH0Avpns7hD48CrNWKqARB9Hi/GZftDp4qQSNAxbDE/TF8n/JmuBDAP/dDUdP5/v/aJHo5NTHzfC1kZ18gfklAxI1MoNukA7ymLAjGFK9yg+92kXshA574EwGyHiwOHeuOdbGu5VPAtwmUnFypzPRTSrswmZrazgxvCVM6CbeRtyWUjcZSFVNBy9PyS5UMiL4yYOw/uJA/0GFLKraEb+kOH4lGTakBmRKgT1tMSnE8VrxkCkT7lWqnyCchrBi0iqTObikMwXtYJF+SImII7JBUXeuomltIuwNRI3jqiTpzEYCEKZ9miXDLYFKIdNliixdPMo7Jq4J4FGzq1AHnZtkgokGlFVevYYBUAImFWJmYdJWVmINHLSiUcU2sCGqVuj6wJeeatGm0iQAahgTqGIrq0vmfMqTBDNhdi7fmW5AO/JralF4BJ+XDUA21QHisrTqK9QvA6WGVHaNpwNHdcVwH5aX3aZDKau7RxtQxE3AeF+o5G3zqM39juYdlVKsryuFuGufXYdQOhsI0nDZSWa4gpjoBOoVPjiXFhBoGGsqdUcuClpeja0+3WZXh1ILHWzROMI0l3vLX1P3fkCOMXDhtZsBwDVIdC0XsYfMFjYOGBRyi1vLoJq6/nxzPXTqJNPSLj67uhodCtacLgsYs91FzseifaSTz6ah7oQyt64CNSrmhtZWqnVtDmRxGqdt9Y1/ISnKeOeGNGr65u7W3b98dslPSQLkZdTKEQJ9cUebJkAx+PhBdwPSlRtyR2DIaPJrkp62eDe0CW42GOxRrPuzoCFoEXQCNDacmv5V8L/F9w9KZQggXsug7SWRlrRONgYCE3ImOKFYIxM4U+EMbSTMerf05i7u/MfUEsDBBQAAAAIAABgUF3AmGv5KwMAAIQHAAAUAAAAc2NyaXB0X3VucmVkaXJlY3QucHl9VW1P2zAQ/o7EfzBG2hIoAQqFqaJIbEIamtYhbXwZY5bbOK0hsTPHaVe0H78756VOQaRSmviee+7use+yu3NYFuZwItWhUAuSr+xcq5PtLZnl2ljCzSznphDtgtTt43MqJ+1LsSraZ6OtNmyqs5zbNcDymWBwtwDEH/v0+W78hX2/+XlNRuSYXFyQ47PKFIuEsIrlSayCkBxcgr8Zbm8RuHgRJyxW4EQf+/PBmZ7peH5SCOqbLZpH8bPkf6KOIUHDP12MBovznV/0oH9yWtuNsKVRLf0eOSX7JGjo9ltD85SEgBnAK92heN+lrcmC5XwNhLc+IvYc7p27v6frWkul8ifQxgieBTG3fEgmKyuKHtGlTWQqemQ6LxVA5LMYEqmwOk8/J9BYK1ErtJR27gseueeAlsqIWBoxtbRHUqFcrDCENIEz0bW30wLFhyD+VkZKLN174O9NuHaCUlJuBfrh2YjQzYii0JPHwIMJNTWrHEvwU7QyE3HgiKMakWkDlVO3Rj2ChvdVhiaJNjowYDY+wUKKJThnAiKs8KUSwk8xBjsqhFa/RBAZLEfrlaWR1gq1sTiHTXMsl+TIkxUvSNZg8Rn/Gxz1HOjA296wi3YGQON54Mbwlcvo3pEMwffhNXxkxEJA1wYbRplUBUCn9T9spIVXKjPpUpMqAATkhfDqqDjiMHzp5Az3Q+f7UGdaBBPymxwPTkkCx2gCp6sL26BxSe2PvDhde7UdruauYZLqKapTH5ig2fPXs222qo7knDcgdb9FCBUvEJvh2rOWpGUx7/TC20TYbffUKcUASVG3NrtOcp0R4c8G1/Puqd5I4AEWqaOPuHjzrdn8F8PFTZWwM/NgIZoJu+Bp6Q5NEzXjcBLCOoD7EGBzNx+F6MrMykwoe+ssIEcxNTK3UqsRdWGJ1TptOq/yj3gcM147BvRmfHv3g42vvl7DSJqLNB9RqXIoBdVrPAGOzV4TuD+kKJoSnQdDjyq7IlrTehNR5yDsGoujBcZCPf1gwesI1AnVdOvQTjx+Q0749sGEjVHESZkkwtQKQrsxpngmGCMj+OowhnoyRutAlbrbW/8BUEsDBBQAAAAIAABgUF1oBiN07AcAALoYAAAOAAAAc3RhZ2Vfc3RhdHMucHmdWOur2zYU/17o/6C5DOwt8b3dGIyU7NlbGCtbaQf7EIJRbOXGqyMZSb5ZNvq/7xy9LDnObrcUevU4+p2j85affXIzKHmza/kN4w+kP+uD4F8+fdIeeyE1qQXX7E/dtbtxST2E8R9K8DARKgzVeRzr9sjGiaQ1O9KuE/XTJ0+fvPrp7vXLd2RN8mzfdixbkExpem8GNVAps8JAisYMd2fNVNXycSwGjZOe0feVWckKBK7ufvn+h9d3LwH6Fe0UCFC9+un1HUyzDMZv73789a1h/PcHmL777fsff4bJZguTN29/RdJ3bo7/GrYnjNNdx5q8IMtvyE6IbvX0CYGfZHqQnHiG0wO5uXF1ZEchzytz0MtkkH4RnDmk+07saBch4WJ0kd/kwOxiuycxLKG8IVwk2i1bVeG05fd54RjgLyYBVUudF6PIiukK7ZB3dMe6FVFaXhMSVeQkdIo1Z0asijZNzumRGZgFMeZckZbrBXEWXZF9JyjMvVnddrCsm6Nx3dAwWaM8U8HeszP6kZUGFGQoSasMDWGgb7u0IChU4Y1XC9nAOe8R5T3TOUAVQdGOxAFFmrw4u4FzW5g3ba3LvRRHmKvcuviC3BbToxvr89tFmFvfRww4Gku4cdGwJZ+vrSbTXR8iZt9NUooQOYbEz+ZoMKIiIpimVFGooaRH+mc+t2XN5pzruzGPlG54pBwuK53j4cVjb0k8Arjceh9+Zq7PpCKgPLAvj5LCTXQDIjjRB0bOLesa1hijvCAUwmQpejLwjinlY9rZmu8FJoQRbxXESNLNitx+CO6BYedjNHIOw9ZAxlbHTGHnLjSB37WYTSIdViLwepCS+cCYQID/GgzWuOSQR34HaDbXRWAmhM3iZvl8a20YDHu5Ecw6l1AkwwyCBDHXvQS7Ws1SxUB9QX6LGRY+jGcs45L2PeNNbhAcoklaeGkoK2XP5L6qxQAeJT1LDXn2uiH2LQdZYwoXLvOQZGkZjuRO57eJVi9tFF2iF32sjqCSia6TtcVjRt08304wrxn3Pxs4EWTCxN0+lX/p58a+28iKvgYsyPOQ9RfGGnFGSldM/kmyB2YItA04wsBrm8BtcQpJ4SRpryC8DYSp0GaAuQJDnORSaAF55S/IQAsi+lo0DALySPsC0gTVRA5cgUb42XBSwF7arPRYpLv6j5KhrLiE8qJAgJF/RuW9igvwo/5rQdXQIRXCOoz/7bFe0VijGc8RbHO7LfBOODbdw4EqqrX0mxCaVQXEVZUVtnbePmrVMVciF3sDw8Rj26UZ6GlxNAq11F6lbtFpdXSLRtKW256sa5UOPRnWI1SQgqYT/CaU9wfaDUzlxQIr7Lqjx11DHfmK5I/U5cJJGdDqjtFgtyC34T2KeGQSaptbnnYteyFDhxHOria6TkNwItRiftf1C1d2Q79wZT+KzX8jsKE6T5H0AimJbeImyh5J4qgXGjrlRHmRmXfnyijBtfEfo08DSNbhaAkFCxhRcLV8qtirjVwxwfN3wNfFZ9nF5tjVTThEJRLE3rtKBW+hj3/6FJNkb1kaKNPDOY524UKymVZuZmcxa9PU6zdeoRtMDFtzIRzhfVwMeooielSdZKtZJRm+DfOe6oNr/5zhZhv9Mbh98IcuXaX9fghFPAZEyKDsxAnTZAl9hTq1+pBnJbxoE0XiMtQIyGJ4AvR9AqUzDjUDavw6G/T+a1jg7NS1nK0zyGMU2tGJJczVJEgJ6OVL8KTfzUK+XxDrScUcfWn+HBht0oIwpZDiNIbFI2STIHLkqKH/eOfZe+IngLIZjn3+t/VrBQ2d4wUwljksTaT4AH0G1v0G+r71cxfydUehK6/eSIEB9ZJqmovdH6zWY6HvmIbiDIy0Kt+Z/zFDQhGn75lp+CU9EbNtwpcIKHJQuQ9gil6KGrr+sUZXEE6trqpcsQ6EMaeSUg3LpcVa2924wteSUXBes24Qpo6Kv56qqBT09mK+j0l6g2e2BYkKPrxSwAtIC+zFifvD8oWLOUVCRe3dhUFhJvJMyancgdxb3H+/cer1d/G46Kpuq3zjj/qQc+2Ipy1BVkxSyUVSuDLRz7RGOrk9bVBuVDKD/NYuE+WGzzT+jWCpRgxwiwrEGo7gYAqcWip28THDrpYxaZ4tlwYK3P/Aun6dmUDCfnBpiw32XKZnsi1my28gEYN7Q/dZYjAQMACmFGLTWlZc5zX6iee6tP09MKe1bgVfQ0wJyaD7H1iQCOJI+CpnGnL3GSj0rCSPXg8viIKcB4/dBwY0NgW7IvWxojlLZFGR5mjydfZtvAa1Sul1tozXrMTgLs6bvYuRfEd1fSAnId/ja77ldTfAQ714AV6Bb36MZQ1PdfQw1AQkE1Csog/MuzuoHInu2wfGTW73fCMvAMbOR21IpfaPY87uHwQXg8SXuTOIsXTQQCglSG29Ngr2mS9+65HQrRQXUYcCpcBuM4K+ErsfGb9JXDopZ1/LoyauvZbb/cgQii0+iiYpLxK3T5LmhSRNq2JR/M9n3DjL5/4QpmlILMe1OqNewaXk9G0NbmIyIbQeIUvMvIlVqB5JwcGjxQSyYd0ItVltJ5dNrUbW0AYus6scsR1yWTGrh+PQUQ0enBWl8Xu388VXExEm5TqFxPLrDsaSFJf0hkeebdqtN8OKfKoy8mlyhQV+XGPzKr7m/PhL2rmRavoNYZTBgjgJBPDHDo3uFP6NAeYE+gdQSwECFAMUAAAACAA0iUhcn/t1AhCPAACjagMAGwAAAAAAAAAAAAAAgAEAAAAANzg1XzE3NTI0NDY2ODc2NTE5ODgyMzkzLnB5UEsBAhQDFAAAAAgAAGBQXQnurO/fEQAA5UAAAAgAAAAAAAAAAAAAAIABSY8AAGJhdGNoLnB5UEsBAhQDFAAAAAgAAGBQXUAIYu9YCwAAHSIAAAgAAAAAAAAAAAAAAIABTqEAAGJlbmNoLnB5UEsBAhQDFAAAAAgAAGBQXcB4Pj36AgAALAcAABQAAAAAAAAAAAAAAIABzKwAAGJ1bGtfZGVjcnlwdF90ZXN0LnB5UEsBAhQDFAAAAAgAAGBQXbF2TIGKBwAAKBYAABEAAAAAAAAAAAAAAIAB+K8AAGNvbXBpbGVfc2VydmVyLnB5UEsBAhQDFAAAAAgAAGBQXRBOJ7/kEwAA9kwAAAoAAAAAAAAAAAAAAIABsbcAAGRlY3J5cHQucHlQSwECFAMUAAAACAAAYFBdoOx3gX8LAAC/JQAAEAAAAAAAAAAAAAAAgAG9ywAAZGVjcnlwdF9jYWNoZS5weVBLAQIUAxQAAAAIAABgUF0qT9qbNAYAAOQTAAAKAAAAAAAAAAAAAACAAWrXAABlbmNyeXB0LnB5UEsBAhQDFAAAAAgAAGBQXTlDAxWRBAAAEQwAAAcAAAAAAAAAAAAAAIABxt0AAGdyZXAucHlQSwECFAMUAAAACACctkZcoj9RY2wBAAAEAwAACgAAAAAAAAAAAAAAgAF84gAAaW5zdGFsbC5weVBLAQIUAxQAAAAIAABgUF2pjizzCgUAAKUNAAAQAAAAAAAAAAAAAACAARDkAABweWNfZGVjcnlwdG9yLnB5UEsBAhQDFAAAAAgAAGBQXdnxqDodBQAAnA0AABAAAAAAAAAAAAAAAIABSOkAAHB5Y19lbmNyeXB0b3IucHlQSwECFAMUAAAACAAAYFBd7xNuIBwNAACpNwAADAAAAAAAAAAAAAAAgAGT7gAAcHltYXJzaGFsLnB5UEsBAhQDFAAAAAgAAGBQXQ7E7EhlDQAAhTYAAA8AAAAAAAAAAAAAAIAB2fsAAHJvdG9yX2NvbXBhdC5weVBLAQIUAxQAAAAIAABgUF2EkcKflRIAAEZAAAAPAAAAAAAAAAAAAACAAWsJAQBzY3JpcHRfaW5kZXgucHlQSwECFAMUAAAACAAAYFBdZp/Syx8DAABTBwAAEgAAAAAAAAAAAAAAgAEtHAEAc2NyaXB0X3JlZGlyZWN0LnB5UEsBAhQDFAAAAAgAAGBQXcCYa/krAwAAhAcAABQAAAAAAAAAAAAAAIABfB8BAHNjcmlwdF91bnJlZGlyZWN0LnB5UEsBAhQDFAAAAAgAAGBQXWgGI3TsBwAAuhgAAA4AAAAAAAAAAAAAAIAB2SIBAHN0YWdlX3N0YXRzLnB5UEsFBgAAAAASABIAPwQAAPEqAQAAAA==
 """
 if __name__ == "__main__":
     main()
+elif __name__ == "__mp_main__":
+    # spawned batch workers re-import this file and need the bundle importer
+    _install_bundle_importer()